@@ -0,0 +1,116 @@
+from collections import deque
+from typing import Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class PyListAdapter(Generic[T]):
+    # ListProtocol over a builtin list, used as a baseline in benchmarks
+    __values: list[T]
+
+    def __init__(self):
+        self.__values = []
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__values)
+
+    def append(self, value: T) -> None:
+        self.__values.append(value)
+
+    def prepend(self, value: T) -> None:
+        self.__values.insert(0, value)
+
+    def extend(self, values: Iterable[T]) -> None:
+        self.__values.extend(values)
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > len(self.__values):
+            raise IndexError("Index out of bounds")
+        self.__values.insert(index, value)
+
+    def remove(self, value: T) -> bool:
+        try:
+            self.__values.remove(value)
+        except ValueError:
+            return False
+        return True
+
+    def pop_front(self) -> T:
+        if not self.__values:
+            raise IndexError("Pop from empty list")
+        return self.__values.pop(0)
+
+    def pop_back(self) -> T:
+        if not self.__values:
+            raise IndexError("Pop from empty list")
+        return self.__values.pop()
+
+    def index_of(self, value: T) -> int | None:
+        try:
+            return self.__values.index(value)
+        except ValueError:
+            return None
+
+    def get(self, index: int) -> T:
+        if index < 0:
+            raise IndexError("Index out of bounds")
+        return self.__values[index]
+
+
+class DequeAdapter(Generic[T]):
+    # ListProtocol over collections.deque, used as a baseline in benchmarks
+    __values: deque[T]
+
+    def __init__(self):
+        self.__values = deque()
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__values)
+
+    def append(self, value: T) -> None:
+        self.__values.append(value)
+
+    def prepend(self, value: T) -> None:
+        self.__values.appendleft(value)
+
+    def extend(self, values: Iterable[T]) -> None:
+        self.__values.extend(values)
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > len(self.__values):
+            raise IndexError("Index out of bounds")
+        self.__values.insert(index, value)
+
+    def remove(self, value: T) -> bool:
+        try:
+            self.__values.remove(value)
+        except ValueError:
+            return False
+        return True
+
+    def pop_front(self) -> T:
+        if not self.__values:
+            raise IndexError("Pop from empty list")
+        return self.__values.popleft()
+
+    def pop_back(self) -> T:
+        if not self.__values:
+            raise IndexError("Pop from empty list")
+        return self.__values.pop()
+
+    def index_of(self, value: T) -> int | None:
+        try:
+            return self.__values.index(value)
+        except ValueError:
+            return None
+
+    def get(self, index: int) -> T:
+        if index < 0:
+            raise IndexError("Index out of bounds")
+        return self.__values[index]
@@ -0,0 +1,135 @@
+import argparse
+import json
+import random
+import sys
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable
+
+from data_structures.lfu_cache import LFUCache
+from data_structures.lru_cache import LRUCache
+
+Lookup = Callable[[int], int]
+
+
+def _compute(key: int) -> int:
+    return key * 2
+
+
+def _linked_lookup(cache: LRUCache[int, int] | LFUCache[int, int]) -> Lookup:
+    def lookup(key: int) -> int:
+        value = cache.get(key)
+        if value is None:
+            value = _compute(key)
+            cache.put(key, value)
+        return value
+
+    return lookup
+
+
+def lru_cache_lookup(capacity: int) -> Lookup:
+    return _linked_lookup(LRUCache(capacity))
+
+
+def lfu_cache_lookup(capacity: int) -> Lookup:
+    return _linked_lookup(LFUCache(capacity))
+
+
+def ordered_dict_lookup(capacity: int) -> Lookup:
+    # the usual OrderedDict recipe for an LRU cache
+    cache: OrderedDict[int, int] = OrderedDict()
+
+    def lookup(key: int) -> int:
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = _compute(key)
+            if len(cache) > capacity:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return value
+
+    return lookup
+
+
+def functools_lookup(capacity: int) -> Lookup:
+    return lru_cache(maxsize=capacity)(_compute)
+
+
+CACHES: dict[str, Callable[[int], Lookup]] = {
+    "lru_cache": lru_cache_lookup,
+    "lfu_cache": lfu_cache_lookup,
+    "ordered_dict": ordered_dict_lookup,
+    "functools": functools_lookup,
+}
+
+
+def key_stream(count: int, key_space: int, skew: float, seed: int = 0) -> list[int]:
+    # Zipf-like keys: key k is drawn with weight 1 / (k + 1) ** skew
+    rng = random.Random(seed)
+    weights = [1.0 / (k + 1) ** skew for k in range(key_space)]
+    return rng.choices(range(key_space), weights, k=count)
+
+
+def measure(factory: Callable[[int], Lookup], capacity: int, keys: list[int]) -> float:
+    """
+    Returns the mean ns per lookup over the key stream, starting from an
+    empty cache.
+    """
+    lookup = factory(capacity)
+    start = time.perf_counter_ns()
+    for key in keys:
+        lookup(key)
+    return (time.perf_counter_ns() - start) / len(keys)
+
+
+def run(
+        capacities: list[int],
+        lookups: int,
+        key_space: int,
+        skew: float = 1.0,
+        report: Callable[[str], None] = lambda line: None,
+) -> dict[str, Any]:
+    keys = key_stream(lookups, key_space, skew)
+    rows = []
+    for capacity in capacities:
+        for name, factory in CACHES.items():
+            ns = measure(factory, capacity, keys)
+            rows.append({"cache": name, "capacity": capacity, "ns_per_lookup": ns})
+            report(f"{name:<14} capacity={capacity:<8} {ns:10.1f} ns/lookup")
+
+    return {
+        "meta": {
+            "python": sys.version,
+            "lookups": lookups,
+            "key_space": key_space,
+            "skew": skew,
+        },
+        "timings": rows,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.caches",
+        description="Lookup cost of the linked caches against the stdlib.",
+    )
+    parser.add_argument("--capacities", type=int, nargs="+", default=[100, 10_000])
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    parser.add_argument("--key-space", type=int, default=100_000)
+    parser.add_argument("--skew", type=float, default=1.0)
+    parser.add_argument("--output", default="bench_caches.json")
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.capacities, args.lookups, args.key_space, args.skew, report=print
+    )
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
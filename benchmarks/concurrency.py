@@ -0,0 +1,129 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from typing import Any, Callable, Generic, TypeVar
+
+from data_structures.concurrent_double_linked_list import ConcurrentDoubleLinkedList
+from data_structures.double_linked_list import DoubleLinkedList
+
+T = TypeVar("T")
+
+
+class GlobalLockQueue(Generic[T]):
+    # the baseline being replaced: one lock around a plain DoubleLinkedList
+    __values: DoubleLinkedList[T]
+    __not_empty: threading.Condition
+
+    def __init__(self):
+        self.__values = DoubleLinkedList()
+        self.__not_empty = threading.Condition(threading.Lock())
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def append(self, value: T) -> None:
+        with self.__not_empty:
+            self.__values.append(value)
+            self.__not_empty.notify()
+
+    def pop_front(self, timeout: float | None = 0.0) -> T:
+        with self.__not_empty:
+            if not self.__not_empty.wait_for(lambda: len(self.__values), timeout):
+                raise IndexError("Pop from empty list")
+            return self.__values.pop_front()
+
+
+QUEUES: dict[str, Callable[[], Any]] = {
+    "global_lock": GlobalLockQueue,
+    "two_lock": ConcurrentDoubleLinkedList,
+}
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def measure_throughput(
+        factory: Callable[[], Any], threads: int, items_per_producer: int
+) -> float:
+    """
+    Runs `threads` producers and `threads` consumers against one queue and
+    returns transferred items per second. Each producer appends its items,
+    then consumers are stopped with one sentinel each.
+    """
+    queue = factory()
+    barrier = threading.Barrier(2 * threads + 1)
+
+    def produce() -> None:
+        barrier.wait()
+        for i in range(items_per_producer):
+            queue.append(i)
+
+    def consume() -> None:
+        barrier.wait()
+        while queue.pop_front(timeout=None) is not None:
+            pass
+
+    producers = [threading.Thread(target=produce) for _ in range(threads)]
+    consumers = [threading.Thread(target=consume) for _ in range(threads)]
+    for thread in producers + consumers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        queue.append(None)
+    for thread in consumers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return threads * items_per_producer / elapsed
+
+
+def run(
+        thread_counts: list[int],
+        items_per_producer: int,
+        report: Callable[[str], None] = lambda line: None,
+) -> dict[str, Any]:
+    rows = []
+    for name, factory in QUEUES.items():
+        for threads in thread_counts:
+            throughput = measure_throughput(factory, threads, items_per_producer)
+            rows.append({
+                "queue": name,
+                "threads": threads,
+                "items_per_second": throughput,
+            })
+            report(f"{name:<12} producers=consumers={threads:<3} {throughput:14.0f} items/s")
+
+    return {
+        "meta": {"python": sys.version, "gil_enabled": gil_enabled()},
+        "throughput": rows,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.concurrency",
+        description="Producer/consumer throughput of the concurrent list.",
+    )
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--output", default="bench_concurrency.json")
+    args = parser.parse_args(argv)
+
+    print(f"GIL enabled: {gil_enabled()}")
+    results = run(args.threads, args.items, report=print)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,332 @@
+import argparse
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from benchmarks.baselines import DequeAdapter, PyListAdapter
+from data_structures.array_double_linked_list import ArrayDoubleLinkedList
+from data_structures.btree_list import BTreeList
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.indexable_skip_list import IndexableSkipList
+from data_structures.linked_list import LinkedList
+from data_structures.list_protocol import ListProtocol
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+try:
+    from data_structures.numeric_list import NumericList
+except ImportError:  # numpy is optional
+    NumericList = None
+
+Factory = Callable[[], ListProtocol[int]]
+Operation = Callable[[ListProtocol[int], int, int], object]
+
+BACKENDS: dict[str, Factory] = {
+    "linked_list": LinkedList,
+    "double_linked_list": DoubleLinkedList,
+    "unrolled_linked_list": UnrolledLinkedList,
+    "array_double_linked_list": ArrayDoubleLinkedList,
+    "indexable_skip_list": IndexableSkipList,
+    "btree_list": BTreeList,
+    "list": PyListAdapter,
+    "deque": DequeAdapter,
+}
+if NumericList is not None:
+    BACKENDS["numeric_list"] = NumericList
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+EXTEND_VALUES = list(range(1_000))
+
+
+def _append(values: ListProtocol[int], size: int, i: int) -> object:
+    return values.append(i)
+
+
+def _prepend(values: ListProtocol[int], size: int, i: int) -> object:
+    return values.prepend(i)
+
+
+def _insert(values: ListProtocol[int], size: int, i: int) -> object:
+    return values.insert(len(values) // 2, i)
+
+
+def _get(values: ListProtocol[int], size: int, i: int) -> object:
+    # multiplicative hashing spreads the indices without an rng in the loop
+    return values.get(i * 2_654_435_761 % size)
+
+
+def _remove(values: ListProtocol[int], size: int, i: int) -> object:
+    return values.remove(size // 2 + i)
+
+
+def _pop_front(values: ListProtocol[int], size: int, i: int) -> object:
+    return values.pop_front()
+
+
+def _pop_back(values: ListProtocol[int], size: int, i: int) -> object:
+    return values.pop_back()
+
+
+def _index_of(values: ListProtocol[int], size: int, i: int) -> object:
+    return values.index_of(size - 1 - i)
+
+
+def _extend(values: ListProtocol[int], size: int, i: int) -> object:
+    return values.extend(EXTEND_VALUES)
+
+
+def _iterate(values: ListProtocol[int], size: int, i: int) -> object:
+    return deque(iter(values), maxlen=0)
+
+
+OPERATIONS: dict[str, Operation] = {
+    "append": _append,
+    "prepend": _prepend,
+    "insert": _insert,
+    "get": _get,
+    "remove": _remove,
+    "pop_front": _pop_front,
+    "pop_back": _pop_back,
+    "index_of": _index_of,
+    "extend": _extend,
+    "iterate": _iterate,
+}
+
+COMPLEXITY_MODELS: dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: n * n,
+}
+
+
+def build(factory: Factory, size: int) -> ListProtocol[int]:
+    values = factory()
+    values.extend(range(size))
+    return values
+
+
+def time_operation(
+        factory: Factory,
+        operation: Operation,
+        size: int,
+        time_budget: float,
+        max_repeats: int,
+) -> tuple[float, int]:
+    """
+    Returns the mean ns per call and the number of timed calls. One
+    calibration call estimates the cost, so slow operations on large lists
+    are repeated only as often as the time budget allows. At most half the
+    list size is used as repeats so pops and removes never run dry.
+    """
+    values = build(factory, size)
+    limit = max(1, min(max_repeats, size // 2))
+
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        operation(values, size, 0)
+        estimate = max(time.perf_counter_ns() - start, 1)
+        repeats = max(1, min(limit - 1, int(time_budget * 1e9 / estimate)))
+
+        start = time.perf_counter_ns()
+        for i in range(1, repeats + 1):
+            operation(values, size, i)
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+
+    return elapsed / repeats, repeats
+
+
+def measure_memory(factory: Factory, size: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        values = build(factory, size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del values
+    return peak
+
+
+def fit_complexity(sizes: list[int], timings: list[float]) -> tuple[str, float]:
+    """
+    Fits `timing = c * f(size)` for every model by least squares and returns
+    the model with the smallest relative error, plus the log-log slope.
+    """
+    best_label, best_error = "O(1)", math.inf
+    for label, model in COMPLEXITY_MODELS.items():
+        scaled = [model(size) for size in sizes]
+        coefficient = sum(t * f for t, f in zip(timings, scaled)) / sum(
+            f * f for f in scaled
+        )
+        error = sum(
+            ((t - coefficient * f) / t) ** 2 for t, f in zip(timings, scaled)
+        )
+        if error < best_error:
+            best_label, best_error = label, error
+
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(timing) for timing in timings]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    slope = (
+        sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+        if variance
+        else 0.0
+    )
+    return best_label, slope
+
+
+def run_suite(
+        backends: list[str],
+        operations: list[str],
+        sizes: list[int],
+        time_budget: float = 0.2,
+        max_repeats: int = 10_000,
+        memory_max_size: int = 10 ** 6,
+        report: Callable[[str], None] = lambda line: None,
+) -> dict[str, Any]:
+    timings = []
+    memory = []
+    complexity = []
+
+    for backend in backends:
+        factory = BACKENDS[backend]
+        for size in sizes:
+            if size <= memory_max_size:
+                peak = measure_memory(factory, size)
+                memory.append({
+                    "backend": backend,
+                    "size": size,
+                    "peak_bytes": peak,
+                    "bytes_per_element": peak / size,
+                })
+                report(f"{backend:<26} memory   n={size:<10} {peak / size:10.1f} B/elem")
+
+        for operation_name in operations:
+            operation = OPERATIONS[operation_name]
+            ns_per_op = []
+            for size in sizes:
+                ns, repeats = time_operation(
+                    factory, operation, size, time_budget, max_repeats
+                )
+                ns_per_op.append(ns)
+                timings.append({
+                    "backend": backend,
+                    "operation": operation_name,
+                    "size": size,
+                    "ns_per_op": ns,
+                    "repeats": repeats,
+                })
+                report(f"{backend:<26} {operation_name:<10} n={size:<10} {ns:14.1f} ns/op")
+
+            if len(sizes) >= 3:
+                label, slope = fit_complexity(sizes, ns_per_op)
+                complexity.append({
+                    "backend": backend,
+                    "operation": operation_name,
+                    "fitted": label,
+                    "log_log_slope": slope,
+                })
+                report(f"{backend:<26} {operation_name:<10} fitted {label} (slope {slope:.2f})")
+
+    return {
+        "meta": {
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "sizes": sizes,
+            "time_budget": time_budget,
+            "max_repeats": max_repeats,
+        },
+        "timings": timings,
+        "memory": memory,
+        "complexity": complexity,
+    }
+
+
+def find_regressions(
+        current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    previous = {
+        (row["backend"], row["operation"], row["size"]): row["ns_per_op"]
+        for row in baseline["timings"]
+    }
+    regressions = []
+    for row in current["timings"]:
+        key = (row["backend"], row["operation"], row["size"])
+        if key in previous and row["ns_per_op"] > previous[key] * threshold:
+            regressions.append(
+                f"{key[0]} {key[1]} n={key[2]}: "
+                f"{previous[key]:.1f} -> {row['ns_per_op']:.1f} ns/op"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark every ListProtocol implementation.",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS)
+    )
+    parser.add_argument(
+        "--ops", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS)
+    )
+    parser.add_argument(
+        "--time-budget", type=float, default=0.2,
+        help="seconds spent timing one operation at one size",
+    )
+    parser.add_argument("--max-repeats", type=int, default=10_000)
+    parser.add_argument(
+        "--memory-max-size", type=int, default=10 ** 6,
+        help="largest size traced for peak memory (tracing is slow)",
+    )
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument(
+        "--compare", help="earlier JSON results to check for regressions"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=1.25,
+        help="slowdown ratio reported as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        args.backends,
+        args.ops,
+        sorted(args.sizes),
+        time_budget=args.time_budget,
+        max_repeats=args.max_repeats,
+        memory_max_size=args.memory_max_size,
+        report=print,
+    )
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+
+    return 0
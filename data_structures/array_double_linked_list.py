@@ -0,0 +1,182 @@
+from array import array
+from typing import Generic, Iterator, TypeVar
+
+from data_structures.list_view import ListView
+
+T = TypeVar("T")
+
+NIL = -1
+
+
+class ArrayDoubleLinkedList(Generic[T]):
+    # Nodes are slots in parallel arrays: values[i], next[i] and prev[i]
+    # describe one node, links are slot indices and NIL marks a missing link.
+    # Removed slots are chained through `next` into a free list and reused.
+    __values: list[T | None]
+    __next: array
+    __prev: array
+    __head: int
+    __tail: int
+    __free: int
+    __length: int
+
+    def __init__(self):
+        self.__values = []
+        self.__next = array("q")
+        self.__prev = array("q")
+        self.__head = self.__tail = self.__free = NIL
+        self.__length = 0
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[T]:
+        values = self.__values
+        next_ = self.__next
+        slot = self.__head
+        while slot != NIL:
+            yield values[slot]
+            slot = next_[slot]
+
+    @property
+    def capacity(self) -> int:
+        return len(self.__values)
+
+    def append(self, value: T) -> None:
+        slot = self.__allocate(value)
+        tail = self.__tail
+        self.__prev[slot] = tail
+        if tail == NIL:
+            self.__head = slot
+        else:
+            self.__next[tail] = slot
+        self.__tail = slot
+        self.__length += 1
+
+    def prepend(self, value: T) -> None:
+        slot = self.__allocate(value)
+        head = self.__head
+        self.__next[slot] = head
+        if head == NIL:
+            self.__tail = slot
+        else:
+            self.__prev[head] = slot
+        self.__head = slot
+        self.__length += 1
+
+    def extend(self, values: Iterator[T]) -> None:
+        for value in values:
+            self.append(value)
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        if index == 0:
+            self.prepend(value)
+            return
+
+        if index == self.__length:
+            self.append(value)
+            return
+
+        next_slot = self.__slot_at(index)
+        prev_slot = self.__prev[next_slot]
+        slot = self.__allocate(value)
+        self.__prev[slot] = prev_slot
+        self.__next[slot] = next_slot
+        self.__next[prev_slot] = slot
+        self.__prev[next_slot] = slot
+        self.__length += 1
+
+    def remove(self, value: T) -> bool:
+        values = self.__values
+        next_ = self.__next
+        slot = self.__head
+        while slot != NIL:
+            if values[slot] == value:
+                self.__unlink(slot)
+                return True
+            slot = next_[slot]
+
+        return False
+
+    def pop_front(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        return self.__unlink(self.__head)
+
+    def pop_back(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        return self.__unlink(self.__tail)
+
+    def index_of(self, value: T) -> int | None:
+        i = 0
+        for v in self:
+            if v == value:
+                return i
+            i += 1
+        return None
+
+    def get(self, index: int) -> T:
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of bounds")
+
+        return self.__values[self.__slot_at(index)]
+
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def __slot_at(self, index: int) -> int:
+        if index < self.__length // 2:
+            next_ = self.__next
+            slot = self.__head
+            for _ in range(index):
+                slot = next_[slot]
+            return slot
+
+        prev = self.__prev
+        slot = self.__tail
+        for _ in range(self.__length - 1 - index):
+            slot = prev[slot]
+        return slot
+
+    def __allocate(self, value: T) -> int:
+        slot = self.__free
+        if slot == NIL:
+            slot = len(self.__values)
+            self.__values.append(value)
+            self.__next.append(NIL)
+            self.__prev.append(NIL)
+            return slot
+
+        self.__free = self.__next[slot]
+        self.__values[slot] = value
+        self.__next[slot] = self.__prev[slot] = NIL
+        return slot
+
+    def __unlink(self, slot: int) -> T:
+        next_ = self.__next
+        prev = self.__prev
+        next_slot = next_[slot]
+        prev_slot = prev[slot]
+        if prev_slot == NIL:
+            self.__head = next_slot
+        else:
+            next_[prev_slot] = next_slot
+        if next_slot == NIL:
+            self.__tail = prev_slot
+        else:
+            prev[next_slot] = prev_slot
+
+        value = self.__values[slot]
+        # drop the reference so the freed slot does not keep the value alive
+        self.__values[slot] = None
+        next_[slot] = self.__free
+        prev[slot] = NIL
+        self.__free = slot
+        self.__length -= 1
+        return value
@@ -0,0 +1,135 @@
+import asyncio
+from typing import Callable, Generic, TypeVar
+
+from data_structures.double_linked_list import DoubleLinkedList
+
+T = TypeVar("T")
+
+
+class AsyncListQueue(Generic[T]):
+    # asyncio queue over DoubleLinkedList, following asyncio.Queue's waiter
+    # protocol: blocked producers and consumers park futures in FIFO lists
+    # and are woken one at a time as room or items appear. maxsize <= 0
+    # means unbounded.
+    __items: DoubleLinkedList[T]
+    __maxsize: int
+    __getters: DoubleLinkedList[asyncio.Future]
+    __putters: DoubleLinkedList[asyncio.Future]
+
+    def __init__(self, maxsize: int = 0):
+        self.__items = DoubleLinkedList()
+        self.__maxsize = maxsize
+        self.__getters = DoubleLinkedList()
+        self.__putters = DoubleLinkedList()
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def qsize(self) -> int:
+        return len(self.__items)
+
+    def empty(self) -> bool:
+        return len(self.__items) == 0
+
+    def full(self) -> bool:
+        return 0 < self.__maxsize <= len(self.__items)
+
+    async def put(self, item: T) -> None:
+        await self.__wait_for_room()
+        self.put_nowait(item)
+
+    async def put_priority(self, item: T) -> None:
+        await self.__wait_for_room()
+        self.put_priority_nowait(item)
+
+    def put_nowait(self, item: T) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self.__items.append(item)
+        self.__wakeup_next(self.__getters)
+
+    def put_priority_nowait(self, item: T) -> None:
+        # jumps the queue: the item is the next one any consumer receives
+        if self.full():
+            raise asyncio.QueueFull
+        self.__items.prepend(item)
+        self.__wakeup_next(self.__getters)
+
+    async def get(self) -> T:
+        await self.__wait_for_items()
+        return self.get_nowait()
+
+    def get_nowait(self) -> T:
+        if not self.__items:
+            raise asyncio.QueueEmpty
+        item = self.__items.pop_front()
+        self.__wakeup_next(self.__putters)
+        return item
+
+    async def get_batch(
+            self, max_n: int, timeout: float | None = None
+    ) -> DoubleLinkedList[T]:
+        """
+        Waits up to `timeout` seconds (forever when None) for at least one
+        item, then detaches up to `max_n` items from the front in one
+        split. Returns an empty list if the timeout expires first.
+        """
+        if max_n < 1:
+            raise ValueError("Batch size must be at least 1")
+
+        try:
+            # waits in this task, so no other consumer runs between the
+            # wakeup and the split; one that takes the items first sends
+            # this one back to waiting
+            async with asyncio.timeout(timeout):
+                await self.__wait_for_items()
+        except TimeoutError:
+            return DoubleLinkedList()
+
+        count = min(max_n, len(self.__items))
+        rest = self.__items.split_at(count)
+        batch, self.__items = self.__items, rest
+        for _ in range(count):
+            if not self.__wakeup_next(self.__putters):
+                break
+        if self.__items:
+            self.__wakeup_next(self.__getters)
+        return batch
+
+    async def __wait_for_room(self) -> None:
+        while self.full():
+            await self.__park(self.__putters, self.full)
+
+    async def __wait_for_items(self) -> None:
+        while not self.__items:
+            await self.__park(self.__getters, self.empty)
+
+    async def __park(
+            self,
+            waiters: DoubleLinkedList[asyncio.Future],
+            blocked: Callable[[], bool],
+    ) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            waiters.remove(waiter)
+            # a wakeup that raced with the cancellation is passed on
+            if not blocked() and not waiter.cancelled():
+                self.__wakeup_next(waiters)
+            raise
+
+    @staticmethod
+    def __wakeup_next(waiters: DoubleLinkedList[asyncio.Future]) -> bool:
+        while waiters:
+            waiter = waiters.pop_front()
+            if not waiter.done():
+                waiter.set_result(None)
+                return True
+        return False
@@ -0,0 +1,393 @@
+from operator import index as as_index
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from data_structures.list_view import ListView
+
+T = TypeVar("T")
+
+
+class BTreeList(Generic[T]):
+    # B+ tree over positions, in the style of blist: leaves hold up to
+    # `node_capacity` values in small Python lists, branches hold up to
+    # `node_capacity` children, and every node caches the number of values
+    # below it. Positional access descends by subtracting child sizes, so
+    # get, insert and delete are O(log n). All leaves sit at the same depth,
+    # which lets two trees be joined, and one split, along a single
+    # root-to-leaf path.
+    # noinspection PyTypeHints
+    class __Node:
+        __slots__ = ("items", "size", "leaf")
+        items: list
+        size: int
+        leaf: bool
+
+        def __init__(self, items: list, leaf: bool):
+            self.items = items
+            self.leaf = leaf
+            self.size = len(items) if leaf else sum(child.size for child in items)
+
+    __root: __Node | None
+    # leaves have height 0
+    __height: int
+    __capacity: int
+
+    def __init__(self, node_capacity: int = 64):
+        if node_capacity < 4:
+            raise ValueError("Node capacity must be at least 4")
+
+        self.__root = None
+        self.__height = 0
+        self.__capacity = node_capacity
+
+    def __len__(self) -> int:
+        return 0 if self.__root is None else self.__root.size
+
+    def __iter__(self) -> Iterator[T]:
+        for leaf in self.__leaves():
+            yield from leaf.items
+
+    def __getitem__(self, key: int) -> T:
+        index = self.__normalize_index(key)
+        node = self.__root
+        while not node.leaf:
+            node, index = self.__locate(node, index)
+        return node.items[index]
+
+    def __setitem__(self, key: int, value: T) -> None:
+        index = self.__normalize_index(key)
+        node = self.__root
+        while not node.leaf:
+            node, index = self.__locate(node, index)
+        node.items[index] = value
+
+    def __delitem__(self, key: int) -> None:
+        self.__delete(self.__normalize_index(key))
+
+    @property
+    def node_capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    def append(self, value: T) -> None:
+        self.__insert(len(self), value)
+
+    def prepend(self, value: T) -> None:
+        self.__insert(0, value)
+
+    def extend(self, values: Iterable[T]) -> None:
+        # bulk-load a tree of full nodes and join it on in O(log n)
+        root, height = self.__build(list(values))
+        self.__root, self.__height = self.__join(
+            self.__root, self.__height, root, height
+        )
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > len(self):
+            raise IndexError("Index out of bounds")
+
+        self.__insert(index, value)
+
+    def remove(self, value: T) -> bool:
+        index = self.index_of(value)
+        if index is None:
+            return False
+
+        self.__delete(index)
+        return True
+
+    def pop_front(self) -> T:
+        if self.__root is None:
+            raise IndexError("Pop from empty list")
+
+        return self.__delete(0)
+
+    def pop_back(self) -> T:
+        if self.__root is None:
+            raise IndexError("Pop from empty list")
+
+        return self.__delete(self.__root.size - 1)
+
+    def index_of(self, value: T) -> int | None:
+        base = 0
+        for leaf in self.__leaves():
+            if value in leaf.items:
+                return base + leaf.items.index(value)
+            base += len(leaf.items)
+
+        return None
+
+    def get(self, index: int) -> T:
+        if index < 0 or index >= len(self):
+            raise IndexError("Index out of bounds")
+
+        return self[index]
+
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def concat(self, other: "BTreeList[T]") -> None:
+        # moves every value of other to the end of this list in O(log n)
+        self.__check_other(other)
+        root, height = other.__root, other.__height
+        other.__root, other.__height = None, 0
+        self.__root, self.__height = self.__join(
+            self.__root, self.__height, root, height
+        )
+
+    def split_at(self, index: int) -> "BTreeList[T]":
+        # keeps [0, index) and returns [index, len) as a new list
+        if index < 0 or index > len(self):
+            raise IndexError("Index out of bounds")
+
+        rest = BTreeList[T](self.__capacity)
+        if index == len(self):
+            return rest
+
+        left, left_height, right, right_height = self.__split(
+            self.__root, self.__height, index
+        )
+        self.__root, self.__height = left, left_height
+        rest.__root, rest.__height = right, right_height
+        return rest
+
+    def __normalize_index(self, key: int) -> int:
+        index = as_index(key)
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError("Index out of bounds")
+        return index
+
+    def __check_other(self, other: "BTreeList[T]") -> None:
+        if not isinstance(other, BTreeList):
+            raise TypeError("Can only join another BTreeList")
+        if other is self:
+            raise ValueError("Cannot join a list to itself")
+
+    def __leaves(self) -> Iterator[__Node]:
+        if self.__root is None:
+            return
+
+        stack = [iter((self.__root,))]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+            elif node.leaf:
+                yield node
+            else:
+                stack.append(iter(node.items))
+
+    @staticmethod
+    def __locate(node: __Node, index: int) -> tuple[__Node, int]:
+        for child in node.items:
+            if index < child.size:
+                return child, index
+            index -= child.size
+        raise IndexError("Index out of bounds")
+
+    def __insert(self, index: int, value: T) -> None:
+        if self.__root is None:
+            self.__root, self.__height = self.__Node([value], True), 0
+            return
+
+        sibling = self.__insert_into(self.__root, index, value)
+        if sibling is not None:
+            self.__root = self.__Node([self.__root, sibling], False)
+            self.__height += 1
+
+    def __insert_into(self, node: __Node, index: int, value: T) -> __Node | None:
+        # returns the new right sibling when the node had to split
+        node.size += 1
+        if node.leaf:
+            node.items.insert(index, value)
+        else:
+            children = node.items
+            last = len(children) - 1
+            k = 0
+            while k < last and index > children[k].size:
+                index -= children[k].size
+                k += 1
+            sibling = self.__insert_into(children[k], index, value)
+            if sibling is not None:
+                children.insert(k + 1, sibling)
+
+        if len(node.items) > self.__capacity:
+            return self.__split_node(node)
+        return None
+
+    def __split_node(self, node: __Node) -> __Node:
+        half = len(node.items) // 2
+        sibling = self.__Node(node.items[half:], node.leaf)
+        del node.items[half:]
+        node.size -= sibling.size
+        return sibling
+
+    def __delete(self, index: int) -> T:
+        value = self.__delete_from(self.__root, index)
+        root = self.__root
+        if not root.items:
+            self.__root, self.__height = None, 0
+        elif not root.leaf and len(root.items) == 1:
+            self.__root, self.__height = root.items[0], self.__height - 1
+        return value
+
+    def __delete_from(self, node: __Node, index: int) -> T:
+        node.size -= 1
+        if node.leaf:
+            return node.items.pop(index)
+
+        children = node.items
+        k = 0
+        while index >= children[k].size:
+            index -= children[k].size
+            k += 1
+        value = self.__delete_from(children[k], index)
+        if len(children[k].items) < self.__capacity // 2:
+            self.__rebalance(node, k)
+        return value
+
+    def __rebalance(self, parent: __Node, k: int) -> None:
+        # merge an underfull child with a neighbour, or share their items
+        # evenly when they do not fit in one node
+        children = parent.items
+        if len(children) < 2:
+            return
+
+        if k == 0:
+            k = 1
+        left, right = children[k - 1], children[k]
+        if len(left.items) + len(right.items) <= self.__capacity:
+            left.items.extend(right.items)
+            left.size += right.size
+            del children[k]
+            return
+
+        items = left.items + right.items
+        half = len(items) // 2
+        left.items, right.items = items[:half], items[half:]
+        total = left.size + right.size
+        left.size = half if left.leaf else sum(child.size for child in left.items)
+        right.size = total - left.size
+
+    def __build(self, values: list[T]) -> tuple[__Node | None, int]:
+        if not values:
+            return None, 0
+
+        capacity = self.__capacity
+        level = [
+            self.__Node(values[i:i + capacity], True)
+            for i in range(0, len(values), capacity)
+        ]
+        height = 0
+        while len(level) > 1:
+            # fold a short last group into its neighbour group so no
+            # branch ends up with a single child
+            groups = [level[i:i + capacity] for i in range(0, len(level), capacity)]
+            if len(groups) > 1 and len(groups[-1]) < 2:
+                groups[-2:] = [groups[-2][:-1], groups[-2][-1:] + groups[-1]]
+            level = [self.__Node(group, False) for group in groups]
+            height += 1
+        return level[0], height
+
+    def __join(
+            self,
+            left: __Node | None, left_height: int,
+            right: __Node | None, right_height: int,
+    ) -> tuple[__Node | None, int]:
+        if left is None:
+            return right, right_height
+        if right is None:
+            return left, left_height
+
+        if left_height == right_height:
+            root = self.__Node([left, right], False)
+            if min(len(left.items), len(right.items)) < self.__capacity // 2:
+                self.__rebalance(root, 1)
+                if len(root.items) == 1:
+                    return left, left_height
+            return root, left_height + 1
+
+        if left_height > right_height:
+            sibling = self.__attach(left, left_height, right, right_height, True)
+            root, height = left, left_height
+        else:
+            sibling = self.__attach(right, right_height, left, left_height, False)
+            root, height = right, right_height
+        if sibling is None:
+            return root, height
+        if left_height > right_height:
+            return self.__Node([root, sibling], False), height + 1
+        return self.__Node([sibling, root], False), height + 1
+
+    def __attach(
+            self, node: __Node, height: int, tree: __Node, tree_height: int, at_end: bool
+    ) -> __Node | None:
+        # hangs `tree` off the right (or left) spine of `node` at the level
+        # where the heights line up; returns a new sibling on overflow, on
+        # the same side the tree was attached to
+        node.size += tree.size
+        children = node.items
+        if height == tree_height + 1:
+            if at_end:
+                children.append(tree)
+                if len(tree.items) < self.__capacity // 2:
+                    self.__rebalance(node, len(children) - 1)
+            else:
+                children.insert(0, tree)
+                if len(tree.items) < self.__capacity // 2:
+                    self.__rebalance(node, 0)
+        else:
+            edge = children[-1] if at_end else children[0]
+            sibling = self.__attach(edge, height - 1, tree, tree_height, at_end)
+            if sibling is not None:
+                if at_end:
+                    children.append(sibling)
+                else:
+                    children.insert(0, sibling)
+
+        if len(children) <= self.__capacity:
+            return None
+        sibling = self.__split_node(node)
+        if at_end:
+            return sibling
+        # keep `node` as the right half so the caller's root stays on the right
+        node.items, sibling.items = sibling.items, node.items
+        node.size, sibling.size = sibling.size, node.size
+        return sibling
+
+    def __split(
+            self, node: __Node, height: int, index: int
+    ) -> tuple[__Node | None, int, __Node | None, int]:
+        # splits the subtree before position `index` (index < size)
+        # into two trees, joining the pieces left over at every level
+        if node.leaf:
+            left = self.__Node(node.items[:index], True) if index else None
+            right = self.__Node(node.items[index:], True) if index < node.size else None
+            return left, 0, right, 0
+
+        children = node.items
+        k = 0
+        while index >= children[k].size:
+            index -= children[k].size
+            k += 1
+        sub_left, sub_left_height, sub_right, sub_right_height = self.__split(
+            children[k], height - 1, index
+        )
+
+        left, left_height = self.__branch_of(children[:k], height)
+        right, right_height = self.__branch_of(children[k + 1:], height)
+        left, left_height = self.__join(left, left_height, sub_left, sub_left_height)
+        right, right_height = self.__join(sub_right, sub_right_height, right, right_height)
+        return left, left_height, right, right_height
+
+    def __branch_of(self, children: list, height: int) -> tuple[__Node | None, int]:
+        if not children:
+            return None, 0
+        if len(children) == 1:
+            return children[0], height - 1
+        return self.__Node(children, False), height
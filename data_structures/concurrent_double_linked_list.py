@@ -0,0 +1,214 @@
+import threading
+import time
+from typing import Generic, Iterable, Iterator, Self, TypeVar
+
+from data_structures.list_view import ListView
+
+T = TypeVar("T")
+
+
+class ConcurrentDoubleLinkedList(Generic[T]):
+    # Two-lock list (after Michael & Scott's two-lock queue). The head is a
+    # dummy node: pop_front turns the first real node into the new dummy, so
+    # it only touches the head side, while append only touches the tail
+    # side. Producers and consumers therefore proceed in parallel. Every
+    # other operation takes both locks, always head first.
+    # noinspection PyTypeHints
+    class __Node(Generic[T]):
+        __slots__ = ("value", "next", "prev")
+        value: T | None
+        next: Self | None
+        prev: Self | None
+
+        def __init__(self, value: T | None):
+            self.value = value
+            self.next = self.prev = None
+
+    __head: __Node[T]
+    __tail: __Node[T]
+    __head_lock: threading.Lock
+    __tail_lock: threading.Lock
+    __not_empty: threading.Condition
+    # each counter is only written under its own lock, so the length is
+    # their difference rather than one counter both sides would contend on
+    __added: int
+    __removed: int
+    __waiters: int
+
+    def __init__(self):
+        self.__head = self.__tail = self.__Node(None)
+        self.__head_lock = threading.Lock()
+        self.__tail_lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__head_lock)
+        self.__added = self.__removed = 0
+        self.__waiters = 0
+
+    def __len__(self) -> int:
+        # Lock-free: additions are counted before their nodes are linked, so
+        # __removed never runs ahead of __added, and reading __removed first
+        # keeps concurrent appends and pops from making the result negative.
+        removed = self.__removed
+        return self.__added - removed
+
+    def __iter__(self) -> Iterator[T]:
+        # iterate over a snapshot so no lock is held while the caller runs
+        with self.__head_lock, self.__tail_lock:
+            values = []
+            node = self.__head.next
+            while node is not None:
+                values.append(node.value)
+                node = node.next
+        return iter(values)
+
+    def append(self, value: T) -> None:
+        node = self.__Node(value)
+        with self.__tail_lock:
+            self.__added += 1
+            node.prev = self.__tail
+            self.__tail.next = node
+            self.__tail = node
+        self.__signal_not_empty()
+
+    def prepend(self, value: T) -> None:
+        node = self.__Node(value)
+        with self.__not_empty, self.__tail_lock:
+            self.__link_after(self.__head, node)
+            self.__added += 1
+            self.__not_empty.notify()
+
+    def extend(self, values: Iterable[T]) -> None:
+        # link the chain privately and attach it under the tail lock once
+        first = last = None
+        count = 0
+        for value in values:
+            node = self.__Node(value)
+            if last is None:
+                first = node
+            else:
+                node.prev = last
+                last.next = node
+            last = node
+            count += 1
+        if first is None:
+            return
+
+        with self.__tail_lock:
+            self.__added += count
+            first.prev = self.__tail
+            self.__tail.next = first
+            self.__tail = last
+        self.__signal_not_empty(count)
+
+    def insert(self, index: int, value: T) -> None:
+        with self.__not_empty, self.__tail_lock:
+            if index < 0 or index > self.__added - self.__removed:
+                raise IndexError("Index out of bounds")
+
+            prev_node = self.__head
+            for _ in range(index):
+                prev_node = prev_node.next
+            self.__link_after(prev_node, self.__Node(value))
+            self.__added += 1
+            self.__not_empty.notify()
+
+    def remove(self, value: T) -> bool:
+        with self.__head_lock, self.__tail_lock:
+            node = self.__head.next
+            while node is not None:
+                if node.value == value:
+                    self.__unlink(node)
+                    self.__removed += 1
+                    return True
+                node = node.next
+            return False
+
+    def pop_front(self, timeout: float | None = 0.0) -> T:
+        """
+        Removes and returns the first item. With the default timeout of 0
+        an empty list raises IndexError at once; otherwise the call waits up
+        to `timeout` seconds (forever when None) for a producer.
+        """
+        with self.__not_empty:
+            self.__waiters += 1
+            try:
+                first = self.__head.next
+                if first is None and timeout != 0:
+                    deadline = None if timeout is None else time.monotonic() + timeout
+                    while first is None:
+                        if deadline is None:
+                            self.__not_empty.wait()
+                        else:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            self.__not_empty.wait(remaining)
+                        first = self.__head.next
+            finally:
+                self.__waiters -= 1
+
+            if first is None:
+                raise IndexError("Pop from empty list")
+
+            # the first node becomes the new dummy head; the tail may still
+            # point at it, which is exactly the empty-list shape
+            value = first.value
+            first.value = None
+            first.prev = None
+            self.__head = first
+            self.__removed += 1
+            return value
+
+    def pop_back(self) -> T:
+        with self.__head_lock, self.__tail_lock:
+            node = self.__tail
+            if node is self.__head:
+                raise IndexError("Pop from empty list")
+
+            self.__unlink(node)
+            self.__removed += 1
+            return node.value
+
+    def index_of(self, value: T) -> int | None:
+        i = 0
+        for v in self:
+            if v == value:
+                return i
+            i += 1
+        return None
+
+    def get(self, index: int) -> T:
+        with self.__head_lock, self.__tail_lock:
+            if index < 0 or index >= self.__added - self.__removed:
+                raise IndexError("Index out of bounds")
+
+            node = self.__head.next
+            for _ in range(index):
+                node = node.next
+            return node.value
+
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def __signal_not_empty(self, count: int = 1) -> None:
+        # waiters register under the head lock before re-checking for a
+        # node, so reading the counter after linking cannot miss a sleeper
+        if self.__waiters:
+            with self.__not_empty:
+                self.__not_empty.notify(count)
+
+    def __link_after(self, prev_node: __Node[T], node: __Node[T]) -> None:
+        node.prev = prev_node
+        node.next = prev_node.next
+        if prev_node.next is None:
+            self.__tail = node
+        else:
+            prev_node.next.prev = node
+        prev_node.next = node
+
+    def __unlink(self, node: __Node[T]) -> None:
+        node.prev.next = node.next
+        if node.next is None:
+            self.__tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.next = node.prev = None
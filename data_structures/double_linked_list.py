@@ -1,4 +1,14 @@
-from typing import Generic, Iterator, Self, TypeVar
+from operator import gt, index as as_index, lt
+from weakref import WeakSet
+from typing import Any, BinaryIO, Callable, Generic, Iterable, Iterator, Self, TypeVar
+
+from data_structures.double_linked_list_cursor import DoubleLinkedListCursor
+from data_structures.double_linked_list_handle import DoubleLinkedListHandle
+from data_structures.double_linked_list_snapshot import DoubleLinkedListSnapshot
+from data_structures.list_view import ListView
+from data_structures.node_pool import NodePool
+from data_structures.parallel import map_segments, reduce_segments
+from data_structures.serialization import dump_values, load_values
 
 T = TypeVar("T")
 
@@ -18,22 +28,115 @@ class DoubleLinkedList(Generic[T]):
     __head: __Node[T] | None
     __tail: __Node[T] | None
     __length: int
+    __pool: NodePool[__Node[T]] | None
+    # last position resolved by __node_at; a walk starts from whichever of
+    # head, tail or finger is closest to the requested index
+    __finger_index: int
+    __finger_node: __Node[T] | None
+    # optional value -> nodes holding it, in insertion order
+    __value_index: dict[T, dict[__Node[T], None]] | None
+    # live snapshots sharing the current nodes; created on first snapshot()
+    __snapshots: WeakSet | None
+    # bumped whenever the list moves to a fresh copy of its nodes
+    __generation: int
+    # bumped by every structural change, so cursors can detect edits made
+    # through anything else
+    __modifications: int
+    # whether insertions return handles; bumping the epoch makes every
+    # handle issued so far stale
+    __handles: bool
+    __handle_epoch: int
+
+    def __init__(
+            self,
+            node_pool_size: int = 0,
+            index_values: bool = False,
+            handles: bool = False,
+    ):
+        if handles and node_pool_size > 0:
+            # a recycled node would revive the stale handles to it
+            raise ValueError("Handles cannot be combined with a node pool")
 
-    def __init__(self):
         self.__head = self.__tail = None
         self.__length = 0
+        self.__pool = NodePool(node_pool_size) if node_pool_size > 0 else None
+        self.__finger_index = 0
+        self.__finger_node = None
+        self.__value_index = {} if index_values else None
+        self.__snapshots = None
+        self.__generation = 0
+        self.__modifications = 0
+        self.__handles = handles
+        self.__handle_epoch = 0
 
     def __len__(self) -> int:
         return self.__length
 
+    def __contains__(self, value: object) -> bool:
+        if self.__value_index is not None:
+            return self.__bucket(value) is not None
+        return self.index_of(value) is not None
+
     def __iter__(self) -> Iterator[T]:
         current_node = self.__head
         while current_node is not None:
             yield current_node.value
             current_node = current_node.next
 
-    def append(self, value: T) -> None:
-        node = self.__Node(value)
+    def __reversed__(self) -> Iterator[T]:
+        current_node = self.__tail
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.prev
+
+    def __getitem__(self, key: int | slice) -> "T | DoubleLinkedList[T]":
+        if isinstance(key, slice):
+            return self.__copy_positions(range(*key.indices(self.__length)))
+        return self.__node_at(self.__normalize_index(key)).value
+
+    def __setitem__(self, key: int | slice, value: T | Iterable[T]) -> None:
+        self.__prepare_write()
+        if isinstance(key, slice):
+            positions = range(*key.indices(self.__length))
+            if positions.step == 1:
+                stop = max(positions.start, positions.stop)
+                self.__replace_segment(positions.start, stop, value)
+            else:
+                self.__assign_positions(positions, value)
+            return
+
+        self.__set_value(self.__node_at(self.__normalize_index(key)), value)
+
+    def __delitem__(self, key: int | slice) -> None:
+        self.__prepare_write()
+        if isinstance(key, slice):
+            positions = range(*key.indices(self.__length))
+            self.__delete_positions(
+                positions if positions.step > 0 else positions[::-1]
+            )
+            return
+
+        index = self.__normalize_index(key)
+        self.__delete_positions(range(index, index + 1))
+
+    def __reduce__(self) -> tuple:
+        # pickle as a flat value sequence that is streamed back through
+        # extend, rather than recursing through the node links
+        pool_size = 0 if self.__pool is None else self.__pool.max_size
+        return (
+            type(self),
+            (pool_size, self.__value_index is not None, self.__handles),
+            None,
+            iter(self),
+        )
+
+    @property
+    def node_pool(self) -> NodePool[__Node[T]] | None:
+        return self.__pool
+
+    def append(self, value: T) -> DoubleLinkedListHandle[T] | None:
+        # returns a handle to the new value on lists created with handles=True
+        node = self.__new_node(value)
         if self.__length == 0:
             self.__head = self.__tail = node
         elif self.__length == 1:
@@ -46,9 +149,11 @@ class DoubleLinkedList(Generic[T]):
             self.__tail = node
 
         self.__length += 1
+        self.__modifications += 1
+        return self.__handle(node)
 
-    def prepend(self, value: T) -> None:
-        node = self.__Node(value)
+    def prepend(self, value: T) -> DoubleLinkedListHandle[T] | None:
+        node = self.__new_node(value)
         if self.__length == 0:
             self.__head = self.__tail = node
         else:
@@ -57,130 +162,220 @@ class DoubleLinkedList(Generic[T]):
             self.__head = node
 
         self.__length += 1
+        self.__modifications += 1
+        self.__finger_index += 1
+        return self.__handle(node)
 
-    def extend(self, values: Iterator[T]) -> None:
-        for i in values:
-            self.append(i)
+    def extend(self, values: Iterable[T]) -> None:
+        first, last, count = self.__build_chain(values)
+        if count == 0:
+            return
 
-    def insert(self, index: int, value: T) -> None:
-        if index < 0 or index > self.__length:
-            raise IndexError("Index out of bounds")
+        self.__modifications += 1
+        if self.__tail is None:
+            self.__head = first
+        else:
+            self.__tail.next = first
+            first.prev = self.__tail
+        self.__tail = last
+        self.__length += count
 
-        new_node = self.__Node(value)
-        if self.__length == 0:
-            self.__head = self.__tail = new_node
-            self.__length += 1
+    def prepend_many(self, values: Iterable[T]) -> None:
+        first, last, count = self.__build_chain(values)
+        if count == 0:
             return
 
-        if index == 0:
-            new_node.next = self.__head
-            self.__head.prev = new_node
-            self.__head = new_node
-            self.__length += 1
-            return
+        self.__modifications += 1
+        if self.__head is None:
+            self.__tail = last
+        else:
+            self.__head.prev = last
+            last.next = self.__head
+        self.__head = first
+        self.__length += count
+        self.__finger_index += count
 
+    def insert(self, index: int, value: T) -> DoubleLinkedListHandle[T] | None:
+        self.__prepare_write()
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        self.__modifications += 1
         if index == self.__length:
-            new_node.prev = self.__tail
-            self.__tail.next = new_node
-            self.__tail = new_node
-            self.__length += 1
-            return
+            return self.append(value)
 
-        if self.__length / 2 < index:
-            i = 0
-            node = self.__head
-            while i != index - 1:
-                node = node.next
-                i += 1
-            next_node = node.next
-            new_node.prev = node
-            node.next = new_node
-            new_node.next = next_node
-        else:
-            i = self.__length
-            node = self.__tail
-            next_node = node
-            while i != index + 1:
-                next_node = node.prev
-                i -= 1
-            node = next_node.prev
-            new_node.prev = node
-            node.next = new_node
-            new_node.next = next_node
-            next_node.prev = new_node
+        if index == 0:
+            return self.prepend(value)
+
+        next_node = self.__node_at(index)
+        prev_node = next_node.prev
+        new_node = self.__new_node(value)
+        new_node.prev = prev_node
+        new_node.next = next_node
+        prev_node.next = new_node
+        next_node.prev = new_node
         self.__length += 1
+        self.__finger_index, self.__finger_node = index, new_node
+        return self.__handle(new_node)
 
     def remove(self, value: T) -> bool:
+        self.__prepare_write()
         if self.__length == 0 or (
                 self.__head is None and self.__tail is None
         ):
             return False
 
-        if self.__length == 1 and value == self.__tail.value:
-            self.__head = self.__tail = None
-            self.__length = 0
-            return True
-
-        node = self.__head
-        node_to_remove = None
-        while node is not None:
-            if node.value == value:
-                node_to_remove = node
-                break
-            node = node.next
+        if self.__value_index is not None:
+            node_to_remove = self.__first_indexed(value)
+            if node_to_remove is None:
+                return False
+            # the position of an indexed node is unknown, so drop the finger
+            self.__finger_node = None
+        else:
+            node = self.__head
+            node_to_remove = None
+            index = 0
+            while node is not None:
+                if node.value == value:
+                    node_to_remove = node
+                    break
+                node = node.next
+                index += 1
 
-        if node_to_remove is None:
-            return False
+            if node_to_remove is None:
+                return False
 
-        if node_to_remove is self.__head:
-            next_node = node_to_remove.next
-            next_node.prev = None
-            self.__head = next_node
-        elif node_to_remove is self.__tail:
-            prev_node = node_to_remove.prev
-            prev_node.next = None
-            self.__tail = prev_node
-        else:
-            prev_node = node.prev
-            next_node = node.next
-            prev_node.next = next_node
-            next_node.prev = prev_node
+            if node_to_remove is self.__finger_node:
+                self.__finger_node = None
+            elif index < self.__finger_index:
+                self.__finger_index -= 1
 
-        self.__length -= 1
+        self.__unlink(node_to_remove)
+        self.__modifications += 1
+        self.__release_node(node_to_remove)
         return True
 
     def pop_front(self) -> T:
+        self.__prepare_write()
         if self.__length == 0:
             raise IndexError("Pop from empty list")
 
+        self.__modifications += 1
+        node_to_remove = self.__head
+        value = node_to_remove.value
         if self.__length == 1:
-            value = self.__head.value
             self.__head = self.__tail = None
         else:
-            value = self.__head.value
-            self.__head = self.__head.next
-            self.__head.prev.next = None
+            self.__head = node_to_remove.next
+            self.__head.prev = None
+            node_to_remove.next = None
 
         self.__length -= 1
+        if node_to_remove is self.__finger_node:
+            self.__finger_node = None
+        else:
+            self.__finger_index -= 1
+        self.__release_node(node_to_remove)
         return value
 
     def pop_back(self) -> T:
+        self.__prepare_write()
         if self.__length == 0:
             raise IndexError("Pop from empty list")
 
+        self.__modifications += 1
+        node_to_remove = self.__tail
+        value = node_to_remove.value
         if self.__length == 1:
-            value = self.__tail.value
             self.__head = self.__tail = None
         else:
-            value = self.__tail.value
-            prev_node = self.__tail.prev
+            prev_node = node_to_remove.prev
             prev_node.next = None
             self.__tail = prev_node
+            node_to_remove.prev = None
 
         self.__length -= 1
+        if node_to_remove is self.__finger_node:
+            self.__finger_node = None
+        self.__release_node(node_to_remove)
         return value
 
+    def pop_front_many(self, n: int) -> list[T]:
+        self.__prepare_write()
+        if n < 0:
+            raise ValueError("Count must not be negative")
+
+        self.__modifications += 1
+        count = min(n, self.__length)
+        values = []
+        node = self.__head
+        for _ in range(count):
+            values.append(node.value)
+            next_node = node.next
+            self.__release_node(node)
+            node = next_node
+
+        self.__head = node
+        if node is None:
+            self.__tail = None
+        else:
+            node.prev = None
+        self.__length -= count
+        if self.__finger_index < count:
+            self.__finger_node = None
+        else:
+            self.__finger_index -= count
+        return values
+
+    def pop_back_many(self, n: int) -> list[T]:
+        self.__prepare_write()
+        if n < 0:
+            raise ValueError("Count must not be negative")
+
+        self.__modifications += 1
+        count = min(n, self.__length)
+        values = []
+        node = self.__tail
+        for _ in range(count):
+            values.append(node.value)
+            prev_node = node.prev
+            self.__release_node(node)
+            node = prev_node
+
+        self.__tail = node
+        if node is None:
+            self.__head = None
+        else:
+            node.next = None
+        self.__length -= count
+        if self.__finger_index >= self.__length:
+            self.__finger_node = None
+        return values
+
+    def drain(self) -> Iterator[T]:
+        # the list is emptied right away; values are produced lazily from
+        # the detached chain
+        self.__prepare_write()
+        head, _, _ = self.__take_all()
+        return self.__drain_chain(head, forward=True)
+
+    def drain_reversed(self) -> Iterator[T]:
+        self.__prepare_write()
+        _, tail, _ = self.__take_all()
+        return self.__drain_chain(tail, forward=False)
+
     def index_of(self, value: T) -> int | None:
+        if self.__value_index is not None:
+            bucket = self.__bucket(value)
+            if bucket is None:
+                return None
+            i = 0
+            node = self.__head
+            while node not in bucket:
+                node = node.next
+                i += 1
+            return i
+
         i = 0
         for v in self:
             if v == value:
@@ -188,31 +383,662 @@ class DoubleLinkedList(Generic[T]):
             i += 1
         return None
 
-    def get(self, index: int) -> T | None:
+    def get(self, index: int) -> T:
         if index < 0 or index >= self.__length:
             raise IndexError("Index out of bounds")
 
-        if self.__length == 0:
-            raise IndexError("List is empty")
+        return self.__node_at(index).value
 
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def parallel_map(
+            self, function: Callable[[T], Any], workers: int | None = None
+    ) -> "DoubleLinkedList[Any]":
+        # returns a new list with the same configuration; function must be
+        # picklable (see map_segments)
+        result = self.__empty_like()
+        for block in map_segments(self, self.__length, function, workers):
+            result.extend(block)
+        return result
+
+    def parallel_reduce(
+            self, function: Callable[[Any, T], Any], initial: Any,
+            workers: int | None = None,
+    ) -> Any:
+        # function must be associative and initial its identity
+        return reduce_segments(self, self.__length, function, initial, workers)
+
+    def sort(
+            self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> None:
+        # stable like list.sort, but relinks the existing nodes instead of
+        # copying the values out; with a key function, keys are recomputed
+        # per comparison so no per-element key storage is needed
+        if self.__length < 2:
+            return
+
+        self.__prepare_write()
+        self.__modifications += 1
+
+        if key is None:
+            precedes = gt if reverse else lt
+        elif reverse:
+            def precedes(right: T, left: T) -> bool:
+                return key(left) < key(right)
+        else:
+            def precedes(right: T, left: T) -> bool:
+                return key(right) < key(left)
+
+        self.__head, _ = self.__merge_sort(self.__head, precedes)
+
+        # the merges only maintain next links; restore prev and the tail
+        prev_node, node = None, self.__head
+        while node is not None:
+            node.prev = prev_node
+            prev_node, node = node, node.next
+        self.__tail = prev_node
+        self.__finger_node = None
+
+    def concat(self, other: "DoubleLinkedList[T]") -> None:
+        # appending leaves the nodes of this list's snapshots untouched
+        self.__check_other(other)
+        other.__prepare_write()
+        head, tail, length = other.__take_all()
+        if length == 0:
+            return
+
+        self.__modifications += 1
+        self.__index_chain(head)
+        if self.__tail is None:
+            self.__head = head
+        else:
+            self.__tail.next = head
+            head.prev = self.__tail
+        self.__tail = tail
+        self.__length += length
+
+    def split_at(self, index: int) -> "DoubleLinkedList[T]":
+        self.__prepare_write()
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        self.__modifications += 1
+        result = self.__empty_like()
         if index == 0:
-            return self.__head.value
+            result.__head, result.__tail, result.__length = self.__take_all()
+            result.__index_chain(result.__head)
+            return result
 
-        if index == self.__length - 1:
-            return self.__tail.value
+        if index == self.__length:
+            return result
 
-        if self.__length / 2 < index:
-            i = 0
-            for value in self:
-                if i == index:
-                    return value
-                i += 1
+        self.__handle_epoch += 1
+        last_kept = self.__node_at(index - 1)
+        first_moved = last_kept.next
+        last_kept.next = first_moved.prev = None
+        if self.__finger_index >= index:
+            self.__finger_node = None
+        self.__unindex_chain(first_moved)
+        result.__index_chain(first_moved)
+        result.__head = first_moved
+        result.__tail = self.__tail
+        result.__length = self.__length - index
+        self.__tail = last_kept
+        self.__length = index
+        return result
+
+    def splice(self, index: int, other: "DoubleLinkedList[T]") -> None:
+        self.__check_other(other)
+        self.__prepare_write()
+        other.__prepare_write()
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        self.__modifications += 1
+        if index == self.__length:
+            self.concat(other)
+            return
+
+        head, tail, length = other.__take_all()
+        if length == 0:
+            return
+
+        self.__index_chain(head)
+        next_node = self.__node_at(index)
+        prev_node = next_node.prev
+        tail.next = next_node
+        next_node.prev = tail
+        head.prev = prev_node
+        if prev_node is None:
+            self.__head = head
+        else:
+            prev_node.next = head
+        self.__length += length
+        self.__finger_index += length
+
+    def dump(self, file: BinaryIO) -> None:
+        dump_values(self, self.__length, file)
+
+    @classmethod
+    def load(cls, file: BinaryIO, **options: Any) -> Self:
+        # options are passed to the constructor
+        result = cls(**options)
+        for block in load_values(file):
+            result.extend(block)
+        return result
+
+    def cursor(self, index: int = 0) -> DoubleLinkedListCursor[T]:
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        node = None if index == self.__length else self.__node_at(index)
+        return DoubleLinkedListCursor(self, node, index)
+
+    def snapshot(self) -> DoubleLinkedListSnapshot[T]:
+        """
+        Returns a read-only view of the current values in O(1). The view
+        shares the list's nodes: appends and prepends leave them alone, and
+        the first other change while a snapshot is alive moves the list to
+        a fresh copy of its nodes, once for all snapshots taken so far.
+        Lists with handles do not support snapshots, since that copy would
+        leave every handle stale.
+        """
+        if self.__handles:
+            raise ValueError("Snapshots are not supported on lists with handles")
+        snapshot = DoubleLinkedListSnapshot(self.__head, self.__tail, self.__length)
+        if self.__snapshots is None:
+            self.__snapshots = WeakSet()
+        self.__snapshots.add(snapshot)
+        return snapshot
+
+    def remove_handle(self, handle: DoubleLinkedListHandle[T]) -> T:
+        return self._remove_node(handle._node_for(self))
+
+    def move_to_front(self, handle: DoubleLinkedListHandle[T]) -> None:
+        self._move_node_before(handle._node_for(self), self.__head)
+
+    def move_to_back(self, handle: DoubleLinkedListHandle[T]) -> None:
+        self._move_node_before(handle._node_for(self), None)
+
+    def insert_after(
+            self, handle: DoubleLinkedListHandle[T], value: T
+    ) -> DoubleLinkedListHandle[T]:
+        node = handle._node_for(self)
+        return self.__handle(self._insert_before_node(node.next, value))
+
+    # node-level access for DoubleLinkedListCursor
+
+    @property
+    def _generation(self) -> int:
+        return self.__generation
+
+    @property
+    def _modifications(self) -> int:
+        return self.__modifications
+
+    @property
+    def _handle_epoch(self) -> int:
+        return self.__handle_epoch
+
+    def _node_at(self, index: int) -> __Node[T] | None:
+        return None if index == self.__length else self.__node_at(index)
+
+    def _prepare_write(self) -> None:
+        self.__prepare_write()
+
+    def _first_node(self) -> __Node[T] | None:
+        return self.__head
+
+    def _last_node(self) -> __Node[T] | None:
+        return self.__tail
+
+    def _insert_before_node(self, next_node: __Node[T] | None, value: T) -> __Node[T]:
+        self.__prepare_write()
+        self.__modifications += 1
+        # a next_node of None inserts at the tail
+        node = self.__new_node(value)
+        prev_node = self.__tail if next_node is None else next_node.prev
+        node.prev, node.next = prev_node, next_node
+        if prev_node is None:
+            self.__head = node
+        else:
+            prev_node.next = node
+        if next_node is None:
+            self.__tail = node
+        else:
+            next_node.prev = node
+        self.__length += 1
+        self.__finger_node = None
+        return node
+
+    def _remove_node(self, node: __Node[T]) -> T:
+        self.__prepare_write()
+        self.__modifications += 1
+        value = node.value
+        self.__unlink(node)
+        self.__release_node(node)
+        self.__finger_node = None
+        return value
+
+    def _move_node_before(self, node: __Node[T], next_node: __Node[T] | None) -> None:
+        self.__prepare_write()
+        # relinks node without allocating; a next_node of None moves to the tail
+        if node is next_node or node.next is next_node:
+            return
+
+        self.__modifications += 1
+        self.__unlink(node)
+        prev_node = self.__tail if next_node is None else next_node.prev
+        node.prev, node.next = prev_node, next_node
+        if prev_node is None:
+            self.__head = node
+        else:
+            prev_node.next = node
+        if next_node is None:
+            self.__tail = node
+        else:
+            next_node.prev = node
+        self.__length += 1
+        self.__finger_node = None
+
+    def _replace_node_value(self, node: __Node[T], value: T) -> T:
+        self.__prepare_write()
+        old_value = node.value
+        self.__set_value(node, value)
+        return old_value
+
+    def __prepare_write(self) -> None:
+        # called before any change that could touch nodes a snapshot reads
+        if self.__snapshots:
+            self.__detach()
+
+    def __detach(self) -> None:
+        # leave the current nodes to the snapshots and continue on a copy
+        if self.__value_index is not None:
+            self.__value_index = {}
+        self.__head, self.__tail, _ = self.__build_chain(self)
+        self.__finger_node = None
+        self.__snapshots = None
+        self.__generation += 1
+
+    def __new_node(self, value: T) -> __Node[T]:
+        node = self.__allocate_node(value)
+        if self.__value_index is not None:
+            self.__value_index.setdefault(value, {})[node] = None
+        return node
+
+    def __allocate_node(self, value: T) -> __Node[T]:
+        node = None
+        if self.__pool is not None:
+            node = self.__pool.acquire()
+            if node is not None:
+                node.value = value
+        if node is None:
+            node = self.__Node(value)
+        return node
+
+    def __handle(self, node: __Node[T]) -> DoubleLinkedListHandle[T] | None:
+        if not self.__handles:
+            return None
+        return DoubleLinkedListHandle(self, node, self.__handle_epoch)
+
+    def __release_node(self, node: __Node[T]) -> None:
+        if self.__value_index is not None:
+            self.__unindex(node)
+        if self.__handles:
+            # marks the node as removed for its handles
+            node.next, node.prev = None, node
+        if self.__pool is not None:
+            self.__recycle(node)
+
+    def __recycle(self, node: __Node[T]) -> None:
+        node.value = None
+        node.next = node.prev = None
+        self.__pool.release(node)
+
+    def __drain_chain(
+            self, node: __Node[T] | None, forward: bool
+    ) -> Iterator[T]:
+        while node is not None:
+            following = node.next if forward else node.prev
+            value = node.value
+            if self.__pool is not None:
+                self.__recycle(node)
+            yield value
+            node = following
+
+    def __build_chain(
+            self, values: Iterable[T]
+    ) -> tuple[__Node[T] | None, __Node[T] | None, int]:
+        # link the new nodes among themselves first, so the caller attaches
+        # the whole chain with a single head/tail/length update; the chain
+        # is indexed only once complete, so a source that fails partway
+        # leaves the index as it was
+        first, last, count = self.__link_chain(values)
+        self.__index_chain(first)
+        return first, last, count
+
+    def __link_chain(
+            self, values: Iterable[T]
+    ) -> tuple[__Node[T] | None, __Node[T] | None, int]:
+        new_node = self.__Node if self.__pool is None else self.__allocate_node
+
+        if isinstance(values, DoubleLinkedList):
+            count = values.__length
+            if count == 0:
+                return None, None, 0
+
+            source = values.__head
+            first = last = new_node(source.value)
+            for _ in range(count - 1):
+                source = source.next
+                node = new_node(source.value)
+                node.prev = last
+                last.next = node
+                last = node
+            return first, last, count
+
+        iterator = iter(values)
+        first = last = None
+        for value in iterator:
+            first = last = new_node(value)
+            break
+        if first is None:
+            return None, None, 0
+
+        if isinstance(values, (list, tuple)):
+            for value in iterator:
+                node = new_node(value)
+                node.prev = last
+                last.next = node
+                last = node
+            return first, last, len(values)
+
+        count = 1
+        for value in iterator:
+            node = new_node(value)
+            node.prev = last
+            last.next = node
+            last = node
+            count += 1
+        return first, last, count
+
+    def __empty_like(self) -> "DoubleLinkedList[T]":
+        pool_size = 0 if self.__pool is None else self.__pool.max_size
+        return type(self)(
+            node_pool_size=pool_size,
+            index_values=self.__value_index is not None,
+            handles=self.__handles,
+        )
+
+    def __check_other(self, other: "DoubleLinkedList[T]") -> None:
+        if not isinstance(other, DoubleLinkedList):
+            raise TypeError("Can only relink nodes of another DoubleLinkedList")
+        if other is self:
+            raise ValueError("Cannot relink a list into itself")
+
+    def __take_all(self) -> tuple[__Node[T] | None, __Node[T] | None, int]:
+        taken = self.__head, self.__tail, self.__length
+        self.__head = self.__tail = None
+        self.__length = 0
+        self.__modifications += 1
+        self.__finger_node = None
+        if self.__value_index is not None:
+            self.__value_index = {}
+        self.__handle_epoch += 1
+        return taken
+
+    def __unlink(self, node: __Node[T]) -> None:
+        prev_node, next_node = node.prev, node.next
+        if prev_node is None:
+            self.__head = next_node
         else:
-            i = self.__length
+            prev_node.next = next_node
+        if next_node is None:
+            self.__tail = prev_node
+        else:
+            next_node.prev = prev_node
+        node.next = node.prev = None
+        self.__length -= 1
+
+    def __bucket(self, value: object) -> dict[__Node[T], None] | None:
+        try:
+            return self.__value_index.get(value)
+        except TypeError:
+            # unhashable values can never have been indexed
+            return None
+
+    def __first_indexed(self, value: T) -> __Node[T] | None:
+        bucket = self.__bucket(value)
+        if bucket is None:
+            return None
+        if len(bucket) == 1:
+            return next(iter(bucket))
+
+        # duplicates: the one closest to the head is the first occurrence
+        node = self.__head
+        while node not in bucket:
+            node = node.next
+        return node
+
+    def __unindex(self, node: __Node[T]) -> None:
+        bucket = self.__value_index[node.value]
+        del bucket[node]
+        if not bucket:
+            del self.__value_index[node.value]
+
+    def __index_chain(self, node: __Node[T] | None) -> None:
+        if self.__value_index is None:
+            return
+        first = node
+        try:
+            while node is not None:
+                self.__value_index.setdefault(node.value, {})[node] = None
+                node = node.next
+        except TypeError:
+            # an unhashable value: take back the nodes indexed before it
+            while first is not node:
+                self.__unindex(first)
+                first = first.next
+            raise
+
+    def __unindex_chain(self, node: __Node[T] | None) -> None:
+        if self.__value_index is None:
+            return
+        while node is not None:
+            self.__unindex(node)
+            node = node.next
+
+    def __node_at(self, index: int) -> __Node[T]:
+        node = self.__head
+        steps = index
+        if self.__length - 1 - index < steps:
             node = self.__tail
-            while i != index:
+            steps = index - (self.__length - 1)
+        if self.__finger_node is not None:
+            from_finger = index - self.__finger_index
+            if abs(from_finger) < abs(steps):
+                node = self.__finger_node
+                steps = from_finger
+
+        if steps > 0:
+            for _ in range(steps):
+                node = node.next
+        else:
+            for _ in range(-steps):
                 node = node.prev
-                i -= 1
-            return node.value
+        self.__finger_index, self.__finger_node = index, node
+        return node
 
-        return None
+    def __normalize_index(self, key: int) -> int:
+        index = as_index(key)
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of bounds")
+        return index
+
+    @staticmethod
+    def __advance(node: __Node[T], steps: int) -> __Node[T]:
+        if steps > 0:
+            for _ in range(steps):
+                node = node.next
+        else:
+            for _ in range(-steps):
+                node = node.prev
+        return node
+
+    def __set_value(self, node: __Node[T], value: T) -> None:
+        if self.__value_index is None:
+            node.value = value
+            return
+
+        self.__unindex(node)
+        node.value = value
+        self.__value_index.setdefault(value, {})[node] = None
+
+    def __copy_positions(self, positions: range) -> "DoubleLinkedList[T]":
+        # one walk from the closest known node, copying straight into the
+        # chain of the new list
+        result = self.__empty_like()
+        if not positions:
+            return result
+
+        new_node = result.__new_node
+        node = self.__node_at(positions[0])
+        first = last = new_node(node.value)
+        for _ in range(len(positions) - 1):
+            node = self.__advance(node, positions.step)
+            copy = new_node(node.value)
+            copy.prev = last
+            last.next = copy
+            last = copy
+
+        result.__head, result.__tail = first, last
+        result.__length = len(positions)
+        return result
+
+    def __assign_positions(self, positions: range, values: Iterable[T]) -> None:
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        if len(values) != len(positions):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(values)} "
+                f"to extended slice of size {len(positions)}"
+            )
+        if not positions:
+            return
+
+        node = self.__node_at(positions[0])
+        self.__set_value(node, values[0])
+        for value in values[1:]:
+            node = self.__advance(node, positions.step)
+            self.__set_value(node, value)
+
+    def __replace_segment(self, start: int, stop: int, values: Iterable[T]) -> None:
+        # the replacement chain is built first, so assigning a list to a
+        # slice of itself copies the old values
+        first, last, count = self.__build_chain(values)
+        self.__modifications += 1
+
+        if start == self.__length:
+            prev_node, after = self.__tail, None
+        else:
+            node = self.__node_at(start)
+            prev_node = node.prev
+            for _ in range(stop - start):
+                following = node.next
+                self.__release_node(node)
+                node = following
+            after = node
+
+        if count == 0:
+            first, last = after, prev_node
+        else:
+            first.prev = prev_node
+            last.next = after
+        if prev_node is None:
+            self.__head = first
+        else:
+            prev_node.next = first
+        if after is None:
+            self.__tail = last
+        else:
+            after.prev = last
+
+        self.__length += count - (stop - start)
+        self.__finger_node = None
+
+    def __delete_positions(self, positions: range) -> None:
+        if not positions:
+            return
+
+        self.__modifications += 1
+        node = self.__node_at(positions.start)
+        for remaining in range(len(positions) - 1, -1, -1):
+            following = self.__advance(node, positions.step) if remaining else None
+            self.__unlink(node)
+            self.__release_node(node)
+            node = following
+        self.__finger_node = None
+
+    @staticmethod
+    def __merge_sort(
+            head: __Node[T], precedes: Callable[[T, T], bool]
+    ) -> tuple[__Node[T], __Node[T]]:
+        # Bottom-up merge sort over the next links: each pass merges
+        # neighbouring runs of `width` nodes, doubling the width until one
+        # pass does a single merge. The right run's node goes first only
+        # when it strictly precedes, which keeps the sort stable.
+        width = 1
+        while True:
+            left = head
+            head = tail = None
+            merges = 0
+            while left is not None:
+                merges += 1
+                right = left
+                left_size = 0
+                while left_size < width and right is not None:
+                    left_size += 1
+                    right = right.next
+                right_size = width
+
+                while left_size and right_size and right is not None:
+                    if precedes(right.value, left.value):
+                        node, right = right, right.next
+                        right_size -= 1
+                    else:
+                        node, left = left, left.next
+                        left_size -= 1
+                    if tail is None:
+                        head = node
+                    else:
+                        tail.next = node
+                    tail = node
+
+                # one run is used up: attach the rest of the other as is
+                # and move on to its last node
+                rest = left if left_size else right
+                if left_size or (right_size and right is not None):
+                    if tail is None:
+                        head = rest
+                    else:
+                        tail.next = rest
+                    tail = rest
+                if left_size:
+                    for _ in range(left_size - 1):
+                        tail = tail.next
+                elif right_size and right is not None:
+                    right = right.next
+                    right_size -= 1
+                    while right_size and right is not None:
+                        tail, right = right, right.next
+                        right_size -= 1
+                left = right
+
+            tail.next = None
+            if merges == 1:
+                return head, tail
+            width *= 2
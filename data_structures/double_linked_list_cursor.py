@@ -0,0 +1,113 @@
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from data_structures.double_linked_list import DoubleLinkedList
+
+T = TypeVar("T")
+
+
+class DoubleLinkedListCursor(Generic[T]):
+    # A position in a DoubleLinkedList. After the tail sits an end position
+    # at index len(list): moving forward from it wraps to the head and
+    # moving backward wraps to the tail. Every edit made through the cursor
+    # is O(1); a structural change made through anything else invalidates
+    # it, and using it afterwards raises RuntimeError, as iterators do.
+    # When the list moves to a fresh copy of its nodes (see snapshot()),
+    # the cursor finds its position again by index.
+    __list: "DoubleLinkedList[T]"
+    __node: Any
+    __index: int
+    __generation: int
+    __modifications: int
+
+    def __init__(self, owner: "DoubleLinkedList[T]", node: Any, index: int):
+        self.__list = owner
+        self.__node = node
+        self.__index = index
+        self.__generation = owner._generation
+        self.__modifications = owner._modifications
+
+    @property
+    def index(self) -> int:
+        return self.__index
+
+    @property
+    def at_end(self) -> bool:
+        self.__sync()
+        return self.__node is None
+
+    @property
+    def value(self) -> T:
+        self.__sync()
+        self.__check_node()
+        return self.__node.value
+
+    def move_next(self) -> None:
+        self.__sync()
+        if self.__node is None:
+            self.__node = self.__list._first_node()
+            self.__index = 0
+        else:
+            self.__node = self.__node.next
+            self.__index += 1
+
+    def move_prev(self) -> None:
+        self.__sync()
+        if self.__node is None:
+            self.__node = self.__list._last_node()
+            self.__index = len(self.__list) - 1
+        else:
+            self.__node = self.__node.prev
+            self.__index -= 1
+            if self.__node is None:
+                self.__index = len(self.__list)
+
+    def insert_before(self, value: T) -> None:
+        # at the end position this appends
+        self.__sync(writing=True)
+        self.__list._insert_before_node(self.__node, value)
+        self.__index += 1
+        self.__record()
+
+    def insert_after(self, value: T) -> None:
+        # at the end position this prepends
+        self.__sync(writing=True)
+        if self.__node is None:
+            self.__list._insert_before_node(self.__list._first_node(), value)
+            self.__index += 1
+        else:
+            self.__list._insert_before_node(self.__node.next, value)
+        self.__record()
+
+    def remove_current(self) -> T:
+        # the cursor moves on to the following node
+        self.__sync(writing=True)
+        self.__check_node()
+        node = self.__node
+        self.__node = node.next
+        value = self.__list._remove_node(node)
+        self.__record()
+        return value
+
+    def replace(self, value: T) -> T:
+        self.__sync(writing=True)
+        self.__check_node()
+        return self.__list._replace_node_value(self.__node, value)
+
+    def __sync(self, writing: bool = False) -> None:
+        owner = self.__list
+        if owner._modifications != self.__modifications:
+            raise RuntimeError("List changed outside the cursor")
+        if writing:
+            owner._prepare_write()
+        if owner._generation != self.__generation:
+            self.__node = owner._node_at(self.__index)
+            self.__generation = owner._generation
+
+    def __record(self) -> None:
+        # the cursor's own edits keep it valid
+        self.__modifications = self.__list._modifications
+
+    def __check_node(self) -> None:
+        if self.__node is None:
+            raise IndexError("Cursor is at the end of the list")
@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from data_structures.double_linked_list import DoubleLinkedList
+
+T = TypeVar("T")
+
+
+class DoubleLinkedListHandle(Generic[T]):
+    # Opaque reference to one node of a DoubleLinkedList created with
+    # handles=True, returned by append, prepend, insert and insert_after.
+    # A handle stays valid while its node is in the list, across any
+    # number of other edits and moves. It goes stale once its node is
+    # removed, and, conservatively, for every node of a list whose nodes
+    # were handed to or taken from another list (concat, splice, split_at,
+    # drain). Using a stale handle raises ValueError.
+    __slots__ = ("__owner", "__node", "__epoch")
+    __owner: "DoubleLinkedList[T]"
+    __node: Any
+    __epoch: int
+
+    def __init__(self, owner: "DoubleLinkedList[T]", node: Any, epoch: int):
+        self.__owner = owner
+        self.__node = node
+        self.__epoch = epoch
+
+    @property
+    def valid(self) -> bool:
+        # released nodes point back at themselves
+        return (
+            self.__node.prev is not self.__node
+            and self.__epoch == self.__owner._handle_epoch
+        )
+
+    @property
+    def value(self) -> T:
+        return self._node_for(self.__owner).value
+
+    def _node_for(self, owner: "DoubleLinkedList[T]") -> Any:
+        if owner is not self.__owner:
+            raise ValueError("Handle belongs to another list")
+        if not self.valid:
+            raise ValueError("Handle is stale")
+        return self.__node
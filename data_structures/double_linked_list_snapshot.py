@@ -0,0 +1,56 @@
+from typing import Any, Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class DoubleLinkedListSnapshot(Generic[T]):
+    # Read-only view of a DoubleLinkedList at one point in time. It keeps
+    # the first and last node and the length, and only ever walks `length`
+    # links, so nodes the list later appends or prepends stay invisible.
+    __head: Any
+    __tail: Any
+    __length: int
+
+    def __init__(self, head: Any, tail: Any, length: int):
+        self.__head = head
+        self.__tail = tail
+        self.__length = length
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[T]:
+        node = self.__head
+        for _ in range(self.__length):
+            yield node.value
+            node = node.next
+
+    def __reversed__(self) -> Iterator[T]:
+        node = self.__tail
+        for _ in range(self.__length):
+            yield node.value
+            node = node.prev
+
+    def __contains__(self, value: object) -> bool:
+        return self.index_of(value) is not None
+
+    def index_of(self, value: T) -> int | None:
+        for i, v in enumerate(self):
+            if v == value:
+                return i
+        return None
+
+    def get(self, index: int) -> T:
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of bounds")
+
+        # walk from the nearer end
+        if index < self.__length // 2:
+            node = self.__head
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self.__tail
+            for _ in range(self.__length - 1 - index):
+                node = node.prev
+        return node.value
@@ -0,0 +1,181 @@
+from random import Random
+from typing import Generic, Iterator, Self, TypeVar
+
+from data_structures.list_view import ListView
+
+T = TypeVar("T")
+
+MAX_LEVEL = 32
+
+
+class IndexableSkipList(Generic[T]):
+    # Positions are counted from the head sentinel (position 0), so the
+    # element at index i sits at position i + 1. width[level] is the number
+    # of positions skipped by next[level]; it is meaningless when the link
+    # is None and is never read in that case.
+    # noinspection PyTypeHints
+    class __Node(Generic[T]):
+        __slots__ = ("value", "next", "width")
+        value: T | None
+        next: list[Self | None]
+        width: list[int]
+
+        def __init__(self, value: T | None, level: int):
+            self.value = value
+            self.next = [None] * level
+            self.width = [0] * level
+
+    __head: __Node[T]
+    __levels: int
+    __length: int
+    __random: Random
+
+    def __init__(self, seed: int | None = None):
+        self.__head = self.__Node(None, MAX_LEVEL)
+        self.__levels = 1
+        self.__length = 0
+        self.__random = Random(seed)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[T]:
+        node = self.__head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def append(self, value: T) -> None:
+        self.__insert_at(self.__length, value)
+
+    def prepend(self, value: T) -> None:
+        self.__insert_at(0, value)
+
+    def extend(self, values: Iterator[T]) -> None:
+        for value in values:
+            self.__insert_at(self.__length, value)
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        self.__insert_at(index, value)
+
+    def remove(self, value: T) -> bool:
+        index = self.index_of(value)
+        if index is None:
+            return False
+
+        self.__delete_at(index)
+        return True
+
+    def pop_front(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        return self.__delete_at(0)
+
+    def pop_back(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        return self.__delete_at(self.__length - 1)
+
+    def index_of(self, value: T) -> int | None:
+        i = 0
+        for v in self:
+            if v == value:
+                return i
+            i += 1
+        return None
+
+    def get(self, index: int) -> T:
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of bounds")
+
+        position = index + 1
+        node = self.__head
+        for level in reversed(range(self.__levels)):
+            while (
+                    node.next[level] is not None
+                    and node.width[level] <= position
+            ):
+                position -= node.width[level]
+                node = node.next[level]
+            if position == 0:
+                break
+        return node.value
+
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def __find_predecessors(
+            self, index: int
+    ) -> tuple[list[__Node[T]], list[int]]:
+        # for every level, the last node positioned before index + 1
+        predecessors = [self.__head] * MAX_LEVEL
+        positions = [0] * MAX_LEVEL
+        node = self.__head
+        position = 0
+        for level in reversed(range(self.__levels)):
+            while (
+                    node.next[level] is not None
+                    and position + node.width[level] <= index
+            ):
+                position += node.width[level]
+                node = node.next[level]
+            predecessors[level] = node
+            positions[level] = position
+        return predecessors, positions
+
+    def __insert_at(self, index: int, value: T) -> None:
+        predecessors, positions = self.__find_predecessors(index)
+        level = self.__random_level()
+        new_node = self.__Node(value, level)
+        position = index + 1
+
+        for i in range(level):
+            prev_node = predecessors[i]
+            next_node = prev_node.next[i]
+            new_node.next[i] = next_node
+            if next_node is not None:
+                new_node.width[i] = (
+                        positions[i] + prev_node.width[i] + 1 - position
+                )
+            prev_node.next[i] = new_node
+            prev_node.width[i] = position - positions[i]
+
+        for i in range(level, self.__levels):
+            if predecessors[i].next[i] is not None:
+                predecessors[i].width[i] += 1
+
+        self.__levels = max(self.__levels, level)
+        self.__length += 1
+
+    def __delete_at(self, index: int) -> T:
+        predecessors, _ = self.__find_predecessors(index)
+        target = predecessors[0].next[0]
+
+        for i in range(self.__levels):
+            prev_node = predecessors[i]
+            if prev_node.next[i] is target:
+                prev_node.next[i] = target.next[i]
+                if target.next[i] is not None:
+                    prev_node.width[i] += target.width[i] - 1
+            elif prev_node.next[i] is not None:
+                prev_node.width[i] -= 1
+
+        head = self.__head
+        while self.__levels > 1 and head.next[self.__levels - 1] is None:
+            self.__levels -= 1
+        self.__length -= 1
+        return target.value
+
+    def __random_level(self) -> int:
+        # geometric distribution with p = 1/2, capped at MAX_LEVEL
+        level = 1
+        bits = self.__random.getrandbits(MAX_LEVEL - 1)
+        while bits & 1:
+            level += 1
+            bits >>= 1
+        return level
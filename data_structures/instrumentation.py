@@ -0,0 +1,287 @@
+from functools import wraps
+from inspect import isgeneratorfunction
+from types import FunctionType, GeneratorType
+from typing import Any, Callable, Iterator, TypeVar
+
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.linked_list import LinkedList
+
+T = TypeVar("T")
+
+# dunder methods that are part of the public surface and get instrumented
+INSTRUMENTED_DUNDERS = frozenset({
+    "__iter__", "__reversed__", "__len__", "__contains__",
+    "__getitem__", "__setitem__", "__delitem__",
+})
+
+# methods whose first argument is searched for by equality
+SEARCH_METHODS = frozenset({"remove", "index_of", "__contains__"})
+
+# methods that order values with <, optionally through a key function
+ORDERING_METHODS = frozenset({"sort"})
+
+
+class MethodCounts:
+    __slots__ = ("calls", "hops", "allocations", "comparisons")
+
+    def __init__(self):
+        self.calls = self.hops = self.allocations = self.comparisons = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"MethodCounts(calls={self.calls}, hops={self.hops}, "
+            f"allocations={self.allocations}, comparisons={self.comparisons})"
+        )
+
+
+class OperationCounts:
+    # Raw counters are bumped by the counting nodes and comparison probes;
+    # every outermost public call attributes its delta to `per_method` and
+    # keeps it in `last`. Calls nested inside another public call (insert
+    # delegating to append, say) are attributed to the outer call only.
+    # Iterators are counted one step at a time, so calls made while an
+    # iterator is open are attributed to themselves.
+    hops: int
+    allocations: int
+    comparisons: int
+    per_method: dict[str, MethodCounts]
+    last: MethodCounts | None
+    __depth: int
+
+    def __init__(self):
+        self.hops = self.allocations = self.comparisons = 0
+        self.per_method = {}
+        self.last = None
+        self.__depth = 0
+
+    def reset(self) -> None:
+        self.hops = self.allocations = self.comparisons = 0
+        self.per_method = {}
+        self.last = None
+
+    def begin(self) -> tuple[int, int, int] | None:
+        self.__depth += 1
+        if self.__depth > 1:
+            return None
+        return self.hops, self.allocations, self.comparisons
+
+    def end(
+            self,
+            name: str,
+            snapshot: tuple[int, int, int] | None,
+            last: MethodCounts | None = None,
+    ) -> MethodCounts | None:
+        # `last` is the record of an earlier step of the same call, which
+        # this step adds to without counting another call
+        self.__depth -= 1
+        if snapshot is None:
+            return last
+
+        total = self.per_method.get(name)
+        if total is None:
+            total = self.per_method[name] = MethodCounts()
+        if last is None:
+            last = MethodCounts()
+            last.calls = 1
+            total.calls += 1
+
+        hops = self.hops - snapshot[0]
+        allocations = self.allocations - snapshot[1]
+        comparisons = self.comparisons - snapshot[2]
+        last.hops += hops
+        last.allocations += allocations
+        last.comparisons += comparisons
+        total.hops += hops
+        total.allocations += allocations
+        total.comparisons += comparisons
+        self.last = last
+        return last
+
+
+class _ComparisonProbe:
+    # Stands in for a searched value. Stored values such as ints and strs
+    # return NotImplemented when compared with a foreign type, so Python
+    # falls back to the probe's reflected __eq__, which counts and delegates.
+    __slots__ = ("value", "counts")
+
+    def __init__(self, value: Any, counts: OperationCounts):
+        self.value = value
+        self.counts = counts
+
+    def __eq__(self, other: object) -> bool:
+        self.counts.comparisons += 1
+        return other == self.value
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.value, name)
+
+
+class _OrderingProbe:
+    # Wraps the sort key of one value, so each < the sort makes between two
+    # probes is counted once.
+    __slots__ = ("value", "counts")
+
+    def __init__(self, value: Any, counts: OperationCounts):
+        self.value = value
+        self.counts = counts
+
+    def __lt__(self, other: "_OrderingProbe") -> bool:
+        self.counts.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other: "_OrderingProbe") -> bool:
+        self.counts.comparisons += 1
+        return self.value > other.value
+
+
+def _probe_sort_key(
+        counts: OperationCounts, args: tuple, kwargs: dict[str, Any]
+) -> tuple[tuple, dict[str, Any]]:
+    # key is sort's first parameter, passed by position or by name
+    key = args[0] if args else kwargs.get("key")
+
+    if key is None:
+        def probed(value: Any) -> _OrderingProbe:
+            return _OrderingProbe(value, counts)
+    else:
+        def probed(value: Any) -> _OrderingProbe:
+            return _OrderingProbe(key(value), counts)
+
+    if args:
+        return (probed,) + args[1:], kwargs
+    return args, {**kwargs, "key": probed}
+
+
+def _counting_node_class(counts: OperationCounts, doubly: bool) -> type:
+    # link reads count as hops; allocations are counted on construction, so
+    # nodes handed back out by a node pool do not count
+    class CountingNode:
+        __slots__ = ("value", "_next", "_prev") if doubly else ("value", "_next")
+
+        def __init__(self, value: Any):
+            self.value = value
+            self._next = None
+            if doubly:
+                self._prev = None
+            counts.allocations += 1
+
+        @property
+        def next(self) -> Any:
+            counts.hops += 1
+            return self._next
+
+        @next.setter
+        def next(self, node: Any) -> None:
+            self._next = node
+
+        if doubly:
+            @property
+            def prev(self) -> Any:
+                counts.hops += 1
+                return self._prev
+
+            @prev.setter
+            def prev(self, node: Any) -> None:
+                self._prev = node
+
+    return CountingNode
+
+
+def _counted_steps(
+        name: str,
+        counts: OperationCounts,
+        iterator: Iterator[Any],
+        last: MethodCounts | None,
+) -> Iterator[Any]:
+    # counts around each step only, never across a yield
+    while True:
+        snapshot = counts.begin()
+        try:
+            value = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            last = counts.end(name, snapshot, last)
+        yield value
+
+
+def _instrument(name: str, method: Callable) -> Callable:
+    if isgeneratorfunction(method):
+        @wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            # creating the generator runs none of its body
+            iterator = method(self, *args, **kwargs)
+            return _counted_steps(name, self.operation_counts, iterator, None)
+
+        return generator_wrapper
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        counts = self.operation_counts
+        snapshot = counts.begin()
+        try:
+            if snapshot is not None and name in SEARCH_METHODS and args:
+                args = (_ComparisonProbe(args[0], counts),) + args[1:]
+            elif snapshot is not None and name in ORDERING_METHODS:
+                args, kwargs = _probe_sort_key(counts, args, kwargs)
+            result = method(self, *args, **kwargs)
+        finally:
+            last = counts.end(name, snapshot)
+        if isinstance(result, GeneratorType):
+            # lazy results such as drain() do their work while consumed
+            return _counted_steps(name, counts, result, last)
+        return result
+
+    return wrapper
+
+
+def _instrument_methods(cls: type, base: type) -> None:
+    for name, attribute in vars(base).items():
+        if not isinstance(attribute, FunctionType):
+            continue
+        if name.startswith("_") and name not in INSTRUMENTED_DUNDERS:
+            continue
+        setattr(cls, name, _instrument(name, attribute))
+
+
+class InstrumentedLinkedList(LinkedList[T]):
+    __counts: OperationCounts
+
+    def __init__(self, node_pool_size: int = 0, index_values: bool = False):
+        self.__counts = OperationCounts()
+        # shadows the private node class the base class allocates from
+        self._LinkedList__Node = _counting_node_class(self.__counts, False)
+        super().__init__(node_pool_size, index_values)
+
+    @property
+    def operation_counts(self) -> OperationCounts:
+        return self.__counts
+
+
+class InstrumentedDoubleLinkedList(DoubleLinkedList[T]):
+    __counts: OperationCounts
+
+    def __init__(
+            self,
+            node_pool_size: int = 0,
+            index_values: bool = False,
+            handles: bool = False,
+    ):
+        self.__counts = OperationCounts()
+        # shadows the private node class the base class allocates from
+        self._DoubleLinkedList__Node = _counting_node_class(self.__counts, True)
+        super().__init__(node_pool_size, index_values, handles)
+
+    @property
+    def operation_counts(self) -> OperationCounts:
+        return self.__counts
+
+
+_instrument_methods(InstrumentedLinkedList, LinkedList)
+_instrument_methods(InstrumentedDoubleLinkedList, DoubleLinkedList)
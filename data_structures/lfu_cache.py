@@ -0,0 +1,199 @@
+from typing import Any, Callable, Generic, Hashable, Iterator, TypeVar
+
+from data_structures.cache_stats import CacheStats
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.double_linked_list_handle import DoubleLinkedListHandle
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LFUCache(Generic[K, V]):
+    # Least frequently used cache with O(1) operations. Entries with the
+    # same use count share a frequency bucket, a DoubleLinkedList ordered
+    # from most to least recently used; the buckets themselves sit in a
+    # DoubleLinkedList in ascending frequency, and a dict finds the bucket
+    # of a given frequency. A use moves the entry into the bucket for the
+    # next frequency, inserting it after its own when missing, and an
+    # eviction takes the least recently used entry of the first bucket.
+    # Capacity works as in LRUCache.
+    # noinspection PyTypeHints
+    class __Bucket:
+        __slots__ = ("frequency", "entries", "handle")
+        frequency: int
+        entries: DoubleLinkedList
+        # the bucket's handle in __buckets
+        handle: DoubleLinkedListHandle | None
+
+        def __init__(self, frequency: int):
+            self.frequency = frequency
+            self.entries = DoubleLinkedList(handles=True)
+            self.handle = None
+
+    # noinspection PyTypeHints
+    class __Entry(Generic[K, V]):
+        __slots__ = ("key", "value", "size", "bucket", "handle")
+        key: K
+        value: V
+        size: int
+        # the bucket holding the entry, and the entry's handle in it
+        bucket: Any
+        handle: DoubleLinkedListHandle | None
+
+        def __init__(self, key: K, value: V, size: int):
+            self.key = key
+            self.value = value
+            self.size = size
+            self.bucket = self.handle = None
+
+    __entries: dict[K, __Entry[K, V]]
+    __buckets: DoubleLinkedList[__Bucket]
+    __by_frequency: dict[int, __Bucket]
+    __capacity: int
+    __size_of: Callable[[V], int] | None
+    __size: int
+    __stats: CacheStats
+
+    def __init__(self, capacity: int, size_of: Callable[[V], int] | None = None):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.__entries = {}
+        self.__buckets = DoubleLinkedList(handles=True)
+        self.__by_frequency = {}
+        self.__capacity = capacity
+        self.__size_of = size_of
+        self.__size = 0
+        self.__stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: object) -> bool:
+        # does not count as a use
+        return key in self.__entries
+
+    def __iter__(self) -> Iterator[K]:
+        # keys in reverse eviction order: most frequently used first, and
+        # most recently used first within one frequency
+        for bucket in reversed(self.__buckets):
+            for entry in bucket.entries:
+                yield entry.key
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.__stats
+
+    def frequency(self, key: K) -> int:
+        # 0 for keys that are not cached
+        entry = self.__entries.get(key)
+        return 0 if entry is None else entry.bucket.frequency
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.__stats.misses += 1
+            return default
+
+        self.__stats.hits += 1
+        self.__touch(entry)
+        return entry.value
+
+    def put(self, key: K, value: V) -> None:
+        size = 1 if self.__size_of is None else self.__size_of(value)
+        if size > self.__capacity:
+            # it would flush the whole cache and still not fit
+            self.remove(key)
+            return
+
+        entry = self.__entries.get(key)
+        if entry is None:
+            # make room first, so the new entry is never its own victim
+            while self.__size + size > self.__capacity:
+                self.__evict(None)
+            entry = self.__entries[key] = self.__Entry(key, value, size)
+            bucket = self.__by_frequency.get(1)
+            if bucket is None:
+                bucket = self.__new_bucket(1, None)
+            self.__link(entry, bucket)
+            self.__size += size
+            return
+
+        self.__size += size - entry.size
+        entry.value, entry.size = value, size
+        self.__touch(entry)
+        while self.__size > self.__capacity:
+            self.__evict(entry)
+
+    def remove(self, key: K) -> bool:
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return False
+
+        self.__unlink(entry)
+        self.__size -= entry.size
+        return True
+
+    def clear(self) -> None:
+        self.__entries = {}
+        self.__buckets = DoubleLinkedList(handles=True)
+        self.__by_frequency = {}
+        self.__size = 0
+
+    def __new_bucket(self, frequency: int, before: __Bucket | None) -> __Bucket:
+        # the bucket for frequency, placed after `before` or first
+        bucket = self.__by_frequency[frequency] = self.__Bucket(frequency)
+        if before is None:
+            bucket.handle = self.__buckets.prepend(bucket)
+        else:
+            bucket.handle = self.__buckets.insert_after(before.handle, bucket)
+        return bucket
+
+    def __link(self, entry: __Entry[K, V], bucket: __Bucket) -> None:
+        entry.handle = bucket.entries.prepend(entry)
+        entry.bucket = bucket
+
+    def __unlink(self, entry: __Entry[K, V]) -> None:
+        # drops the entry from its bucket, and the bucket once it is empty
+        bucket = entry.bucket
+        bucket.entries.remove_handle(entry.handle)
+        if not len(bucket.entries):
+            self.__buckets.remove_handle(bucket.handle)
+            del self.__by_frequency[bucket.frequency]
+        entry.bucket = entry.handle = None
+
+    def __touch(self, entry: __Entry[K, V]) -> None:
+        frequency = entry.bucket.frequency + 1
+        bucket = self.__by_frequency.get(frequency)
+        if bucket is None and len(entry.bucket.entries) == 1:
+            # a lone entry takes its bucket along to the next frequency
+            bucket = entry.bucket
+            del self.__by_frequency[bucket.frequency]
+            bucket.frequency = frequency
+            self.__by_frequency[frequency] = bucket
+            return
+        if bucket is None:
+            bucket = self.__new_bucket(frequency, entry.bucket)
+        self.__unlink(entry)
+        self.__link(entry, bucket)
+
+    def __evict(self, keep: __Entry[K, V] | None) -> None:
+        # the least recently used entry of the lowest bucket, passing over
+        # `keep`; keep is the most recently used of its bucket, so it is
+        # last only when alone there
+        buckets = self.__buckets
+        entry = buckets[0].entries[-1]
+        if entry is keep:
+            entry = buckets[1].entries[-1]
+        del self.__entries[entry.key]
+        self.__unlink(entry)
+        self.__size -= entry.size
+        self.__stats.evictions += 1
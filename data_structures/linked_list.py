@@ -1,4 +1,10 @@
-from typing import Generic, Iterator, Self, TypeVar
+from operator import gt, index as as_index, lt
+from typing import Any, BinaryIO, Callable, Generic, Iterable, Iterator, Self, TypeVar
+
+from data_structures.list_view import ListView
+from data_structures.node_pool import NodePool
+from data_structures.parallel import map_segments, reduce_segments
+from data_structures.serialization import dump_values, load_values
 
 T = TypeVar("T")
 
@@ -17,22 +23,81 @@ class LinkedList(Generic[T]):
     __head: __Node[T] | None
     __tail: __Node[T] | None
     __length: int
-
-    def __init__(self):
+    __pool: NodePool[__Node[T]] | None
+    # last position resolved by __node_at; forward walks to an index at or
+    # after the finger start from it instead of from the head
+    __finger_index: int
+    __finger_node: __Node[T] | None
+    # optional value -> nodes holding it, in insertion order
+    __value_index: dict[T, dict[__Node[T], None]] | None
+
+    def __init__(self, node_pool_size: int = 0, index_values: bool = False):
         self.__head = self.__tail = None
         self.__length = 0
+        self.__pool = NodePool(node_pool_size) if node_pool_size > 0 else None
+        self.__finger_index = 0
+        self.__finger_node = None
+        self.__value_index = {} if index_values else None
 
     def __len__(self) -> int:
         return self.__length
 
+    def __contains__(self, value: object) -> bool:
+        if self.__value_index is not None:
+            return self.__bucket(value) is not None
+        return self.index_of(value) is not None
+
     def __iter__(self) -> Iterator[T]:
         current = self.__head
         while current is not None:
             yield current.value
             current = current.next
 
+    def __getitem__(self, key: int | slice) -> "T | LinkedList[T]":
+        if isinstance(key, slice):
+            return self.__copy_positions(range(*key.indices(self.__length)))
+        return self.__node_at(self.__normalize_index(key)).value
+
+    def __setitem__(self, key: int | slice, value: T | Iterable[T]) -> None:
+        if isinstance(key, slice):
+            positions = range(*key.indices(self.__length))
+            if positions.step == 1:
+                stop = max(positions.start, positions.stop)
+                self.__replace_segment(positions.start, stop, value)
+            else:
+                self.__assign_positions(positions, value)
+            return
+
+        self.__set_value(self.__node_at(self.__normalize_index(key)), value)
+
+    def __delitem__(self, key: int | slice) -> None:
+        if isinstance(key, slice):
+            positions = range(*key.indices(self.__length))
+            self.__delete_positions(
+                positions if positions.step > 0 else positions[::-1]
+            )
+            return
+
+        index = self.__normalize_index(key)
+        self.__delete_positions(range(index, index + 1))
+
+    def __reduce__(self) -> tuple:
+        # pickle as a flat value sequence that is streamed back through
+        # extend, rather than recursing through the node links
+        pool_size = 0 if self.__pool is None else self.__pool.max_size
+        return (
+            type(self),
+            (pool_size, self.__value_index is not None),
+            None,
+            iter(self),
+        )
+
+    @property
+    def node_pool(self) -> NodePool[__Node[T]] | None:
+        return self.__pool
+
     def append(self, value: T) -> None:
-        new_node = self.__Node(value)
+        new_node = self.__new_node(value)
         if self.__head is None:
             self.__head = self.__tail = new_node
         else:
@@ -41,7 +106,7 @@ class LinkedList(Generic[T]):
         self.__length += 1
 
     def prepend(self, value: T) -> None:
-        new_node = self.__Node(value)
+        new_node = self.__new_node(value)
         if self.__length == 0:
             self.__head = self.__tail = new_node
         else:
@@ -50,10 +115,32 @@ class LinkedList(Generic[T]):
             self.__head = new_node
 
         self.__length += 1
+        self.__finger_index += 1
 
-    def extend(self, values: Iterator[T]) -> None:
-        for i in values:
-            self.append(i)
+    def extend(self, values: Iterable[T]) -> None:
+        first, last, count = self.__build_chain(values)
+        if count == 0:
+            return
+
+        if self.__tail is None:
+            self.__head = first
+        else:
+            self.__tail.next = first
+        self.__tail = last
+        self.__length += count
+
+    def prepend_many(self, values: Iterable[T]) -> None:
+        first, last, count = self.__build_chain(values)
+        if count == 0:
+            return
+
+        if self.__head is None:
+            self.__tail = last
+        else:
+            last.next = self.__head
+        self.__head = first
+        self.__length += count
+        self.__finger_index += count
 
     def insert(self, index: int, value: T) -> None:
         if (
@@ -63,28 +150,19 @@ class LinkedList(Generic[T]):
         ):
             raise IndexError("Index out of bounds")
 
-        new_node = self.__Node(value)
-        if self.__head is None:
-            self.__head = self.__tail = new_node
-            self.__length += 1
-            return
-
         if index == 0:
-            new_node.next = self.__head
-            self.__head = new_node
-            self.__length += 1
+            self.prepend(value)
             return
 
-        prev_node = self.__head
-        for _ in range(index - 1):
-            prev_node = prev_node.next
-
+        prev_node = self.__node_at(index - 1)
+        new_node = self.__new_node(value)
         new_node.next = prev_node.next
         prev_node.next = new_node
         if new_node.next is None:
             self.__tail = new_node
 
         self.__length += 1
+        self.__finger_index, self.__finger_node = index, new_node
 
     def remove(self, value: T) -> bool:
         if self.__length == 0 or (
@@ -92,10 +170,23 @@ class LinkedList(Generic[T]):
         ):
             return False
 
+        # with an index, a missing value is rejected without walking and the
+        # walk matches nodes by identity
+        bucket = None
+        if self.__value_index is not None:
+            bucket = self.__bucket(value)
+            if bucket is None:
+                return False
+
         prev_node = None
         current = self.__head
+        index = 0
         while current is not None:
-            if current.value == value:
+            if (
+                    current in bucket
+                    if bucket is not None
+                    else current.value == value
+            ):
                 if prev_node is not None:
                     prev_node.next = current.next  # remove a node from a list
                 else:
@@ -103,10 +194,16 @@ class LinkedList(Generic[T]):
                 if current == self.__tail:
                     self.__tail = prev_node
                 self.__length -= 1
+                if current is self.__finger_node:
+                    self.__finger_node = None
+                elif index < self.__finger_index:
+                    self.__finger_index -= 1
+                self.__release_node(current)
                 return True
 
             prev_node = current
             current = current.next
+            index += 1
 
         return False
 
@@ -115,38 +212,131 @@ class LinkedList(Generic[T]):
             raise IndexError("Pop from empty list")
 
         if self.__head == self.__tail:
-            value_to_return = self.__head.value
+            node_to_remove = self.__head
+            value_to_return = node_to_remove.value
             self.__head = self.__tail = None
             self.__length = 0
+            self.__finger_node = None
+            self.__release_node(node_to_remove)
             return value_to_return
 
         node_to_remove = self.__head
+        value_to_return = node_to_remove.value
         self.__head = node_to_remove.next
         self.__length -= 1
-        return node_to_remove.value
+        if node_to_remove is self.__finger_node:
+            self.__finger_node = None
+        else:
+            self.__finger_index -= 1
+        self.__release_node(node_to_remove)
+        return value_to_return
 
     def pop_back(self) -> T:
         if self.__length == 0:
             raise IndexError("Pop from empty list")
 
         if self.__head == self.__tail:
-            value_to_return = self.__head.value
+            node_to_remove = self.__head
+            value_to_return = node_to_remove.value
             self.__head = self.__tail = None
             self.__length = 0
+            self.__finger_node = None
+            self.__release_node(node_to_remove)
             return value_to_return
 
         # we don't have a reference to the previous node, so we need to iterate
-        prev_node = self.__head
-        while prev_node.next is not self.__tail:
-            prev_node = prev_node.next
+        # (from the finger when it sits before the tail); this also moves the
+        # finger off the node being removed
+        prev_node = self.__node_at(self.__length - 2)
 
-        value_to_return = self.__tail.value
+        node_to_remove = self.__tail
+        value_to_return = node_to_remove.value
         prev_node.next = None
         self.__tail = prev_node
         self.__length -= 1
+        self.__release_node(node_to_remove)
         return value_to_return
 
+    def pop_front_many(self, n: int) -> list[T]:
+        if n < 0:
+            raise ValueError("Count must not be negative")
+
+        count = min(n, self.__length)
+        values = []
+        node = self.__head
+        for _ in range(count):
+            values.append(node.value)
+            next_node = node.next
+            self.__release_node(node)
+            node = next_node
+
+        self.__head = node
+        if node is None:
+            self.__tail = None
+        self.__length -= count
+        if self.__finger_index < count:
+            self.__finger_node = None
+        else:
+            self.__finger_index -= count
+        return values
+
+    def pop_back_many(self, n: int) -> list[T]:
+        if n < 0:
+            raise ValueError("Count must not be negative")
+
+        count = min(n, self.__length)
+        if count == 0:
+            return []
+        if count == self.__length:
+            values = list(self.drain())
+            values.reverse()
+            return values
+
+        # one walk to the new tail, then the detached segment is read forward
+        last_kept = self.__node_at(self.__length - count - 1)
+        values = []
+        node = last_kept.next
+        while node is not None:
+            values.append(node.value)
+            next_node = node.next
+            self.__release_node(node)
+            node = next_node
+        values.reverse()
+
+        last_kept.next = None
+        self.__tail = last_kept
+        self.__length -= count
+        return values
+
+    def drain(self) -> Iterator[T]:
+        # the list is emptied right away; values are produced lazily from
+        # the detached chain
+        head, _, _ = self.__take_all()
+        return self.__drain_chain(head)
+
+    def drain_reversed(self) -> Iterator[T]:
+        head, _, _ = self.__take_all()
+        # reverse the detached chain in place, O(n) once
+        reversed_head = None
+        while head is not None:
+            next_node = head.next
+            head.next = reversed_head
+            reversed_head = head
+            head = next_node
+        return self.__drain_chain(reversed_head)
+
     def index_of(self, value: T) -> int | None:
+        if self.__value_index is not None:
+            bucket = self.__bucket(value)
+            if bucket is None:
+                return None
+            index = 0
+            node = self.__head
+            while node not in bucket:
+                node = node.next
+                index += 1
+            return index
+
         index = 0
         for i in self:
             if i == value:
@@ -155,14 +345,457 @@ class LinkedList(Generic[T]):
 
         return None
 
-    def get(self, index: int) -> T | None:
+    def get(self, index: int) -> T:
         if index < 0 or index >= self.__length:
             raise IndexError("Index out of bounds")
 
-        i = 0
-        for value in self:
-            if i == index:
-                return value
-            i += 1
+        return self.__node_at(index).value
+
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def parallel_map(
+            self, function: Callable[[T], Any], workers: int | None = None
+    ) -> "LinkedList[Any]":
+        # returns a new list with the same configuration; function must be
+        # picklable (see map_segments)
+        result = self.__empty_like()
+        for block in map_segments(self, self.__length, function, workers):
+            result.extend(block)
+        return result
+
+    def parallel_reduce(
+            self, function: Callable[[Any, T], Any], initial: Any,
+            workers: int | None = None,
+    ) -> Any:
+        # function must be associative and initial its identity
+        return reduce_segments(self, self.__length, function, initial, workers)
+
+    def sort(
+            self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> None:
+        # stable like list.sort, but relinks the existing nodes instead of
+        # copying the values out; with a key function, keys are recomputed
+        # per comparison so no per-element key storage is needed
+        if self.__length < 2:
+            return
 
-        return None
+        if key is None:
+            precedes = gt if reverse else lt
+        elif reverse:
+            def precedes(right: T, left: T) -> bool:
+                return key(left) < key(right)
+        else:
+            def precedes(right: T, left: T) -> bool:
+                return key(right) < key(left)
+
+        self.__head, self.__tail = self.__merge_sort(self.__head, precedes)
+        self.__finger_node = None
+
+    def concat(self, other: "LinkedList[T]") -> None:
+        self.__check_other(other)
+        head, tail, length = other.__take_all()
+        if length == 0:
+            return
+
+        self.__index_chain(head)
+        if self.__tail is None:
+            self.__head = head
+        else:
+            self.__tail.next = head
+        self.__tail = tail
+        self.__length += length
+
+    def split_at(self, index: int) -> "LinkedList[T]":
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        result = self.__empty_like()
+        if index == 0:
+            result.__head, result.__tail, result.__length = self.__take_all()
+            result.__index_chain(result.__head)
+            return result
+
+        if index == self.__length:
+            return result
+
+        last_kept = self.__node_at(index - 1)
+        if self.__finger_index >= index:
+            self.__finger_node = None
+        result.__head = last_kept.next
+        result.__tail = self.__tail
+        result.__length = self.__length - index
+        last_kept.next = None
+        self.__unindex_chain(result.__head)
+        result.__index_chain(result.__head)
+        self.__tail = last_kept
+        self.__length = index
+        return result
+
+    def splice(self, index: int, other: "LinkedList[T]") -> None:
+        self.__check_other(other)
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        if index == self.__length:
+            self.concat(other)
+            return
+
+        head, tail, length = other.__take_all()
+        if length == 0:
+            return
+
+        self.__index_chain(head)
+        if index == 0:
+            tail.next = self.__head
+            self.__head = head
+            self.__finger_index += length
+        else:
+            prev_node = self.__node_at(index - 1)
+            tail.next = prev_node.next
+            prev_node.next = head
+        self.__length += length
+
+    def dump(self, file: BinaryIO) -> None:
+        dump_values(self, self.__length, file)
+
+    @classmethod
+    def load(cls, file: BinaryIO, **options: Any) -> Self:
+        # options are passed to the constructor
+        result = cls(**options)
+        for block in load_values(file):
+            result.extend(block)
+        return result
+
+    def __new_node(self, value: T) -> __Node[T]:
+        node = self.__allocate_node(value)
+        if self.__value_index is not None:
+            self.__value_index.setdefault(value, {})[node] = None
+        return node
+
+    def __allocate_node(self, value: T) -> __Node[T]:
+        node = None
+        if self.__pool is not None:
+            node = self.__pool.acquire()
+            if node is not None:
+                node.value = value
+        if node is None:
+            node = self.__Node(value)
+        return node
+
+    def __release_node(self, node: __Node[T]) -> None:
+        if self.__value_index is not None:
+            self.__unindex(node)
+        if self.__pool is not None:
+            self.__recycle(node)
+
+    def __recycle(self, node: __Node[T]) -> None:
+        node.value = None
+        node.next = None
+        self.__pool.release(node)
+
+    def __drain_chain(self, node: __Node[T] | None) -> Iterator[T]:
+        while node is not None:
+            next_node = node.next
+            value = node.value
+            if self.__pool is not None:
+                self.__recycle(node)
+            yield value
+            node = next_node
+
+    def __build_chain(
+            self, values: Iterable[T]
+    ) -> tuple[__Node[T] | None, __Node[T] | None, int]:
+        # link the new nodes among themselves first, so the caller attaches
+        # the whole chain with a single head/tail/length update; the chain
+        # is indexed only once complete, so a source that fails partway
+        # leaves the index as it was
+        first, last, count = self.__link_chain(values)
+        self.__index_chain(first)
+        return first, last, count
+
+    def __link_chain(
+            self, values: Iterable[T]
+    ) -> tuple[__Node[T] | None, __Node[T] | None, int]:
+        new_node = self.__Node if self.__pool is None else self.__allocate_node
+
+        if isinstance(values, LinkedList):
+            count = values.__length
+            if count == 0:
+                return None, None, 0
+
+            source = values.__head
+            first = last = new_node(source.value)
+            for _ in range(count - 1):
+                source = source.next
+                last.next = last = new_node(source.value)
+            return first, last, count
+
+        iterator = iter(values)
+        first = last = None
+        for value in iterator:
+            first = last = new_node(value)
+            break
+        if first is None:
+            return None, None, 0
+
+        if isinstance(values, (list, tuple)):
+            for value in iterator:
+                last.next = last = new_node(value)
+            return first, last, len(values)
+
+        count = 1
+        for value in iterator:
+            last.next = last = new_node(value)
+            count += 1
+        return first, last, count
+
+    def __empty_like(self) -> "LinkedList[T]":
+        pool_size = 0 if self.__pool is None else self.__pool.max_size
+        return type(self)(
+            node_pool_size=pool_size,
+            index_values=self.__value_index is not None,
+        )
+
+    def __check_other(self, other: "LinkedList[T]") -> None:
+        if not isinstance(other, LinkedList):
+            raise TypeError("Can only relink nodes of another LinkedList")
+        if other is self:
+            raise ValueError("Cannot relink a list into itself")
+
+    def __take_all(self) -> tuple[__Node[T] | None, __Node[T] | None, int]:
+        taken = self.__head, self.__tail, self.__length
+        self.__head = self.__tail = None
+        self.__length = 0
+        self.__finger_node = None
+        if self.__value_index is not None:
+            self.__value_index = {}
+        return taken
+
+    def __node_at(self, index: int) -> __Node[T]:
+        if index == self.__length - 1:
+            return self.__tail
+
+        node = self.__head
+        steps = index
+        if self.__finger_node is not None and self.__finger_index <= index:
+            node = self.__finger_node
+            steps = index - self.__finger_index
+
+        for _ in range(steps):
+            node = node.next
+        self.__finger_index, self.__finger_node = index, node
+        return node
+
+    def __bucket(self, value: object) -> dict[__Node[T], None] | None:
+        try:
+            return self.__value_index.get(value)
+        except TypeError:
+            # unhashable values can never have been indexed
+            return None
+
+    def __unindex(self, node: __Node[T]) -> None:
+        bucket = self.__value_index[node.value]
+        del bucket[node]
+        if not bucket:
+            del self.__value_index[node.value]
+
+    def __index_chain(self, node: __Node[T] | None) -> None:
+        if self.__value_index is None:
+            return
+        first = node
+        try:
+            while node is not None:
+                self.__value_index.setdefault(node.value, {})[node] = None
+                node = node.next
+        except TypeError:
+            # an unhashable value: take back the nodes indexed before it
+            while first is not node:
+                self.__unindex(first)
+                first = first.next
+            raise
+
+    def __unindex_chain(self, node: __Node[T] | None) -> None:
+        if self.__value_index is None:
+            return
+        while node is not None:
+            self.__unindex(node)
+            node = node.next
+
+    def __normalize_index(self, key: int) -> int:
+        index = as_index(key)
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of bounds")
+        return index
+
+    @staticmethod
+    def __advance(node: __Node[T], steps: int) -> __Node[T]:
+        for _ in range(steps):
+            node = node.next
+        return node
+
+    def __set_value(self, node: __Node[T], value: T) -> None:
+        if self.__value_index is None:
+            node.value = value
+            return
+
+        self.__unindex(node)
+        node.value = value
+        self.__value_index.setdefault(value, {})[node] = None
+
+    def __copy_positions(self, positions: range) -> "LinkedList[T]":
+        # one forward walk over the selected positions; a negative step walks
+        # them in ascending order and prepends each copy instead
+        result = self.__empty_like()
+        if not positions:
+            return result
+
+        ascending = positions if positions.step > 0 else positions[::-1]
+        new_node = result.__new_node
+        node = self.__node_at(ascending[0])
+        first = last = new_node(node.value)
+        for _ in range(len(ascending) - 1):
+            node = self.__advance(node, ascending.step)
+            copy = new_node(node.value)
+            if positions.step > 0:
+                last.next = last = copy
+            else:
+                copy.next = first
+                first = copy
+
+        result.__head, result.__tail = first, last
+        result.__length = len(positions)
+        return result
+
+    def __assign_positions(self, positions: range, values: Iterable[T]) -> None:
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        if len(values) != len(positions):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(values)} "
+                f"to extended slice of size {len(positions)}"
+            )
+        if not positions:
+            return
+
+        if positions.step < 0:
+            positions, values = positions[::-1], values[::-1]
+        node = self.__node_at(positions[0])
+        self.__set_value(node, values[0])
+        for value in values[1:]:
+            node = self.__advance(node, positions.step)
+            self.__set_value(node, value)
+
+    def __replace_segment(self, start: int, stop: int, values: Iterable[T]) -> None:
+        # the replacement chain is built first, so assigning a list to a
+        # slice of itself copies the old values
+        first, last, count = self.__build_chain(values)
+
+        prev_node = None if start == 0 else self.__node_at(start - 1)
+        node = self.__head if prev_node is None else prev_node.next
+        for _ in range(stop - start):
+            following = node.next
+            self.__release_node(node)
+            node = following
+        after = node
+
+        if count == 0:
+            first = after
+            last = prev_node
+        else:
+            last.next = after
+        if prev_node is None:
+            self.__head = first
+        else:
+            prev_node.next = first
+        if after is None:
+            self.__tail = last
+
+        self.__length += count - (stop - start)
+        self.__finger_node = None
+
+    def __delete_positions(self, positions: range) -> None:
+        if not positions:
+            return
+
+        prev_node = None if positions.start == 0 else self.__node_at(positions.start - 1)
+        node = self.__head if prev_node is None else prev_node.next
+        for remaining in range(len(positions) - 1, -1, -1):
+            following = node.next
+            if prev_node is None:
+                self.__head = following
+            else:
+                prev_node.next = following
+            if following is None:
+                self.__tail = prev_node
+            self.__release_node(node)
+            node = following
+            if remaining:
+                for _ in range(positions.step - 1):
+                    prev_node = node
+                    node = node.next
+
+        self.__length -= len(positions)
+        self.__finger_node = None
+
+    @staticmethod
+    def __merge_sort(
+            head: __Node[T], precedes: Callable[[T, T], bool]
+    ) -> tuple[__Node[T], __Node[T]]:
+        # Bottom-up merge sort over the next links: each pass merges
+        # neighbouring runs of `width` nodes, doubling the width until one
+        # pass does a single merge. The right run's node goes first only
+        # when it strictly precedes, which keeps the sort stable.
+        width = 1
+        while True:
+            left = head
+            head = tail = None
+            merges = 0
+            while left is not None:
+                merges += 1
+                right = left
+                left_size = 0
+                while left_size < width and right is not None:
+                    left_size += 1
+                    right = right.next
+                right_size = width
+
+                while left_size and right_size and right is not None:
+                    if precedes(right.value, left.value):
+                        node, right = right, right.next
+                        right_size -= 1
+                    else:
+                        node, left = left, left.next
+                        left_size -= 1
+                    if tail is None:
+                        head = node
+                    else:
+                        tail.next = node
+                    tail = node
+
+                # one run is used up: attach the rest of the other as is
+                # and move on to its last node
+                rest = left if left_size else right
+                if left_size or (right_size and right is not None):
+                    if tail is None:
+                        head = rest
+                    else:
+                        tail.next = rest
+                    tail = rest
+                if left_size:
+                    for _ in range(left_size - 1):
+                        tail = tail.next
+                elif right_size and right is not None:
+                    right = right.next
+                    right_size -= 1
+                    while right_size and right is not None:
+                        tail, right = right, right.next
+                        right_size -= 1
+                left = right
+
+            tail.next = None
+            if merges == 1:
+                return head, tail
+            width *= 2
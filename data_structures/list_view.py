@@ -0,0 +1,78 @@
+from functools import reduce
+from itertools import islice
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+_MISSING = object()
+
+
+class ListView(Generic[T]):
+    # Lazy pipeline over a list. filter/map/skip/take only record a stage
+    # and return a new view; iterating the view (or any terminal operation)
+    # chains the stages as C-level iterators over one pass of the source's
+    # __iter__, so no intermediate list is built and take() stops pulling
+    # from the source as soon as it is satisfied. Views are immutable and
+    # can be branched and re-evaluated; each evaluation reads the source as
+    # it is at that moment.
+    __source: Iterable[Any]
+    __stages: tuple[tuple[str, Any], ...]
+
+    def __init__(self, source: Iterable[Any], stages: tuple[tuple[str, Any], ...] = ()):
+        self.__source = source
+        self.__stages = stages
+
+    def __iter__(self) -> Iterator[T]:
+        iterator = iter(self.__source)
+        for kind, argument in self.__stages:
+            if kind == "filter":
+                iterator = filter(argument, iterator)
+            elif kind == "map":
+                iterator = map(argument, iterator)
+            elif kind == "skip":
+                iterator = islice(iterator, argument, None)
+            else:
+                iterator = islice(iterator, argument)
+        return iterator
+
+    def filter(self, predicate: Callable[[T], Any]) -> "ListView[T]":
+        return self.__then("filter", predicate)
+
+    def map(self, function: Callable[[T], U]) -> "ListView[U]":
+        return self.__then("map", function)
+
+    def skip(self, count: int) -> "ListView[T]":
+        if count < 0:
+            raise ValueError("Skip count must not be negative")
+        return self.__then("skip", count)
+
+    def take(self, count: int) -> "ListView[T]":
+        if count < 0:
+            raise ValueError("Take count must not be negative")
+        return self.__then("take", count)
+
+    def to_list(self, cls: Callable[[], Any] | None = None) -> Any:
+        # builds a list of `cls`, by default the source's own class
+        result = (type(self.__source) if cls is None else cls)()
+        result.extend(iter(self))
+        return result
+
+    def count(self) -> int:
+        if not self.__stages:
+            return len(self.__source)
+        return sum(1 for _ in self)
+
+    def first(self, default: Any = _MISSING) -> T:
+        value = next(iter(self), default)
+        if value is _MISSING:
+            raise IndexError("First of an empty view")
+        return value
+
+    def reduce(self, function: Callable[[Any, T], Any], initial: Any = _MISSING) -> Any:
+        if initial is _MISSING:
+            return reduce(function, self)
+        return reduce(function, self, initial)
+
+    def __then(self, kind: str, argument: Any) -> "ListView[Any]":
+        return ListView(self.__source, self.__stages + ((kind, argument),))
@@ -0,0 +1,120 @@
+from typing import Any, Callable, Generic, Hashable, Iterator, TypeVar
+
+from data_structures.cache_stats import CacheStats
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.double_linked_list_handle import DoubleLinkedListHandle
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[K, V]):
+    # Least recently used cache. A dict maps each key to its handle in a
+    # DoubleLinkedList ordered from most to least recently used, so a hit
+    # moves one value to the front and an eviction pops the tail, both in
+    # O(1). Capacity counts entries, or, with a size function, the sum of
+    # size_of(value) over the cached values.
+    # noinspection PyTypeHints
+    class __Entry(Generic[K, V]):
+        __slots__ = ("key", "value", "size")
+        key: K
+        value: V
+        size: int
+
+        def __init__(self, key: K, value: V, size: int):
+            self.key = key
+            self.value = value
+            self.size = size
+
+    __handles: dict[K, DoubleLinkedListHandle[__Entry[K, V]]]
+    __order: DoubleLinkedList[__Entry[K, V]]
+    __capacity: int
+    __size_of: Callable[[V], int] | None
+    __size: int
+    __stats: CacheStats
+
+    def __init__(self, capacity: int, size_of: Callable[[V], int] | None = None):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.__handles = {}
+        self.__order = DoubleLinkedList(handles=True)
+        self.__capacity = capacity
+        self.__size_of = size_of
+        self.__size = 0
+        self.__stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self.__handles)
+
+    def __contains__(self, key: object) -> bool:
+        # does not count as a use
+        return key in self.__handles
+
+    def __iter__(self) -> Iterator[K]:
+        # keys from most to least recently used
+        for entry in self.__order:
+            yield entry.key
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.__stats
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        handle = self.__handles.get(key)
+        if handle is None:
+            self.__stats.misses += 1
+            return default
+
+        self.__stats.hits += 1
+        self.__order.move_to_front(handle)
+        return handle.value.value
+
+    def put(self, key: K, value: V) -> None:
+        size = 1 if self.__size_of is None else self.__size_of(value)
+        if size > self.__capacity:
+            # it would flush the whole cache and still not fit
+            self.remove(key)
+            return
+
+        handle = self.__handles.get(key)
+        if handle is None:
+            self.__handles[key] = self.__order.prepend(self.__Entry(key, value, size))
+        else:
+            entry = handle.value
+            self.__size -= entry.size
+            entry.value, entry.size = value, size
+            self.__order.move_to_front(handle)
+        self.__size += size
+
+        while self.__size > self.__capacity:
+            self.__evict()
+
+    def remove(self, key: K) -> bool:
+        handle = self.__handles.pop(key, None)
+        if handle is None:
+            return False
+
+        self.__size -= self.__order.remove_handle(handle).size
+        return True
+
+    def clear(self) -> None:
+        self.__handles = {}
+        self.__order = DoubleLinkedList(handles=True)
+        self.__size = 0
+
+    def __evict(self) -> None:
+        entry = self.__order.pop_back()
+        del self.__handles[entry.key]
+        self.__size -= entry.size
+        self.__stats.evictions += 1
@@ -0,0 +1,296 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import weakref
+from typing import Any, BinaryIO, Generic, Iterable, Iterator, TypeVar
+
+from data_structures.list_view import ListView
+
+T = TypeVar("T")
+
+NIL = -1
+
+MAGIC = b"DSML"
+VERSION = 1
+
+# header: magic, version, head, tail, length, end of the used area, then
+# one free-list head per size class
+SIZE_CLASSES = 48
+MIN_CLASS = 5
+HEADER = struct.Struct(f"<4sIqqqq{SIZE_CLASSES}q")
+STATE = struct.Struct("<qqqq")
+STATE_OFFSET = struct.calcsize("<4sI")
+FREE_LISTS = STATE_OFFSET + STATE.size
+HEADER_SIZE = 512
+# node record: next, prev and payload length, followed by the payload
+NODE = struct.Struct("<qqQ")
+LINKS = struct.Struct("<qq")
+LINK = struct.Struct("<q")
+
+
+def _release(mapping: mmap.mmap, file: BinaryIO) -> None:
+    # shared by close() and the finalizer of a list that was never closed
+    if not mapping.closed:
+        mapping.flush()
+        mapping.close()
+    file.close()
+
+
+class MappedList(Generic[T]):
+    # Doubly linked list whose node records live in a memory-mapped file,
+    # addressed by file offset. Values are stored pickled. A record takes
+    # the smallest power-of-two block that fits it; freed blocks are chained
+    # through their next field into one free list per block size and reused
+    # before the used area grows. The file doubles when the used area
+    # reaches its end. Every change is written through to the header, so
+    # the list reopens from the file after flush() or close(). A list that
+    # is never closed releases its map and file when garbage collected.
+    __file: BinaryIO
+    __map: mmap.mmap
+    __finalizer: weakref.finalize
+    __head: int
+    __tail: int
+    __length: int
+    __end: int
+
+    def __init__(self, path: str | os.PathLike | None = None, initial_size: int = 1 << 20):
+        # without a path the list lives in an anonymous temporary file
+        if path is None:
+            self.__file = tempfile.TemporaryFile()
+        else:
+            self.__file = open(path, "r+b" if os.path.exists(path) else "w+b")
+
+        size = os.fstat(self.__file.fileno()).st_size
+        if size:
+            self.__map_file(size)
+            try:
+                self.__read_header()
+            except ValueError:
+                self.close()
+                raise
+            return
+
+        self.__file.truncate(max(initial_size, HEADER_SIZE + NODE.size))
+        self.__map_file(max(initial_size, HEADER_SIZE + NODE.size))
+        self.__head = self.__tail = NIL
+        self.__length = 0
+        self.__end = HEADER_SIZE
+        self.__map[:HEADER.size] = HEADER.pack(
+            MAGIC, VERSION, NIL, NIL, 0, HEADER_SIZE, *([NIL] * SIZE_CLASSES)
+        )
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[T]:
+        offset = self.__head
+        while offset != NIL:
+            yield self.__value_at(offset)
+            offset = self.__next_of(offset)
+
+    def __enter__(self) -> "MappedList[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def file_size(self) -> int:
+        return len(self.__map)
+
+    def flush(self) -> None:
+        self.__map.flush()
+
+    def close(self) -> None:
+        # a finalizer runs at most once, so closing twice is harmless
+        self.__finalizer()
+
+    def append(self, value: T) -> None:
+        self.__link(self.__tail, NIL, self.__allocate(value))
+
+    def prepend(self, value: T) -> None:
+        self.__link(NIL, self.__head, self.__allocate(value))
+
+    def extend(self, values: Iterable[T]) -> None:
+        for value in values:
+            self.append(value)
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        if index == self.__length:
+            self.append(value)
+            return
+
+        next_offset = self.__offset_at(index)
+        prev_offset = self.__prev_of(next_offset)
+        self.__link(prev_offset, next_offset, self.__allocate(value))
+
+    def remove(self, value: T) -> bool:
+        offset = self.__head
+        while offset != NIL:
+            if self.__value_at(offset) == value:
+                self.__unlink(offset)
+                return True
+            offset = self.__next_of(offset)
+
+        return False
+
+    def pop_front(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        offset = self.__head
+        value = self.__value_at(offset)
+        self.__unlink(offset)
+        return value
+
+    def pop_back(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        offset = self.__tail
+        value = self.__value_at(offset)
+        self.__unlink(offset)
+        return value
+
+    def index_of(self, value: T) -> int | None:
+        for i, v in enumerate(self):
+            if v == value:
+                return i
+        return None
+
+    def get(self, index: int) -> T:
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of bounds")
+
+        return self.__value_at(self.__offset_at(index))
+
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def __read_header(self) -> None:
+        if len(self.__map) < HEADER.size:
+            raise ValueError("Not a mapped list file")
+        magic, version, head, tail, length, end, *_ = HEADER.unpack_from(self.__map)
+        if magic != MAGIC:
+            raise ValueError("Not a mapped list file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported format version {version}")
+        self.__head, self.__tail, self.__length, self.__end = head, tail, length, end
+
+    def __write_header(self) -> None:
+        STATE.pack_into(
+            self.__map, STATE_OFFSET,
+            self.__head, self.__tail, self.__length, self.__end,
+        )
+
+    def __next_of(self, offset: int) -> int:
+        return LINK.unpack_from(self.__map, offset)[0]
+
+    def __prev_of(self, offset: int) -> int:
+        return LINK.unpack_from(self.__map, offset + LINK.size)[0]
+
+    def __set_next(self, offset: int, next_offset: int) -> None:
+        LINK.pack_into(self.__map, offset, next_offset)
+
+    def __set_prev(self, offset: int, prev_offset: int) -> None:
+        LINK.pack_into(self.__map, offset + LINK.size, prev_offset)
+
+    def __value_at(self, offset: int) -> T:
+        _, _, length = NODE.unpack_from(self.__map, offset)
+        start = offset + NODE.size
+        return pickle.loads(self.__map[start:start + length])
+
+    def __offset_at(self, index: int) -> int:
+        # walk from the nearer end
+        if index < self.__length // 2:
+            offset = self.__head
+            for _ in range(index):
+                offset = self.__next_of(offset)
+        else:
+            offset = self.__tail
+            for _ in range(self.__length - 1 - index):
+                offset = self.__prev_of(offset)
+        return offset
+
+    def __link(self, prev_offset: int, next_offset: int, offset: int) -> None:
+        LINKS.pack_into(self.__map, offset, next_offset, prev_offset)
+        if prev_offset == NIL:
+            self.__head = offset
+        else:
+            self.__set_next(prev_offset, offset)
+        if next_offset == NIL:
+            self.__tail = offset
+        else:
+            self.__set_prev(next_offset, offset)
+        self.__length += 1
+        self.__write_header()
+
+    def __unlink(self, offset: int) -> None:
+        next_offset, prev_offset, length = NODE.unpack_from(self.__map, offset)
+        if prev_offset == NIL:
+            self.__head = next_offset
+        else:
+            self.__set_next(prev_offset, next_offset)
+        if next_offset == NIL:
+            self.__tail = prev_offset
+        else:
+            self.__set_prev(next_offset, prev_offset)
+        self.__length -= 1
+        self.__release(offset, length)
+        self.__write_header()
+
+    @staticmethod
+    def __size_class(payload_length: int) -> int:
+        return max(MIN_CLASS, (NODE.size + payload_length - 1).bit_length())
+
+    def __free_head_position(self, size_class: int) -> int:
+        return FREE_LISTS + LINK.size * (size_class - MIN_CLASS)
+
+    def __allocate(self, value: T) -> int:
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        size_class = self.__size_class(len(payload))
+        if size_class - MIN_CLASS >= SIZE_CLASSES:
+            raise ValueError("Value is too large to store")
+
+        free_position = self.__free_head_position(size_class)
+        offset = LINK.unpack_from(self.__map, free_position)[0]
+        if offset != NIL:
+            LINK.pack_into(self.__map, free_position, self.__next_of(offset))
+        else:
+            offset = self.__end
+            self.__end += 1 << size_class
+            if self.__end > len(self.__map):
+                self.__grow(self.__end)
+
+        NODE.pack_into(self.__map, offset, NIL, NIL, len(payload))
+        start = offset + NODE.size
+        self.__map[start:start + len(payload)] = payload
+        return offset
+
+    def __release(self, offset: int, payload_length: int) -> None:
+        free_position = self.__free_head_position(self.__size_class(payload_length))
+        self.__set_next(offset, LINK.unpack_from(self.__map, free_position)[0])
+        LINK.pack_into(self.__map, free_position, offset)
+
+    def __grow(self, required: int) -> None:
+        size = len(self.__map)
+        while size < required:
+            size *= 2
+        self.__finalizer.detach()
+        self.__map.flush()
+        self.__map.close()
+        self.__file.truncate(size)
+        self.__map_file(size)
+
+    def __map_file(self, size: int) -> None:
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), size)
+        except BaseException:
+            self.__file.close()
+            raise
+        self.__finalizer = weakref.finalize(self, _release, self.__map, self.__file)
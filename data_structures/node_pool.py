@@ -0,0 +1,53 @@
+from typing import Generic, TypeVar
+
+N = TypeVar("N")
+
+
+class NodePool(Generic[N]):
+    # Bounded free list of detached nodes that a list hands back out instead
+    # of allocating new ones; hit/miss counters help with sizing the pool.
+    __free: list[N]
+    __max_size: int
+    __hits: int
+    __misses: int
+
+    def __init__(self, max_size: int):
+        if max_size < 0:
+            raise ValueError("Pool size must not be negative")
+
+        self.__free = []
+        self.__max_size = max_size
+        self.__hits = self.__misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__free)
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def acquire(self) -> N | None:
+        if self.__free:
+            self.__hits += 1
+            return self.__free.pop()
+
+        self.__misses += 1
+        return None
+
+    def release(self, node: N) -> bool:
+        if len(self.__free) >= self.__max_size:
+            return False
+
+        self.__free.append(node)
+        return True
+
+    def reset_stats(self) -> None:
+        self.__hits = self.__misses = 0
@@ -0,0 +1,419 @@
+from numbers import Integral, Real
+from typing import Any, Generic, Iterable, Iterator, Self, TypeVar
+
+import numpy as np
+
+from data_structures.list_view import ListView
+
+T = TypeVar("T")
+
+
+class NumericList(Generic[T]):
+    # Unrolled list of numpy chunks for int and float values. Each chunk
+    # keeps its values in data[start:stop], so both ends grow in O(1): the
+    # tail chunk fills rightwards and the head chunk leftwards. Without an
+    # explicit dtype the list holds int64 until the first float arrives and
+    # then promotes every chunk to float64.
+    # noinspection PyTypeHints
+    class __Chunk:
+        __slots__ = ("data", "start", "stop", "next", "prev")
+        data: np.ndarray
+        start: int
+        stop: int
+        next: Self | None
+        prev: Self | None
+
+        def __init__(self, data: np.ndarray, start: int, stop: int):
+            self.data = data
+            self.start = start
+            self.stop = stop
+            self.next = self.prev = None
+
+    __head: __Chunk | None
+    __tail: __Chunk | None
+    __length: int
+    __capacity: int
+    __dtype: np.dtype
+    __promotes: bool
+
+    def __init__(self, dtype: Any = None, chunk_capacity: int = 4096):
+        if chunk_capacity < 2:
+            raise ValueError("Chunk capacity must be at least 2")
+
+        self.__head = self.__tail = None
+        self.__length = 0
+        self.__capacity = chunk_capacity
+        self.__dtype = np.dtype(np.int64 if dtype is None else dtype)
+        self.__promotes = dtype is None
+        if self.__dtype.kind not in "biuf":
+            raise TypeError(f"Unsupported dtype {self.__dtype}")
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[T]:
+        # convert a chunk at a time; tolist() boxes in C
+        chunk = self.__head
+        while chunk is not None:
+            yield from chunk.data[chunk.start:chunk.stop].tolist()
+            chunk = chunk.next
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__dtype
+
+    @property
+    def chunk_capacity(self) -> int:
+        return self.__capacity
+
+    def append(self, value: T) -> None:
+        value = self.__accept(value)
+        tail = self.__tail
+        if tail is None or tail.stop == tail.data.size:
+            tail = self.__link_after(tail, self.__new_chunk(0))
+        tail.data[tail.stop] = value
+        tail.stop += 1
+        self.__length += 1
+
+    def prepend(self, value: T) -> None:
+        value = self.__accept(value)
+        head = self.__head
+        if head is None or head.start == 0:
+            head = self.__link_before(head, self.__new_chunk(self.__capacity))
+        head.start -= 1
+        head.data[head.start] = value
+        self.__length += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        if isinstance(values, np.ndarray):
+            array = values.ravel()
+        else:
+            if not isinstance(values, (list, tuple)):
+                values = list(values)
+            if not values:
+                return
+            array = np.asarray(values)
+        if array.size == 0:
+            return
+        self.__accept_array(array)
+
+        # top up the tail chunk, then copy the rest in whole chunks
+        copied = 0
+        tail = self.__tail
+        if tail is not None and tail.stop < tail.data.size:
+            copied = min(tail.data.size - tail.stop, array.size)
+            tail.data[tail.stop:tail.stop + copied] = array[:copied]
+            tail.stop += copied
+        while copied < array.size:
+            count = min(self.__capacity, array.size - copied)
+            tail = self.__link_after(tail, self.__new_chunk(0))
+            tail.data[:count] = array[copied:copied + count]
+            tail.stop = count
+            copied += count
+        self.__length += array.size
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        if index == self.__length:
+            self.append(value)
+            return
+
+        if index == 0:
+            self.prepend(value)
+            return
+
+        value = self.__accept(value)
+        chunk, offset = self.__locate(index)
+        if chunk.data.size > self.__capacity:
+            self.__unmerge(chunk)
+            chunk, offset = self.__locate(index)
+        if chunk.stop - chunk.start == chunk.data.size:
+            self.__split(chunk)
+            if offset > chunk.stop - chunk.start:
+                offset -= chunk.stop - chunk.start
+                chunk = chunk.next
+
+        data, position = chunk.data, chunk.start + offset
+        if chunk.stop < data.size:
+            data[position + 1:chunk.stop + 1] = data[position:chunk.stop]
+            chunk.stop += 1
+        else:
+            data[chunk.start - 1:position - 1] = data[chunk.start:position]
+            chunk.start -= 1
+            position -= 1
+        data[position] = value
+        self.__length += 1
+
+    def remove(self, value: T) -> bool:
+        if not isinstance(value, Real):
+            return False
+
+        chunk = self.__head
+        while chunk is not None:
+            hits = np.flatnonzero(chunk.data[chunk.start:chunk.stop] == value)
+            if hits.size:
+                self.__delete(chunk, int(hits[0]))
+                return True
+            chunk = chunk.next
+
+        return False
+
+    def pop_front(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        head = self.__head
+        value = head.data[head.start].item()
+        head.start += 1
+        self.__length -= 1
+        if head.start == head.stop:
+            self.__unlink(head)
+        return value
+
+    def pop_back(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        tail = self.__tail
+        tail.stop -= 1
+        value = tail.data[tail.stop].item()
+        self.__length -= 1
+        if tail.start == tail.stop:
+            self.__unlink(tail)
+        return value
+
+    def index_of(self, value: T) -> int | None:
+        if not isinstance(value, Real):
+            return None
+
+        base = 0
+        chunk = self.__head
+        while chunk is not None:
+            hits = np.flatnonzero(chunk.data[chunk.start:chunk.stop] == value)
+            if hits.size:
+                return base + int(hits[0])
+            base += chunk.stop - chunk.start
+            chunk = chunk.next
+
+        return None
+
+    def get(self, index: int) -> T:
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of bounds")
+
+        chunk, offset = self.__locate(index)
+        return chunk.data[chunk.start + offset].item()
+
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def sum(self) -> T:
+        total = self.__dtype.type(0)
+        for view in self.__views():
+            total += view.sum(dtype=self.__dtype)
+        return total.item()
+
+    def min(self) -> T:
+        if self.__length == 0:
+            raise ValueError("min() of an empty list")
+        return min(view.min() for view in self.__views()).item()
+
+    def max(self) -> T:
+        if self.__length == 0:
+            raise ValueError("max() of an empty list")
+        return max(view.max() for view in self.__views()).item()
+
+    def map_inplace(self, ufunc: np.ufunc) -> None:
+        # a float-valued ufunc over an inferred int list promotes it first;
+        # otherwise results are cast back with numpy's same_kind rule
+        if self.__length == 0:
+            return
+
+        if self.__promotes and self.__dtype.kind != "f":
+            probe = ufunc(self.__head.data[self.__head.start:self.__head.start + 1])
+            if probe.dtype.kind == "f":
+                self.__promote()
+        for view in self.__views():
+            ufunc(view, out=view, casting="same_kind")
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Returns the values as one array. A list held in a single chunk is
+        returned as a view without copying; otherwise the chunks are merged
+        into one, so later calls are free. The array shares memory with the
+        list until the list is next modified.
+        """
+        if self.__length == 0:
+            return np.empty(0, self.__dtype)
+
+        if self.__head is not self.__tail:
+            merged = self.__Chunk(
+                np.concatenate(list(self.__views())), 0, self.__length
+            )
+            self.__head = self.__tail = merged
+        return self.__head.data[self.__head.start:self.__head.stop]
+
+    def __views(self) -> Iterator[np.ndarray]:
+        chunk = self.__head
+        while chunk is not None:
+            yield chunk.data[chunk.start:chunk.stop]
+            chunk = chunk.next
+
+    def __new_chunk(self, position: int) -> __Chunk:
+        return self.__Chunk(
+            np.empty(self.__capacity, self.__dtype), position, position
+        )
+
+    def __accept(self, value: T) -> Any:
+        # casts before any chunk is touched, so a rejected value leaves the
+        # list as it was
+        if isinstance(value, Integral):
+            if self.__dtype.kind in "iu":
+                info = np.iinfo(self.__dtype)
+                if not info.min <= value <= info.max:
+                    raise OverflowError(f"{value} does not fit in {self.__dtype}")
+            return self.__dtype.type(value)
+        if not isinstance(value, Real):
+            raise TypeError(
+                f"NumericList holds int and float values, not {type(value).__name__}"
+            )
+        if self.__dtype.kind != "f":
+            if not self.__promotes:
+                raise TypeError(f"A {self.__dtype} list cannot hold float values")
+            self.__promote()
+        return self.__dtype.type(value)
+
+    def __accept_array(self, array: np.ndarray) -> None:
+        # checks the whole array before any chunk is touched, as __accept
+        # does for one value
+        kind = array.dtype.kind
+        if kind == "O" and all(isinstance(value, Integral) for value in array):
+            # what np.asarray makes of ints beyond 64 bits
+            raise OverflowError(f"Values do not fit in {self.__dtype}")
+        if kind not in "biuf":
+            raise TypeError(f"NumericList holds int and float values, not {array.dtype}")
+        if kind in "iu" and self.__dtype.kind in "iu":
+            info = np.iinfo(self.__dtype)
+            if array.min() < info.min or array.max() > info.max:
+                raise OverflowError(f"Values do not fit in {self.__dtype}")
+        if kind == "f" and self.__dtype.kind != "f":
+            if not self.__promotes:
+                raise TypeError(f"A {self.__dtype} list cannot hold float values")
+            self.__promote()
+
+    def __promote(self) -> None:
+        self.__dtype = np.dtype(np.float64)
+        chunk = self.__head
+        while chunk is not None:
+            chunk.data = chunk.data.astype(self.__dtype)
+            chunk = chunk.next
+
+    def __locate(self, index: int) -> tuple[__Chunk, int]:
+        # walk whole chunks from the nearer end, then index inside the chunk
+        if index < self.__length // 2:
+            chunk = self.__head
+            while index >= chunk.stop - chunk.start:
+                index -= chunk.stop - chunk.start
+                chunk = chunk.next
+            return chunk, index
+
+        remaining = self.__length - index
+        chunk = self.__tail
+        while remaining > chunk.stop - chunk.start:
+            remaining -= chunk.stop - chunk.start
+            chunk = chunk.prev
+        return chunk, chunk.stop - chunk.start - remaining
+
+    def __delete(self, chunk: __Chunk, offset: int) -> None:
+        # close the gap from the shorter side
+        data, position = chunk.data, chunk.start + offset
+        if offset < (chunk.stop - chunk.start) // 2:
+            data[chunk.start + 1:position + 1] = data[chunk.start:position]
+            chunk.start += 1
+        else:
+            data[position:chunk.stop - 1] = data[position + 1:chunk.stop]
+            chunk.stop -= 1
+        self.__length -= 1
+        self.__rebalance(chunk)
+
+    def __rebalance(self, chunk: __Chunk) -> None:
+        # keep chunks at least half full by merging with the next neighbour
+        count = chunk.stop - chunk.start
+        if count == 0:
+            self.__unlink(chunk)
+            return
+
+        next_chunk = chunk.next
+        if next_chunk is None or count >= self.__capacity // 2:
+            return
+        next_count = next_chunk.stop - next_chunk.start
+        if count + next_count > chunk.data.size:
+            return
+
+        data = chunk.data
+        data[:count] = data[chunk.start:chunk.stop]
+        data[count:count + next_count] = next_chunk.data[next_chunk.start:next_chunk.stop]
+        chunk.start, chunk.stop = 0, count + next_count
+        self.__unlink(next_chunk)
+
+    def __unmerge(self, chunk: __Chunk) -> None:
+        # cut a chunk merged by to_numpy back into regular full chunks, so
+        # inserts never split (and copy) a list-sized array
+        previous = chunk.prev
+        for start in range(chunk.start, chunk.stop, self.__capacity):
+            stop = min(start + self.__capacity, chunk.stop)
+            piece = self.__new_chunk(0)
+            piece.data[:stop - start] = chunk.data[start:stop]
+            piece.stop = stop - start
+            if previous is None:
+                self.__link_before(self.__head, piece)
+            else:
+                self.__link_after(previous, piece)
+            previous = piece
+        self.__unlink(chunk)
+
+    def __split(self, chunk: __Chunk) -> None:
+        half = (chunk.start + chunk.stop) // 2
+        new_chunk = self.__Chunk(
+            np.empty(self.__capacity, self.__dtype), 0, chunk.stop - half
+        )
+        new_chunk.data[:new_chunk.stop] = chunk.data[half:chunk.stop]
+        chunk.stop = half
+        self.__link_after(chunk, new_chunk)
+
+    def __link_after(self, chunk: __Chunk | None, new_chunk: __Chunk) -> __Chunk:
+        if chunk is None:
+            self.__head = self.__tail = new_chunk
+            return new_chunk
+
+        new_chunk.prev = chunk
+        new_chunk.next = chunk.next
+        if chunk.next is None:
+            self.__tail = new_chunk
+        else:
+            chunk.next.prev = new_chunk
+        chunk.next = new_chunk
+        return new_chunk
+
+    def __link_before(self, chunk: __Chunk | None, new_chunk: __Chunk) -> __Chunk:
+        if chunk is None:
+            self.__head = self.__tail = new_chunk
+            return new_chunk
+
+        new_chunk.next = chunk
+        chunk.prev = new_chunk
+        self.__head = new_chunk
+        return new_chunk
+
+    def __unlink(self, chunk: __Chunk) -> None:
+        if chunk.prev is None:
+            self.__head = chunk.next
+        else:
+            chunk.prev.next = chunk.next
+        if chunk.next is None:
+            self.__tail = chunk.prev
+        else:
+            chunk.next.prev = chunk.prev
+        chunk.next = chunk.prev = None
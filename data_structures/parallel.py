@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+from io import BytesIO
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+from data_structures.serialization import dump_values, load_values
+
+# Segments per worker; a few more segments than workers evens out the load
+# when per-value work is uneven.
+SEGMENTS_PER_WORKER = 4
+
+
+def map_segments(
+        values: Iterable[Any], count: int, function: Callable[[Any], Any],
+        workers: int | None = None,
+) -> Iterator[list[Any]]:
+    """
+    Applies function to every value on a process pool and yields the results
+    as blocks, in order. Segments are cut in one walk over values and sent,
+    like the results, in the dump_values format, so numeric segments travel
+    as raw arrays instead of one pickle per value. function must be
+    picklable, i.e. defined at module level.
+    """
+    if count == 0:
+        return
+
+    workers = _worker_count(workers)
+    with ProcessPoolExecutor(workers) as executor:
+        segments = _pack_segments(values, count, workers * SEGMENTS_PER_WORKER)
+        for packed in executor.map(partial(_map_segment, function), segments):
+            yield from load_values(BytesIO(packed))
+
+
+def reduce_segments(
+        values: Iterable[Any], count: int, function: Callable[[Any, Any], Any],
+        initial: Any, workers: int | None = None,
+) -> Any:
+    """
+    Folds every value with function on a process pool. Each segment is
+    folded from initial and the partial results are then folded in order,
+    so function must be associative and initial its identity (0 for add,
+    1 for mul). Returns initial for an empty input.
+    """
+    if count == 0:
+        return initial
+
+    workers = _worker_count(workers)
+    with ProcessPoolExecutor(workers) as executor:
+        segments = _pack_segments(values, count, workers * SEGMENTS_PER_WORKER)
+        partials = executor.map(partial(_reduce_segment, function, initial), segments)
+        return reduce(function, partials)
+
+
+def _worker_count(workers: int | None) -> int:
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Worker count must be at least 1")
+    return workers
+
+
+def _pack_segments(values: Iterable[Any], count: int, segments: int) -> Iterator[bytes]:
+    # contiguous segments whose sizes differ by at most one
+    iterator = iter(values)
+    segments = min(segments, count)
+    size, extra = divmod(count, segments)
+    for i in range(segments):
+        length = size + (i < extra)
+        yield _pack(islice(iterator, length), length)
+
+
+def _pack(values: Iterable[Any], count: int) -> bytes:
+    buffer = BytesIO()
+    dump_values(values, count, buffer)
+    return buffer.getvalue()
+
+
+def _unpack(packed: bytes) -> Iterator[Any]:
+    for block in load_values(BytesIO(packed)):
+        yield from block
+
+
+def _map_segment(function: Callable[[Any], Any], packed: bytes) -> bytes:
+    results = [function(value) for value in _unpack(packed)]
+    return _pack(results, len(results))
+
+
+def _reduce_segment(
+        function: Callable[[Any, Any], Any], initial: Any, packed: bytes
+) -> Any:
+    return reduce(function, _unpack(packed), initial)
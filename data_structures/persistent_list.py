@@ -0,0 +1,227 @@
+from math import isqrt
+from typing import Generic, Iterable, Iterator, Self, TypeVar
+
+T = TypeVar("T")
+
+
+class PersistentList(Generic[T]):
+    # Immutable list: every "modifying" method returns a new version and
+    # leaves this one intact. Values live in two immutable cons chains, the
+    # front in list order and the rear in reverse order, so prepend and
+    # append both add one node and share everything else. insert and
+    # remove copy only the nodes in front of the position within its chain.
+    # As in a banker's queue, the rear is never longer than the front: a
+    # version that would break this gets one chain holding the front
+    # followed by the reversed rear. That O(n) rotation happens after at
+    # least n/2 appends, so appends cost amortised O(1) when each version
+    # is extended once; appending repeatedly to the same version at the
+    # rotation point repeats the rotation. Walking a chain backwards, for
+    # iteration or rotation, keeps only O(sqrt n) values at a time.
+    # noinspection PyTypeHints
+    class __Node(Generic[T]):
+        __slots__ = ("value", "next")
+        value: T
+        next: Self | None
+
+        def __init__(self, value: T, next_node: Self | None):
+            self.value = value
+            self.next = next_node
+
+    __front: __Node[T] | None
+    __front_length: int
+    __rear: __Node[T] | None
+    __rear_length: int
+
+    def __init__(self, values: Iterable[T] = ()):
+        front = None
+        values = list(values)
+        for value in reversed(values):
+            front = self.__Node(value, front)
+        self.__front, self.__front_length = front, len(values)
+        self.__rear, self.__rear_length = None, 0
+
+    def __len__(self) -> int:
+        return self.__front_length + self.__rear_length
+
+    def __iter__(self) -> Iterator[T]:
+        node = self.__front
+        while node is not None:
+            yield node.value
+            node = node.next
+        yield from self.__reversed_chain(self.__rear, self.__rear_length)
+
+    def __reversed__(self) -> Iterator[T]:
+        node = self.__rear
+        while node is not None:
+            yield node.value
+            node = node.next
+        yield from self.__reversed_chain(self.__front, self.__front_length)
+
+    def __contains__(self, value: object) -> bool:
+        return self.index_of(value) is not None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"PersistentList({list(self)!r})"
+
+    def append(self, value: T) -> "PersistentList[T]":
+        return self.__version(
+            self.__front, self.__front_length,
+            self.__Node(value, self.__rear), self.__rear_length + 1,
+        )
+
+    def prepend(self, value: T) -> "PersistentList[T]":
+        return self.__version(
+            self.__Node(value, self.__front), self.__front_length + 1,
+            self.__rear, self.__rear_length,
+        )
+
+    def insert(self, index: int, value: T) -> "PersistentList[T]":
+        if index < 0 or index > len(self):
+            raise IndexError("Index out of bounds")
+
+        if index <= self.__front_length:
+            front = self.__insert_into(self.__front, index, value)
+            return self.__version(
+                front, self.__front_length + 1, self.__rear, self.__rear_length
+            )
+
+        rear = self.__insert_into(self.__rear, len(self) - index, value)
+        return self.__version(
+            self.__front, self.__front_length, rear, self.__rear_length + 1
+        )
+
+    def remove(self, value: T) -> "PersistentList[T]":
+        # returns this same version when the value is absent
+        index = self.__chain_index(self.__front, value)
+        if index is not None:
+            front = self.__remove_from(self.__front, index)
+            return self.__version(
+                front, self.__front_length - 1, self.__rear, self.__rear_length
+            )
+
+        # the first occurrence in list order is the last one in the rear
+        last = None
+        i = 0
+        node = self.__rear
+        while node is not None:
+            if node.value == value:
+                last = i
+            node = node.next
+            i += 1
+        if last is None:
+            return self
+
+        rear = self.__remove_from(self.__rear, last)
+        return self.__version(
+            self.__front, self.__front_length, rear, self.__rear_length - 1
+        )
+
+    def index_of(self, value: T) -> int | None:
+        for i, v in enumerate(self):
+            if v == value:
+                return i
+        return None
+
+    def get(self, index: int) -> T:
+        if index < 0 or index >= len(self):
+            raise IndexError("Index out of bounds")
+
+        if index < self.__front_length:
+            node, steps = self.__front, index
+        else:
+            node, steps = self.__rear, len(self) - 1 - index
+        for _ in range(steps):
+            node = node.next
+        return node.value
+
+    def __version(
+            self,
+            front: __Node[T] | None, front_length: int,
+            rear: __Node[T] | None, rear_length: int,
+    ) -> "PersistentList[T]":
+        if rear_length > front_length:
+            front = self.__rotate(front, front_length, rear, rear_length)
+            front_length += rear_length
+            rear, rear_length = None, 0
+
+        version = type(self).__new__(type(self))
+        version.__front, version.__front_length = front, front_length
+        version.__rear, version.__rear_length = rear, rear_length
+        return version
+
+    def __rotate(
+            self,
+            front: __Node[T] | None, front_length: int,
+            rear: __Node[T], rear_length: int,
+    ) -> __Node[T]:
+        # one chain of the front values followed by the rear values in list
+        # order, built from its last node backwards
+        node = None
+        for _ in range(rear_length):
+            node = self.__Node(rear.value, node)
+            rear = rear.next
+        for value in self.__reversed_chain(front, front_length):
+            node = self.__Node(value, node)
+        return node
+
+    @staticmethod
+    def __reversed_chain(node: __Node[T] | None, length: int) -> Iterator[T]:
+        # one walk records every step-th node, then each segment between
+        # two of them is reversed on its own
+        step = max(1, isqrt(length))
+        checkpoints = []
+        for i in range(length):
+            if i % step == 0:
+                checkpoints.append(node)
+            node = node.next
+
+        for k in range(len(checkpoints) - 1, -1, -1):
+            node = checkpoints[k]
+            segment = []
+            for _ in range(min(step, length - k * step)):
+                segment.append(node.value)
+                node = node.next
+            yield from reversed(segment)
+
+    @staticmethod
+    def __chain_index(node: __Node[T] | None, value: T) -> int | None:
+        i = 0
+        while node is not None:
+            if node.value == value:
+                return i
+            node = node.next
+            i += 1
+        return None
+
+    def __insert_into(
+            self, node: __Node[T] | None, index: int, value: T
+    ) -> __Node[T]:
+        # copies the first `index` nodes and shares the rest of the chain
+        prefix = []
+        for _ in range(index):
+            prefix.append(node.value)
+            node = node.next
+        node = self.__Node(value, node)
+        for prefix_value in reversed(prefix):
+            node = self.__Node(prefix_value, node)
+        return node
+
+    def __remove_from(self, node: __Node[T], index: int) -> __Node[T] | None:
+        prefix = []
+        for _ in range(index):
+            prefix.append(node.value)
+            node = node.next
+        node = node.next
+        for prefix_value in reversed(prefix):
+            node = self.__Node(prefix_value, node)
+        return node
@@ -0,0 +1,117 @@
+import pickle
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import Any, BinaryIO, Iterable, Iterator
+
+# File layout: a header (magic, version, value count) followed by blocks of
+# up to BLOCK_SIZE values. A block header holds its kind and value count;
+# all-int64 and all-float64 blocks store the raw little-endian array, any
+# other block stores one length-prefixed pickle of its value list (version
+# 1 files pickled every value separately and can still be loaded). Loading
+# unpickles, so only load files from trusted sources.
+MAGIC = b"DSLL"
+VERSION = 2
+BLOCK_SIZE = 1 << 16
+
+HEADER = struct.Struct("<4sBQ")
+BLOCK_HEADER = struct.Struct("<BI")
+RECORD_LENGTH = struct.Struct("<I")
+PAYLOAD_LENGTH = struct.Struct("<Q")
+
+PICKLED, INT64, FLOAT64 = 0, 1, 2
+ARRAY_TYPECODES = {INT64: "q", FLOAT64: "d"}
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def dump_values(values: Iterable[Any], count: int, file: BinaryIO) -> None:
+    file.write(HEADER.pack(MAGIC, VERSION, count))
+    iterator = iter(values)
+    written = 0
+    while written < count:
+        block = list(islice(iterator, min(BLOCK_SIZE, count - written)))
+        if not block:
+            raise ValueError("Fewer values than announced")
+        _dump_block(block, file)
+        written += len(block)
+
+
+def load_values(file: BinaryIO) -> Iterator[list[Any]]:
+    """
+    Yields the values of a file written by dump_values one block at a time,
+    so a caller can extend a list without holding the whole file in memory.
+    """
+    magic, version, count = HEADER.unpack(_read_exactly(file, HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a serialized list")
+    if version not in (1, VERSION):
+        raise ValueError(f"Unsupported format version {version}")
+
+    remaining = count
+    while remaining:
+        kind, size = BLOCK_HEADER.unpack(_read_exactly(file, BLOCK_HEADER.size))
+        if size > remaining:
+            raise ValueError("Block exceeds the announced value count")
+        yield _load_block(kind, size, file, version)
+        remaining -= size
+
+
+def _block_kind(block: list[Any]) -> int:
+    first = type(block[0])
+    if first is int:
+        if all(type(v) is int for v in block) and (
+                INT64_MIN <= min(block) and max(block) <= INT64_MAX
+        ):
+            return INT64
+    elif first is float:
+        if all(type(v) is float for v in block):
+            return FLOAT64
+    return PICKLED
+
+
+def _dump_block(block: list[Any], file: BinaryIO) -> None:
+    kind = _block_kind(block)
+    file.write(BLOCK_HEADER.pack(kind, len(block)))
+    if kind == PICKLED:
+        payload = pickle.dumps(block, pickle.HIGHEST_PROTOCOL)
+        file.write(PAYLOAD_LENGTH.pack(len(payload)))
+        file.write(payload)
+        return
+
+    packed = array(ARRAY_TYPECODES[kind], block)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    file.write(packed.tobytes())
+
+
+def _load_block(kind: int, size: int, file: BinaryIO, version: int) -> list[Any]:
+    if kind == PICKLED and version == 1:
+        block = []
+        for _ in range(size):
+            (length,) = RECORD_LENGTH.unpack(_read_exactly(file, RECORD_LENGTH.size))
+            block.append(pickle.loads(_read_exactly(file, length)))
+        return block
+
+    if kind == PICKLED:
+        (length,) = PAYLOAD_LENGTH.unpack(_read_exactly(file, PAYLOAD_LENGTH.size))
+        block = pickle.loads(_read_exactly(file, length))
+        if not isinstance(block, list) or len(block) != size:
+            raise ValueError("Block does not match its announced value count")
+        return block
+
+    if kind not in ARRAY_TYPECODES:
+        raise ValueError(f"Unknown block kind {kind}")
+    packed = array(ARRAY_TYPECODES[kind])
+    packed.frombytes(_read_exactly(file, size * packed.itemsize))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _read_exactly(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise EOFError("Serialized list is truncated")
+    return data
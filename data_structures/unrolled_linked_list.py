@@ -0,0 +1,220 @@
+from typing import Generic, Iterator, Self, TypeVar
+
+from data_structures.list_view import ListView
+
+T = TypeVar("T")
+
+
+class UnrolledLinkedList(Generic[T]):
+    # noinspection PyTypeHints
+    class __Chunk(Generic[T]):
+        __slots__ = ("values", "next", "prev")
+        values: list[T]
+        next: Self | None
+        prev: Self | None
+
+        def __init__(self, values: list[T] | None = None):
+            self.values = [] if values is None else values
+            self.next = self.prev = None
+
+    __head: __Chunk[T] | None
+    __tail: __Chunk[T] | None
+    __length: int
+    __capacity: int
+
+    def __init__(self, chunk_capacity: int = 64):
+        if chunk_capacity < 2:
+            raise ValueError("Chunk capacity must be at least 2")
+
+        self.__head = self.__tail = None
+        self.__length = 0
+        self.__capacity = chunk_capacity
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[T]:
+        chunk = self.__head
+        while chunk is not None:
+            yield from chunk.values
+            chunk = chunk.next
+
+    @property
+    def chunk_capacity(self) -> int:
+        return self.__capacity
+
+    def append(self, value: T) -> None:
+        tail = self.__tail
+        if tail is None or len(tail.values) >= self.__capacity:
+            tail = self.__link_after(tail, self.__Chunk())
+        tail.values.append(value)
+        self.__length += 1
+
+    def prepend(self, value: T) -> None:
+        head = self.__head
+        if head is None or len(head.values) >= self.__capacity:
+            head = self.__link_before(head, self.__Chunk())
+        head.values.insert(0, value)
+        self.__length += 1
+
+    def extend(self, values: Iterator[T]) -> None:
+        capacity = self.__capacity
+        tail = self.__tail
+        for value in values:
+            if tail is None or len(tail.values) >= capacity:
+                tail = self.__link_after(tail, self.__Chunk())
+            tail.values.append(value)
+            self.__length += 1
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self.__length:
+            raise IndexError("Index out of bounds")
+
+        if index == self.__length:
+            self.append(value)
+            return
+
+        chunk, offset = self.__locate(index)
+        if len(chunk.values) >= self.__capacity:
+            self.__split(chunk)
+            if offset > len(chunk.values):
+                offset -= len(chunk.values)
+                chunk = chunk.next
+        chunk.values.insert(offset, value)
+        self.__length += 1
+
+    def remove(self, value: T) -> bool:
+        chunk = self.__head
+        while chunk is not None:
+            values = chunk.values
+            if value in values:
+                del values[values.index(value)]
+                self.__length -= 1
+                self.__rebalance(chunk)
+                return True
+            chunk = chunk.next
+
+        return False
+
+    def pop_front(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        head = self.__head
+        value = head.values.pop(0)
+        self.__length -= 1
+        if not head.values:
+            self.__unlink(head)
+        return value
+
+    def pop_back(self) -> T:
+        if self.__length == 0:
+            raise IndexError("Pop from empty list")
+
+        tail = self.__tail
+        value = tail.values.pop()
+        self.__length -= 1
+        if not tail.values:
+            self.__unlink(tail)
+        return value
+
+    def index_of(self, value: T) -> int | None:
+        base = 0
+        chunk = self.__head
+        while chunk is not None:
+            values = chunk.values
+            if value in values:
+                return base + values.index(value)
+            base += len(values)
+            chunk = chunk.next
+
+        return None
+
+    def get(self, index: int) -> T:
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of bounds")
+
+        chunk, offset = self.__locate(index)
+        return chunk.values[offset]
+
+    def view(self) -> ListView[T]:
+        return ListView(self)
+
+    def __locate(self, index: int) -> tuple[__Chunk[T], int]:
+        # walk whole chunks from the nearer end, then index inside the chunk
+        if index < self.__length // 2:
+            chunk = self.__head
+            while index >= len(chunk.values):
+                index -= len(chunk.values)
+                chunk = chunk.next
+            return chunk, index
+
+        remaining = self.__length - index
+        chunk = self.__tail
+        while remaining > len(chunk.values):
+            remaining -= len(chunk.values)
+            chunk = chunk.prev
+        return chunk, len(chunk.values) - remaining
+
+    def __link_after(
+            self, chunk: __Chunk[T] | None, new_chunk: __Chunk[T]
+    ) -> __Chunk[T]:
+        if chunk is None:
+            self.__head = self.__tail = new_chunk
+            return new_chunk
+
+        new_chunk.prev = chunk
+        new_chunk.next = chunk.next
+        if chunk.next is None:
+            self.__tail = new_chunk
+        else:
+            chunk.next.prev = new_chunk
+        chunk.next = new_chunk
+        return new_chunk
+
+    def __link_before(
+            self, chunk: __Chunk[T] | None, new_chunk: __Chunk[T]
+    ) -> __Chunk[T]:
+        if chunk is None or chunk.prev is None:
+            new_chunk.next = chunk
+            if chunk is None:
+                self.__tail = new_chunk
+            else:
+                chunk.prev = new_chunk
+            self.__head = new_chunk
+            return new_chunk
+
+        return self.__link_after(chunk.prev, new_chunk)
+
+    def __unlink(self, chunk: __Chunk[T]) -> None:
+        if chunk.prev is None:
+            self.__head = chunk.next
+        else:
+            chunk.prev.next = chunk.next
+        if chunk.next is None:
+            self.__tail = chunk.prev
+        else:
+            chunk.next.prev = chunk.prev
+        chunk.next = chunk.prev = None
+
+    def __split(self, chunk: __Chunk[T]) -> None:
+        half = len(chunk.values) // 2
+        new_chunk = self.__Chunk(chunk.values[half:])
+        del chunk.values[half:]
+        self.__link_after(chunk, new_chunk)
+
+    def __rebalance(self, chunk: __Chunk[T]) -> None:
+        # keep chunks at least half full by merging with the next neighbour
+        if not chunk.values:
+            self.__unlink(chunk)
+            return
+
+        next_chunk = chunk.next
+        if (
+                next_chunk is not None
+                and len(chunk.values) < self.__capacity // 2
+                and len(chunk.values) + len(next_chunk.values)
+                <= self.__capacity
+        ):
+            chunk.values.extend(next_chunk.values)
+            self.__unlink(next_chunk)
@@ -0,0 +1,9 @@
+import pytest
+
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.linked_list import LinkedList
+
+
+@pytest.fixture(params=[LinkedList, DoubleLinkedList], ids=["linked_list", "double_linked_list"])
+def list_cls(request: pytest.FixtureRequest) -> type:
+    return request.param
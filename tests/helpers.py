@@ -0,0 +1,7 @@
+from typing import Iterable
+
+
+def make(list_cls: type, values: Iterable, **options):
+    result = list_cls[int](**options)
+    result.extend(values)
+    return result
@@ -0,0 +1,46 @@
+from assertpy import assert_that
+
+from data_structures.array_double_linked_list import ArrayDoubleLinkedList
+
+
+def test_queue_churn_reuses_freed_slots():
+    # Arrange
+    queue = ArrayDoubleLinkedList[int]()
+    queue.extend(iter(range(8)))
+
+    # Act
+    for i in range(1_000):
+        queue.append(i)
+        queue.pop_front()
+
+    # Assert
+    assert_that(queue.capacity).is_equal_to(9)
+    assert_that(len(queue)).is_equal_to(8)
+
+
+def test_remove_and_pop_back_release_slots_for_insert():
+    # Arrange
+    values = ArrayDoubleLinkedList[int]()
+    values.extend(iter([1, 2, 3, 4]))
+
+    # Act
+    values.remove(2)
+    values.pop_back()
+    values.insert(1, 20)
+    values.insert(2, 30)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 20, 30, 3])
+    assert_that(values.capacity).is_equal_to(4)
+
+
+def test_get_walks_from_both_ends():
+    # Arrange
+    values = ArrayDoubleLinkedList[int]()
+    values.extend(iter(range(9)))
+
+    # Act
+    actual = [values.get(i) for i in range(9)]
+
+    # Assert
+    assert_that(actual).is_equal_to(list(range(9)))
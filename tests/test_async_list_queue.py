@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.async_list_queue import AsyncListQueue
+from data_structures.double_linked_list import DoubleLinkedList
+
+
+def test_get_returns_items_in_fifo_order():
+    # Arrange
+    async def scenario() -> list[int]:
+        queue = AsyncListQueue[int]()
+        for i in range(3):
+            await queue.put(i)
+        return [await queue.get() for _ in range(3)]
+
+    # Act
+    actual = asyncio.run(scenario())
+
+    # Assert
+    assert_that(actual).is_equal_to([0, 1, 2])
+
+
+def test_put_priority_jumps_the_queue():
+    # Arrange
+    async def scenario() -> list[str]:
+        queue = AsyncListQueue[str]()
+        await queue.put("normal-1")
+        await queue.put("normal-2")
+        await queue.put_priority("urgent")
+        return [await queue.get() for _ in range(3)]
+
+    # Act
+    actual = asyncio.run(scenario())
+
+    # Assert
+    assert_that(actual).is_equal_to(["urgent", "normal-1", "normal-2"])
+
+
+def test_get_waits_for_a_producer():
+    # Arrange
+    async def scenario() -> int:
+        queue = AsyncListQueue[int]()
+        consumer = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        await queue.put(7)
+        return await asyncio.wait_for(consumer, 1)
+
+    # Act
+    actual = asyncio.run(scenario())
+
+    # Assert
+    assert_that(actual).is_equal_to(7)
+
+
+def test_bounded_put_applies_backpressure_until_consumed():
+    # Arrange
+    async def scenario() -> tuple[bool, bool, list[int]]:
+        queue = AsyncListQueue[int](maxsize=2)
+        await queue.put(1)
+        await queue.put(2)
+        producer = asyncio.create_task(queue.put(3))
+        await asyncio.sleep(0.01)
+        blocked = not producer.done()
+        await queue.get()
+        await asyncio.wait_for(producer, 1)
+        return blocked, queue.full(), [await queue.get(), await queue.get()]
+
+    # Act
+    blocked, full, rest = asyncio.run(scenario())
+
+    # Assert
+    assert_that(blocked).is_true()
+    assert_that(full).is_true()
+    assert_that(rest).is_equal_to([2, 3])
+
+
+def test_nowait_variants_raise_on_full_and_empty():
+    # Arrange
+    queue = AsyncListQueue[int](maxsize=1)
+
+    # Act / Assert
+    assert_that(queue.get_nowait).raises(asyncio.QueueEmpty).when_called_with()
+    queue.put_nowait(1)
+    assert_that(queue.put_nowait).raises(asyncio.QueueFull).when_called_with(2)
+    assert_that(queue.put_priority_nowait).raises(asyncio.QueueFull).when_called_with(2)
+
+
+def test_get_batch_drains_up_to_max_n_in_order():
+    # Arrange
+    async def scenario() -> tuple[DoubleLinkedList[int], int]:
+        queue = AsyncListQueue[int]()
+        for i in range(10):
+            queue.put_nowait(i)
+        batch = await queue.get_batch(4)
+        return batch, queue.qsize()
+
+    # Act
+    batch, remaining = asyncio.run(scenario())
+
+    # Assert
+    assert_that(batch).is_instance_of(DoubleLinkedList)
+    assert_that(list(batch)).is_equal_to([0, 1, 2, 3])
+    assert_that(remaining).is_equal_to(6)
+
+
+def test_get_batch_returns_empty_list_on_timeout():
+    # Arrange
+    async def scenario() -> tuple[DoubleLinkedList[int], int]:
+        queue = AsyncListQueue[int]()
+        batch = await queue.get_batch(10, timeout=0.01)
+        queue.put_nowait(1)
+        return batch, await queue.get()
+
+    # Act
+    batch, after = asyncio.run(scenario())
+
+    # Assert
+    assert_that(list(batch)).is_empty()
+    assert_that(after).is_equal_to(1)
+
+
+@pytest.mark.parametrize("steps", [0, 1, 2, 3])
+@pytest.mark.parametrize("timeout", [5, None], ids=["timeout", "no_timeout"])
+def test_get_batch_never_returns_empty_to_a_competing_consumer(
+        timeout: float | None, steps: int
+):
+    # Arrange
+    async def scenario() -> tuple[list[int], list[int], list[int]]:
+        queue = AsyncListQueue[int]()
+        batcher = asyncio.create_task(queue.get_batch(10, timeout=timeout))
+        await asyncio.sleep(0)
+        queue.put_nowait(1)
+        # a competing consumer gets in `steps` event loop steps later
+        for _ in range(steps):
+            await asyncio.sleep(0)
+        taken = [queue.get_nowait()] if queue.qsize() else []
+        await asyncio.sleep(0.02)
+        queue.put_nowait(2)
+        batch = await asyncio.wait_for(batcher, 1)
+        left = [queue.get_nowait() for _ in range(queue.qsize())]
+        return taken, list(batch), left
+
+    # Act
+    taken, batch, left = asyncio.run(scenario())
+
+    # Assert
+    assert_that(batch).is_not_empty()
+    assert_that(taken + batch + left).contains_only(1, 2).is_length(2)
+
+
+def test_get_batch_releases_blocked_producers():
+    # Arrange
+    async def scenario() -> list[int]:
+        queue = AsyncListQueue[int](maxsize=2)
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        producers = [asyncio.create_task(queue.put(i)) for i in (3, 4)]
+        await asyncio.sleep(0.01)
+        first = await queue.get_batch(2)
+        await asyncio.wait_for(asyncio.gather(*producers), 1)
+        second = await queue.get_batch(5)
+        return list(first) + list(second)
+
+    # Act
+    actual = asyncio.run(scenario())
+
+    # Assert
+    assert_that(actual).is_equal_to([1, 2, 3, 4])
+
+
+def test_invalid_batch_size_raises_value_error():
+    # Arrange
+    queue = AsyncListQueue[int]()
+
+    # Act / Assert
+    assert_that(asyncio.run).raises(ValueError).when_called_with(queue.get_batch(0))
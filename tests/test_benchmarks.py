@@ -0,0 +1,111 @@
+import json
+
+from assertpy import assert_that
+
+from benchmarks import caches, concurrency
+from benchmarks.list_benchmarks import (
+    fit_complexity,
+    find_regressions,
+    main,
+    run_suite,
+)
+
+
+def test_fit_complexity_recognises_linear_growth():
+    # Arrange
+    sizes = [1_000, 10_000, 100_000]
+    timings = [2.0 * size for size in sizes]
+
+    # Act
+    label, slope = fit_complexity(sizes, timings)
+
+    # Assert
+    assert_that(label).is_equal_to("O(n)")
+    assert_that(slope).is_close_to(1.0, 0.01)
+
+
+def test_fit_complexity_recognises_constant_time():
+    # Arrange
+    sizes = [1_000, 10_000, 100_000]
+    timings = [50.0, 51.0, 49.0]
+
+    # Act
+    label, _ = fit_complexity(sizes, timings)
+
+    # Assert
+    assert_that(label).is_equal_to("O(1)")
+
+
+def test_run_suite_reports_every_backend_operation_and_size():
+    # Arrange
+    backends = ["linked_list", "list"]
+    operations = ["append", "pop_back", "get"]
+    sizes = [16, 32, 64]
+
+    # Act
+    results = run_suite(backends, operations, sizes, time_budget=0.001)
+
+    # Assert
+    assert_that(results["timings"]).is_length(18)
+    assert_that(results["memory"]).is_length(6)
+    assert_that(results["complexity"]).is_length(6)
+    assert_that([row["ns_per_op"] > 0 for row in results["timings"]]).does_not_contain(False)
+
+
+def test_find_regressions_flags_slowdowns_over_threshold():
+    # Arrange
+    baseline = {"timings": [
+        {"backend": "list", "operation": "get", "size": 10, "ns_per_op": 100.0},
+        {"backend": "list", "operation": "append", "size": 10, "ns_per_op": 100.0},
+    ]}
+    current = {"timings": [
+        {"backend": "list", "operation": "get", "size": 10, "ns_per_op": 200.0},
+        {"backend": "list", "operation": "append", "size": 10, "ns_per_op": 110.0},
+    ]}
+
+    # Act
+    regressions = find_regressions(current, baseline, threshold=1.25)
+
+    # Assert
+    assert_that(regressions).is_length(1)
+    assert_that(regressions[0]).starts_with("list get n=10")
+
+
+def test_main_writes_json_results(tmp_path):
+    # Arrange
+    output = tmp_path / "results.json"
+
+    # Act
+    exit_code = main([
+        "--sizes", "8", "16",
+        "--backends", "deque",
+        "--ops", "append",
+        "--time-budget", "0.001",
+        "--output", str(output),
+    ])
+
+    # Assert
+    assert_that(exit_code).is_equal_to(0)
+    assert_that(json.loads(output.read_text())["timings"]).is_length(2)
+
+
+def test_concurrency_benchmark_reports_each_queue_and_thread_count():
+    # Arrange
+
+    # Act
+    results = concurrency.run([1, 2], items_per_producer=200)
+
+    # Assert
+    assert_that(results["throughput"]).is_length(4)
+    assert_that(results["meta"]).contains_key("gil_enabled")
+
+
+def test_cache_benchmark_reports_each_cache_and_capacity():
+    # Arrange
+
+    # Act
+    results = caches.run([4, 16], lookups=500, key_space=64)
+
+    # Assert
+    assert_that(results["timings"]).is_length(2 * len(caches.CACHES))
+    assert_that([row["ns_per_lookup"] > 0 for row in results["timings"]]).does_not_contain(False)
@@ -0,0 +1,149 @@
+import random
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.btree_list import BTreeList
+
+
+def make(values: list[int], node_capacity: int = 4) -> BTreeList[int]:
+    result = BTreeList[int](node_capacity)
+    result.extend(values)
+    return result
+
+
+def test_capacity_below_four_raises_value_error():
+    # Act / Assert
+    assert_that(BTreeList).raises(ValueError).when_called_with(3)
+
+
+def test_extend_builds_balanced_tree():
+    # Arrange
+    values = BTreeList[int](4)
+
+    # Act
+    values.extend(range(64))
+
+    # Assert
+    assert_that(list(values)).is_equal_to(list(range(64)))
+    assert_that(values.height).is_equal_to(2)
+
+
+def test_random_inserts_and_deletes_match_builtin_list():
+    # Arrange
+    rng = random.Random(20)
+    values = make([])
+    expected = []
+
+    # Act
+    for i in range(2_000):
+        if expected and rng.random() < 0.4:
+            index = rng.randrange(-len(expected), len(expected))
+            del values[index]
+            del expected[index]
+        else:
+            index = rng.randint(0, len(expected))
+            values.insert(index, i)
+            expected.insert(index, i)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(expected)
+    assert_that([values[i] for i in range(len(expected))]).is_equal_to(expected)
+
+
+def test_tree_shrinks_back_to_a_leaf():
+    # Arrange
+    values = make(list(range(100)))
+
+    # Act
+    while len(values) > 1:
+        values.pop_back()
+
+    # Assert
+    assert_that(values.height).is_equal_to(0)
+    assert_that(list(values)).is_equal_to([0])
+
+
+@pytest.mark.parametrize("index", [2, -3])
+def test_item_access_out_of_range_raises_index_error(index: int):
+    # Arrange
+    values = make([1, 2])
+
+    # Act / Assert
+    assert_that(values.__getitem__).raises(IndexError).when_called_with(index)
+    assert_that(values.__delitem__).raises(IndexError).when_called_with(index)
+
+
+def test_get_rejects_negative_index():
+    # Arrange
+    values = make([1, 2])
+
+    # Act / Assert
+    assert_that(values.get).raises(IndexError).when_called_with(-1)
+
+
+def test_setitem_replaces_value():
+    # Arrange
+    values = make(list(range(10)))
+
+    # Act
+    values[-2] = 80
+
+    # Assert
+    assert_that(values.get(8)).is_equal_to(80)
+
+
+@pytest.mark.parametrize("left_size, right_size", [(0, 5), (5, 0), (3, 200), (200, 3), (70, 70)])
+def test_concat_joins_trees_of_any_height(left_size: int, right_size: int):
+    # Arrange
+    left = make(list(range(left_size)))
+    right = make(list(range(left_size, left_size + right_size)))
+
+    # Act
+    left.concat(right)
+    left.append(-1)
+
+    # Assert
+    assert_that(list(left)).is_equal_to(list(range(left_size + right_size)) + [-1])
+    assert_that(len(right)).is_equal_to(0)
+
+
+@pytest.mark.parametrize("index", [0, 1, 37, 199, 200])
+def test_split_at_divides_list(index: int):
+    # Arrange
+    values = make(list(range(200)))
+
+    # Act
+    rest = values.split_at(index)
+    values.append(-1)
+    rest.prepend(-2)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(list(range(index)) + [-1])
+    assert_that(list(rest)).is_equal_to([-2] + list(range(index, 200)))
+    assert_that(len(values) + len(rest)).is_equal_to(202)
+
+
+def test_split_and_concat_round_trip():
+    # Arrange
+    rng = random.Random(3)
+    values = make(list(range(500)))
+
+    # Act
+    for _ in range(50):
+        rest = values.split_at(rng.randint(0, 500))
+        rest.concat(values)
+        values = rest
+
+    # Assert
+    assert_that(sorted(values)).is_equal_to(list(range(500)))
+    assert_that(len(values)).is_equal_to(500)
+
+
+def test_concat_rejects_self_and_foreign_lists():
+    # Arrange
+    values = make([1])
+
+    # Act / Assert
+    assert_that(values.concat).raises(ValueError).when_called_with(values)
+    assert_that(values.concat).raises(TypeError).when_called_with([2])
@@ -0,0 +1,134 @@
+import sys
+import threading
+import time
+
+from assertpy import assert_that
+
+from data_structures.concurrent_double_linked_list import ConcurrentDoubleLinkedList
+
+
+def test_pop_front_with_timeout_raises_after_waiting():
+    # Arrange
+    queue = ConcurrentDoubleLinkedList[int]()
+    start = time.monotonic()
+
+    # Act / Assert
+    assert_that(queue.pop_front).raises(IndexError).when_called_with(timeout=0.05)
+    assert_that(time.monotonic() - start).is_greater_than_or_equal_to(0.04)
+
+
+def test_blocking_pop_front_wakes_up_on_append():
+    # Arrange
+    queue = ConcurrentDoubleLinkedList[int]()
+    received = []
+    consumer = threading.Thread(target=lambda: received.append(queue.pop_front(timeout=None)))
+    consumer.start()
+    time.sleep(0.02)
+
+    # Act
+    queue.append(42)
+    consumer.join(timeout=2)
+
+    # Assert
+    assert_that(consumer.is_alive()).is_false()
+    assert_that(received).is_equal_to([42])
+
+
+def test_pop_back_and_pop_front_on_single_element_leave_consistent_list():
+    # Arrange
+    queue = ConcurrentDoubleLinkedList[int]()
+
+    # Act
+    queue.append(1)
+    back = queue.pop_back()
+    queue.append(2)
+    queue.prepend(0)
+    front = queue.pop_front()
+
+    # Assert
+    assert_that(back).is_equal_to(1)
+    assert_that(front).is_equal_to(0)
+    assert_that(list(queue)).is_equal_to([2])
+    assert_that(queue.pop_back()).is_equal_to(2)
+    assert_that(len(queue)).is_equal_to(0)
+
+
+def test_len_never_goes_negative_under_concurrent_traffic():
+    # Arrange
+    queue = ConcurrentDoubleLinkedList[int]()
+    stop = threading.Event()
+    lengths = []
+
+    def churn() -> None:
+        while not stop.is_set():
+            queue.append(1)
+            queue.pop_front()
+
+    def measure() -> None:
+        for _ in range(20_000):
+            lengths.append(len(queue))
+
+    workers = [threading.Thread(target=churn) for _ in range(2)]
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    # Act
+    try:
+        for worker in workers:
+            worker.start()
+        measure()
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join(timeout=5)
+        sys.setswitchinterval(interval)
+
+    # Assert
+    assert_that(min(lengths)).is_greater_than_or_equal_to(0)
+    assert_that(len(queue)).is_equal_to(0)
+
+
+def test_producers_and_consumers_transfer_every_item_once():
+    # Arrange
+    queue = ConcurrentDoubleLinkedList[int]()
+    producers, consumers, per_producer = 4, 4, 2_000
+    consumed: list[list[int]] = [[] for _ in range(consumers)]
+
+    def produce(offset: int) -> None:
+        for i in range(per_producer):
+            queue.append(offset + i)
+
+    def consume(sink: list[int]) -> None:
+        while True:
+            value = queue.pop_front(timeout=5)
+            if value < 0:
+                return
+            sink.append(value)
+
+    threads = [
+        threading.Thread(target=consume, args=(sink,)) for sink in consumed
+    ]
+    producer_threads = [
+        threading.Thread(target=produce, args=(p * per_producer,))
+        for p in range(producers)
+    ]
+
+    # Act
+    for thread in threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    queue.extend([-1] * consumers)
+    for thread in threads:
+        thread.join(timeout=10)
+
+    # Assert
+    everything = sorted(value for sink in consumed for value in sink)
+    assert_that(everything).is_equal_to(list(range(producers * per_producer)))
+    assert_that(len(queue)).is_equal_to(0)
+    for sink in consumed:
+        # FIFO: one consumer sees each producer's items in production order
+        for p in range(producers):
+            from_producer = [v for v in sink if v // per_producer == p]
+            assert_that(from_producer).is_sorted()
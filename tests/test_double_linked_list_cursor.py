@@ -0,0 +1,218 @@
+import pytest
+from assertpy import assert_that
+
+from data_structures.double_linked_list import DoubleLinkedList
+
+
+def make(values: list[int], **options) -> DoubleLinkedList[int]:
+    result = DoubleLinkedList[int](**options)
+    result.extend(values)
+    return result
+
+
+def test_reversed_yields_back_to_front():
+    # Arrange
+    values = make([1, 2, 3])
+
+    # Act
+    result = list(reversed(values))
+
+    # Assert
+    assert_that(result).is_equal_to([3, 2, 1])
+
+
+def test_reversed_empty_list_yields_nothing():
+    # Arrange
+    values = make([])
+
+    # Act
+    result = list(reversed(values))
+
+    # Assert
+    assert_that(result).is_empty()
+
+
+@pytest.mark.parametrize("index", [-1, 4])
+def test_cursor_out_of_range_raises_index_error(index: int):
+    # Arrange
+    values = make([1, 2, 3])
+
+    # Act / Assert
+    assert_that(values.cursor).raises(IndexError).when_called_with(index)
+
+
+def test_cursor_moves_both_ways_and_wraps_through_end():
+    # Arrange
+    values = make([1, 2, 3])
+    cursor = values.cursor(1)
+
+    # Act
+    seen = [cursor.value]
+    cursor.move_next()
+    seen.append(cursor.value)
+    cursor.move_next()
+    at_end = cursor.at_end
+    end_index = cursor.index
+    cursor.move_next()
+    seen.append(cursor.value)
+    cursor.move_prev()
+    wrapped_back = cursor.at_end
+    cursor.move_prev()
+    seen.append(cursor.value)
+
+    # Assert
+    assert_that(seen).is_equal_to([2, 3, 1, 3])
+    assert_that(at_end).is_true()
+    assert_that(end_index).is_equal_to(3)
+    assert_that(wrapped_back).is_true()
+    assert_that(cursor.index).is_equal_to(2)
+
+
+def test_cursor_at_end_has_no_value():
+    # Arrange
+    cursor = make([1]).cursor(1)
+
+    # Act / Assert
+    with pytest.raises(IndexError):
+        _ = cursor.value
+    assert_that(cursor.remove_current).raises(IndexError).when_called_with()
+    assert_that(cursor.replace).raises(IndexError).when_called_with(0)
+
+
+def test_cursor_inserts_around_current_node():
+    # Arrange
+    values = make([1, 2, 3])
+    cursor = values.cursor(1)
+
+    # Act
+    cursor.insert_before(10)
+    cursor.insert_after(20)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 10, 2, 20, 3])
+    assert_that(list(reversed(values))).is_equal_to([3, 20, 2, 10, 1])
+    assert_that(cursor.value).is_equal_to(2)
+    assert_that(cursor.index).is_equal_to(2)
+
+
+def test_cursor_inserts_at_end_position_append_and_prepend():
+    # Arrange
+    values = make([])
+    cursor = values.cursor()
+
+    # Act
+    cursor.insert_before(2)
+    cursor.insert_after(1)
+    cursor.insert_before(3)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 3])
+    assert_that(cursor.at_end).is_true()
+    assert_that(cursor.index).is_equal_to(3)
+
+
+def test_cursor_filters_in_place_in_one_pass():
+    # Arrange
+    values = make(list(range(10)))
+    cursor = values.cursor()
+
+    # Act
+    while not cursor.at_end:
+        if cursor.value % 3 == 0:
+            cursor.remove_current()
+        else:
+            cursor.move_next()
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 4, 5, 7, 8])
+    assert_that(list(reversed(values))).is_equal_to([8, 7, 5, 4, 2, 1])
+    assert_that(len(values)).is_equal_to(6)
+    assert_that(values.get(5)).is_equal_to(8)
+
+
+def test_cursor_replace_returns_old_value():
+    # Arrange
+    values = make([1, 2, 3])
+    cursor = values.cursor(2)
+
+    # Act
+    old = cursor.replace(30)
+
+    # Assert
+    assert_that(old).is_equal_to(3)
+    assert_that(list(values)).is_equal_to([1, 2, 30])
+
+
+def test_cursor_edits_keep_value_index_and_pool_in_sync():
+    # Arrange
+    values = make([1, 2, 3], node_pool_size=4, index_values=True)
+    cursor = values.cursor()
+
+    # Act
+    cursor.remove_current()
+    cursor.replace(20)
+    cursor.insert_after(4)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([20, 4, 3])
+    assert_that(1 in values).is_false()
+    assert_that(2 in values).is_false()
+    assert_that(values.index_of(4)).is_equal_to(1)
+    assert_that(values.node_pool.hits).is_equal_to(1)
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda values: values.remove(2),
+        lambda values: values.pop_back(),
+        lambda values: values.append(4),
+        lambda values: values.insert(1, 9),
+        lambda values: values.sort(reverse=True),
+        lambda values: values.__delitem__(slice(0, 1)),
+        lambda values: values.split_at(1),
+    ],
+    ids=["remove", "pop_back", "append", "insert", "sort", "del_slice", "split_at"],
+)
+def test_cursor_raises_after_edit_through_the_list(edit):
+    # Arrange
+    values = make([1, 2, 3])
+    cursor = values.cursor(1)
+
+    # Act
+    edit(values)
+
+    # Assert
+    assert_that(cursor.remove_current).raises(RuntimeError).when_called_with()
+    assert_that(cursor.insert_before).raises(RuntimeError).when_called_with(9)
+    assert_that(cursor.move_next).raises(RuntimeError).when_called_with()
+
+
+def test_cursor_stays_valid_across_its_own_edits_and_value_changes():
+    # Arrange
+    values = make([1, 2, 3])
+    cursor = values.cursor(1)
+
+    # Act
+    cursor.insert_before(9)
+    cursor.remove_current()
+    values[0] = 7
+    cursor.insert_after(8)
+
+    # Assert
+    assert_that(cursor.value).is_equal_to(3)
+    assert_that(list(values)).is_equal_to([7, 9, 3, 8])
+
+
+def test_edit_through_one_cursor_invalidates_another():
+    # Arrange
+    values = make([1, 2, 3])
+    first = values.cursor(0)
+    second = values.cursor(2)
+
+    # Act
+    first.remove_current()
+
+    # Assert
+    assert_that(first.value).is_equal_to(2)
+    assert_that(second.move_prev).raises(RuntimeError).when_called_with()
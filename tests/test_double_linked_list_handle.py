@@ -0,0 +1,169 @@
+import pickle
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.double_linked_list import DoubleLinkedList
+
+
+def make_with_handles(values) -> tuple[DoubleLinkedList, list]:
+    result = DoubleLinkedList(handles=True)
+    return result, [result.append(value) for value in values]
+
+
+def test_insertions_return_handles_only_when_enabled():
+    # Arrange
+    plain = DoubleLinkedList()
+    with_handles = DoubleLinkedList(handles=True)
+
+    # Act
+    plain_results = [plain.append(1), plain.prepend(0), plain.insert(1, 5)]
+    handles = [with_handles.append(1), with_handles.prepend(0), with_handles.insert(1, 5)]
+
+    # Assert
+    assert_that(plain_results).is_equal_to([None, None, None])
+    assert_that([h.value for h in handles]).is_equal_to([1, 0, 5])
+    assert_that(list(with_handles)).is_equal_to([0, 5, 1])
+
+
+def test_remove_handle_removes_that_exact_element():
+    # Arrange
+    values, handles = make_with_handles(["x", "y", "x", "x"])
+
+    # Act
+    removed = values.remove_handle(handles[2])
+
+    # Assert
+    assert_that(removed).is_equal_to("x")
+    assert_that(list(values)).is_equal_to(["x", "y", "x"])
+    assert_that(handles[2].valid).is_false()
+    assert_that(handles[3].valid).is_true()
+
+
+def test_stale_handle_raises_value_error():
+    # Arrange
+    values, handles = make_with_handles([1, 2, 3])
+    values.remove_handle(handles[1])
+
+    # Act / Assert
+    assert_that(values.remove_handle).raises(ValueError).when_called_with(handles[1])
+    assert_that(values.move_to_front).raises(ValueError).when_called_with(handles[1])
+    assert_that(values.insert_after).raises(ValueError).when_called_with(handles[1], 9)
+    assert_that(list(values)).is_equal_to([1, 3])
+
+
+@pytest.mark.parametrize(
+    "remove",
+    [
+        lambda values: values.remove(3),
+        lambda values: values.pop_back(),
+        lambda values: values.pop_front_many(3),
+        lambda values: values.__delitem__(slice(1, None)),
+        lambda values: values.__setitem__(slice(1, 3), ["a"]),
+        lambda values: list(values.drain()),
+    ],
+    ids=["remove", "pop_back", "pop_front_many", "del_slice", "set_slice", "drain"],
+)
+def test_any_removal_makes_handles_stale(remove):
+    # Arrange
+    values, handles = make_with_handles([1, 2, 3])
+
+    # Act
+    remove(values)
+
+    # Assert
+    assert_that(handles[2].valid).is_false()
+
+
+def test_handles_survive_other_edits_and_sort():
+    # Arrange
+    values, handles = make_with_handles([3, 1, 2])
+
+    # Act
+    values.prepend(0)
+    values.insert(2, 7)
+    values.pop_front()
+    values.sort()
+    values.remove_handle(handles[0])
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 7])
+    assert_that([h.valid for h in handles]).is_equal_to([False, True, True])
+
+
+def test_move_to_front_and_back():
+    # Arrange
+    values, handles = make_with_handles([1, 2, 3, 4])
+
+    # Act
+    values.move_to_front(handles[2])
+    values.move_to_back(handles[0])
+    values.move_to_front(handles[2])
+
+    # Assert
+    assert_that(list(values)).is_equal_to([3, 2, 4, 1])
+    assert_that(list(reversed(values))).is_equal_to([1, 4, 2, 3])
+    assert_that(values[1]).is_equal_to(2)
+
+
+def test_insert_after_returns_a_handle():
+    # Arrange
+    values, handles = make_with_handles([1, 3])
+
+    # Act
+    middle = values.insert_after(handles[0], 2)
+    last = values.insert_after(handles[1], 4)
+    values.remove_handle(middle)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 3, 4])
+    assert_that(last.value).is_equal_to(4)
+    assert_that(values.pop_back()).is_equal_to(4)
+
+
+def test_handle_of_another_list_is_rejected():
+    # Arrange
+    first, handles = make_with_handles([1])
+    second, _ = make_with_handles([1])
+
+    # Act / Assert
+    assert_that(second.remove_handle).raises(ValueError).when_called_with(handles[0])
+
+
+def test_relinking_between_lists_makes_handles_stale():
+    # Arrange
+    first, first_handles = make_with_handles([1, 2])
+    second, second_handles = make_with_handles([3, 4])
+
+    # Act
+    first.concat(second)
+    rest = first.split_at(3)
+
+    # Assert
+    assert_that(list(first)).is_equal_to([1, 2, 3])
+    assert_that(list(rest)).is_equal_to([4])
+    assert_that([h.valid for h in first_handles + second_handles]).does_not_contain(True)
+    assert_that(rest.append(5).value).is_equal_to(5)
+
+
+def test_handles_are_kept_by_copies_and_pickles():
+    # Arrange
+    values, _ = make_with_handles([1, 2])
+
+    # Act
+    copy = pickle.loads(pickle.dumps(values))
+
+    # Assert
+    assert_that(copy.append(3).value).is_equal_to(3)
+    assert_that(values[0:1].append(4).value).is_equal_to(4)
+
+
+def test_handles_exclude_pools_and_snapshots():
+    # Arrange
+    values = DoubleLinkedList(handles=True)
+
+    # Act / Assert
+    assert_that(DoubleLinkedList).raises(ValueError).when_called_with(
+        node_pool_size=8, handles=True
+    )
+    assert_that(values.snapshot).raises(ValueError).when_called_with()
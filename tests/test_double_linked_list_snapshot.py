@@ -0,0 +1,148 @@
+import gc
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.instrumentation import InstrumentedDoubleLinkedList
+
+
+def make(values: list[int], **options) -> DoubleLinkedList[int]:
+    result = DoubleLinkedList[int](**options)
+    result.extend(values)
+    return result
+
+
+def test_snapshot_ignores_appends_and_prepends():
+    # Arrange
+    values = make([1, 2, 3])
+    snapshot = values.snapshot()
+
+    # Act
+    values.append(4)
+    values.extend([5, 6])
+    values.prepend(0)
+
+    # Assert
+    assert_that(list(snapshot)).is_equal_to([1, 2, 3])
+    assert_that(list(reversed(snapshot))).is_equal_to([3, 2, 1])
+    assert_that(list(values)).is_equal_to([0, 1, 2, 3, 4, 5, 6])
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda values: values.pop_front(),
+        lambda values: values.pop_back(),
+        lambda values: values.remove(2),
+        lambda values: values.insert(1, 9),
+        lambda values: values.__setitem__(0, 9),
+        lambda values: values.__delitem__(slice(None, None, 2)),
+        lambda values: values.sort(reverse=True),
+        lambda values: list(values.drain()),
+        lambda values: values.split_at(1),
+        lambda values: values.pop_back_many(2),
+    ],
+    ids=[
+        "pop_front", "pop_back", "remove", "insert", "setitem", "delitem",
+        "sort", "drain", "split_at", "pop_back_many",
+    ],
+)
+def test_snapshot_is_unaffected_by_writes(mutate):
+    # Arrange
+    values = make([1, 2, 3], node_pool_size=4, index_values=True)
+    snapshot = values.snapshot()
+    expected = [1, 2, 3]
+
+    # Act
+    mutate(values)
+
+    # Assert
+    assert_that(list(snapshot)).is_equal_to(expected)
+    assert_that(list(reversed(snapshot))).is_equal_to(expected[::-1])
+    assert_that([snapshot.get(i) for i in range(3)]).is_equal_to(expected)
+
+
+def test_list_stays_consistent_after_copy_on_write():
+    # Arrange
+    values = make([3, 1, 2], index_values=True)
+    snapshot = values.snapshot()
+
+    # Act
+    values.remove(1)
+    values.append(4)
+    values[0] = 30
+
+    # Assert
+    assert_that(list(values)).is_equal_to([30, 2, 4])
+    assert_that(3 in values).is_false()
+    assert_that(values.index_of(4)).is_equal_to(2)
+    assert_that(list(snapshot)).is_equal_to([3, 1, 2])
+
+
+def test_splice_and_concat_do_not_touch_other_lists_snapshots():
+    # Arrange
+    values = make([1, 2])
+    other = make([10, 20])
+    snapshot = other.snapshot()
+
+    # Act
+    values.splice(1, other)
+    values.pop_back()
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 10, 20])
+    assert_that(list(snapshot)).is_equal_to([10, 20])
+    assert_that(len(other)).is_equal_to(0)
+
+
+def test_cursor_follows_list_across_copy_on_write():
+    # Arrange
+    values = make([1, 2, 3, 4])
+    cursor = values.cursor(1)
+    snapshot = values.snapshot()
+
+    # Act
+    cursor.remove_current()
+    cursor.replace(30)
+    cursor.move_next()
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 30, 4])
+    assert_that(cursor.value).is_equal_to(4)
+    assert_that(list(snapshot)).is_equal_to([1, 2, 3, 4])
+
+
+def test_live_snapshot_copies_once_and_dropped_one_not_at_all():
+    # Arrange
+    values = InstrumentedDoubleLinkedList[int]()
+    values.extend([1, 2, 3, 4])
+    snapshot = values.snapshot()
+
+    # Act
+    values.pop_front()
+    first_write = values.operation_counts.last.allocations
+    values.pop_front()
+    second_write = values.operation_counts.last.allocations
+    del snapshot
+    values.snapshot()
+    gc.collect()
+    values.pop_front()
+    after_drop = values.operation_counts.last.allocations
+
+    # Assert
+    assert_that(first_write).is_equal_to(4)
+    assert_that(second_write).is_equal_to(0)
+    assert_that(after_drop).is_equal_to(0)
+    assert_that(list(values)).is_equal_to([4])
+
+
+def test_snapshot_search_and_bounds():
+    # Arrange
+    snapshot = make([5, 6, 7]).snapshot()
+
+    # Act / Assert
+    assert_that(6 in snapshot).is_true()
+    assert_that(snapshot.index_of(8)).is_none()
+    assert_that(snapshot.get).raises(IndexError).when_called_with(3)
+    assert_that(len(snapshot)).is_equal_to(3)
@@ -0,0 +1,64 @@
+import random
+
+from assertpy import assert_that
+
+from data_structures.indexable_skip_list import IndexableSkipList
+
+
+def test_random_inserts_and_gets_match_builtin_list():
+    # Arrange
+    rng = random.Random(7)
+    values = IndexableSkipList[int](seed=7)
+    expected: list[int] = []
+
+    # Act
+    for i in range(2_000):
+        index = rng.randint(0, len(expected))
+        values.insert(index, i)
+        expected.insert(index, i)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(expected)
+    assert_that([values.get(i) for i in range(len(expected))]).is_equal_to(expected)
+
+
+def test_mixed_deletes_keep_widths_consistent():
+    # Arrange
+    rng = random.Random(11)
+    values = IndexableSkipList[int](seed=11)
+    expected: list[int] = []
+
+    # Act
+    for i in range(3_000):
+        operation = rng.randrange(5)
+        if operation < 2 or not expected:
+            index = rng.randint(0, len(expected))
+            values.insert(index, i)
+            expected.insert(index, i)
+        elif operation == 2:
+            assert_that(values.pop_front()).is_equal_to(expected.pop(0))
+        elif operation == 3:
+            assert_that(values.pop_back()).is_equal_to(expected.pop())
+        else:
+            value = rng.choice(expected)
+            assert_that(values.remove(value)).is_true()
+            expected.remove(value)
+
+    # Assert
+    assert_that(len(values)).is_equal_to(len(expected))
+    assert_that([values.get(i) for i in range(len(expected))]).is_equal_to(expected)
+
+
+def test_draining_to_empty_allows_reuse():
+    # Arrange
+    values = IndexableSkipList[int](seed=1)
+    values.extend(iter(range(100)))
+
+    # Act
+    while len(values):
+        values.pop_back()
+    values.append(5)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([5])
+    assert_that(values.get(0)).is_equal_to(5)
@@ -0,0 +1,217 @@
+import pytest
+from assertpy import assert_that
+
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.instrumentation import (
+    InstrumentedDoubleLinkedList,
+    InstrumentedLinkedList,
+)
+from data_structures.linked_list import LinkedList
+
+from helpers import make
+
+
+INSTRUMENTED = {
+    LinkedList: InstrumentedLinkedList,
+    DoubleLinkedList: InstrumentedDoubleLinkedList,
+}
+
+
+@pytest.fixture
+def list_cls(list_cls: type) -> type:
+    # the instrumented counterpart of the shared list class
+    return INSTRUMENTED[list_cls]
+
+
+def make_counted(list_cls: type, size: int, **options):
+    result = make(list_cls, range(size), **options)
+    result.operation_counts.reset()
+    return result
+
+
+def test_instrumented_lists_are_drop_in_subclasses():
+    # Arrange
+
+    # Act
+    singly = InstrumentedLinkedList[int]()
+    doubly = InstrumentedDoubleLinkedList[int]()
+
+    # Assert
+    assert_that(singly).is_instance_of(LinkedList)
+    assert_that(doubly).is_instance_of(DoubleLinkedList)
+
+
+def test_extend_counts_one_allocation_per_value(list_cls: type):
+    # Arrange
+    values = list_cls[int]()
+
+    # Act
+    values.extend([1, 2, 3, 4])
+
+    # Assert
+    counts = values.operation_counts.per_method["extend"]
+    assert_that(counts.calls).is_equal_to(1)
+    assert_that(counts.allocations).is_equal_to(4)
+    assert_that(list(values)).is_equal_to([1, 2, 3, 4])
+
+
+def test_pooled_nodes_are_not_counted_as_allocations(list_cls: type):
+    # Arrange
+    values = make_counted(list_cls, 4, node_pool_size=4)
+    values.pop_front()
+
+    # Act
+    values.append(9)
+
+    # Assert
+    assert_that(values.operation_counts.last.allocations).is_equal_to(0)
+
+
+def test_remove_counts_comparisons_up_to_the_match(list_cls: type):
+    # Arrange
+    values = make_counted(list_cls, 100)
+
+    # Act
+    values.remove(41)
+
+    # Assert
+    assert_that(values.operation_counts.last.comparisons).is_equal_to(42)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"reverse": True}, {"key": abs}, {"key": abs, "reverse": True}],
+    ids=["plain", "reverse", "key", "key_reverse"],
+)
+def test_sort_counts_its_comparisons(list_cls: type, options: dict):
+    # Arrange
+    source = [(i * 37) % 64 - 32 for i in range(64)]
+    values = make_counted(list_cls, 0)
+    values.extend(source)
+    values.operation_counts.reset()
+
+    # Act
+    values.sort(**options)
+    counts = values.operation_counts.last
+
+    # Assert
+    assert_that(list(values)).is_equal_to(sorted(source, **options))
+    assert_that(counts.comparisons).is_between(63, 64 * 6)
+
+
+def test_sort_comparisons_match_key_calls(list_cls: type):
+    # Arrange
+    values = make_counted(list_cls, 0)
+    values.extend((i * 37) % 64 for i in range(64))
+    values.operation_counts.reset()
+    calls = []
+
+    def key(value: int) -> int:
+        calls.append(value)
+        return -value
+
+    # Act
+    values.sort(key)
+    counts = values.operation_counts.last
+
+    # Assert
+    assert_that(list(values)).is_equal_to(list(range(63, -1, -1)))
+    assert_that(counts.comparisons).is_positive()
+    assert_that(len(calls)).is_equal_to(2 * counts.comparisons)
+
+
+def test_indexed_membership_needs_constant_comparisons(list_cls: type):
+    # Arrange
+    values = make_counted(list_cls, 1_000, index_values=True)
+
+    # Act
+    found = 750 in values
+
+    # Assert
+    assert_that(found).is_true()
+    assert_that(values.operation_counts.last.comparisons).is_less_than_or_equal_to(1)
+    assert_that(values.operation_counts.last.hops).is_equal_to(0)
+
+
+def test_sequential_get_scan_is_linear_in_total(list_cls: type):
+    # Arrange
+    size = 1_000
+    values = make_counted(list_cls, size)
+
+    # Act
+    for i in range(size):
+        values.get(i)
+
+    # Assert
+    assert_that(values.operation_counts.per_method["get"].hops).is_less_than(3 * size)
+
+
+def test_double_linked_pop_back_is_constant_but_singly_walks():
+    # Arrange
+    singly = make_counted(InstrumentedLinkedList, 1_000)
+    doubly = make_counted(InstrumentedDoubleLinkedList, 1_000)
+
+    # Act
+    singly.pop_back()
+    doubly.pop_back()
+
+    # Assert
+    assert_that(singly.operation_counts.last.hops).is_greater_than_or_equal_to(998)
+    assert_that(doubly.operation_counts.last.hops).is_less_than_or_equal_to(2)
+
+
+def test_nested_public_calls_are_attributed_to_the_outer_call(list_cls: type):
+    # Arrange
+    values = make_counted(list_cls, 3)
+
+    # Act
+    values.insert(3, 10)
+
+    # Assert
+    per_method = values.operation_counts.per_method
+    assert_that(per_method).contains_key("insert")
+    assert_that(per_method).does_not_contain_key("append")
+
+
+def test_iteration_is_attributed_to_iter(list_cls: type):
+    # Arrange
+    values = make_counted(list_cls, 10)
+
+    # Act
+    consumed = list(values)
+
+    # Assert
+    assert_that(consumed).is_length(10)
+    assert_that(values.operation_counts.per_method["__iter__"].hops).is_equal_to(10)
+
+
+def test_calls_made_while_iterating_are_attributed_to_themselves():
+    # Arrange
+    values = make_counted(InstrumentedDoubleLinkedList, 10)
+    iterator = iter(values)
+
+    # Act
+    consumed = [next(iterator) for _ in range(3)]
+    values.pop_back()
+    consumed.extend(iterator)
+
+    # Assert
+    per_method = values.operation_counts.per_method
+    assert_that(consumed).is_length(9)
+    assert_that(per_method["pop_back"].calls).is_equal_to(1)
+    assert_that(per_method["pop_back"].hops).is_less_than_or_equal_to(2)
+    assert_that(per_method["__iter__"].calls).is_equal_to(1)
+    assert_that(per_method["__iter__"].hops).is_equal_to(9)
+
+
+def test_drain_is_charged_for_the_hops_made_while_consumed(list_cls: type):
+    # Arrange
+    values = make_counted(list_cls, 10)
+
+    # Act
+    drained = list(values.drain())
+
+    # Assert
+    assert_that(drained).is_equal_to(list(range(10)))
+    assert_that(values.operation_counts.per_method["drain"].calls).is_equal_to(1)
+    assert_that(values.operation_counts.last.hops).is_equal_to(10)
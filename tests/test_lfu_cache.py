@@ -0,0 +1,145 @@
+from assertpy import assert_that
+
+from data_structures.lfu_cache import LFUCache
+
+
+def test_evicts_least_frequently_used():
+    # Arrange
+    cache = LFUCache[str, int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.put("c", 3)
+
+    # Assert
+    assert_that(list(cache)).is_equal_to(["a", "c"])
+    assert_that(cache.stats.evictions).is_equal_to(1)
+
+
+def test_ties_evict_least_recently_used():
+    # Arrange
+    cache = LFUCache[str, int](3)
+    for key in "abc":
+        cache.put(key, 0)
+    cache.get("b")
+    cache.get("a")
+
+    # Act
+    cache.put("d", 0)
+    cache.put("e", 0)
+
+    # Assert
+    assert_that(list(cache)).is_equal_to(["a", "b", "e"])
+
+
+def test_frequency_counts_gets_and_puts():
+    # Arrange
+    cache = LFUCache[str, int](2)
+    cache.put("a", 1)
+
+    # Act
+    cache.get("a")
+    cache.put("a", 2)
+    cache.get("missing")
+
+    # Assert
+    assert_that(cache.frequency("a")).is_equal_to(3)
+    assert_that(cache.frequency("missing")).is_equal_to(0)
+    assert_that(cache.get("a")).is_equal_to(2)
+    assert_that(cache.stats.misses).is_equal_to(1)
+
+
+def test_capacity_by_size_function():
+    # Arrange
+    cache = LFUCache[str, str](6, size_of=len)
+    cache.put("a", "xx")
+    cache.get("a")
+    cache.put("b", "yy")
+
+    # Act
+    cache.put("c", "zzz")
+
+    # Assert
+    assert_that(list(cache)).is_equal_to(["a", "c"])
+    assert_that(cache.size).is_equal_to(5)
+
+
+def test_remove_and_clear():
+    # Arrange
+    cache = LFUCache[str, int](3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("b")
+
+    # Act
+    removed = cache.remove("b")
+    missing = cache.remove("b")
+    remaining = list(cache)
+    cache.clear()
+
+    # Assert
+    assert_that(removed).is_true()
+    assert_that(missing).is_false()
+    assert_that(remaining).is_equal_to(["a"])
+    assert_that(len(cache)).is_equal_to(0)
+
+
+def test_invalid_capacity():
+    # Act / Assert
+    assert_that(LFUCache).raises(ValueError).when_called_with(0)
+
+
+def test_new_key_is_not_evicted_by_its_own_insertion():
+    # Arrange
+    cache = LFUCache[str, int](2)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.put("b", 2)
+    cache.get("b")
+
+    # Act
+    cache.put("c", 3)
+
+    # Assert
+    assert_that("c" in cache).is_true()
+    assert_that(list(cache)).is_equal_to(["b", "c"])
+
+
+def test_growing_value_evicts_others_but_keeps_itself():
+    # Arrange
+    cache = LFUCache[str, str](6, size_of=len)
+    cache.put("a", "xx")
+    cache.get("a")
+    cache.put("b", "yy")
+    cache.get("b")
+    cache.get("b")
+
+    # Act
+    cache.put("a", "xxxxx")
+
+    # Assert
+    assert_that(list(cache)).is_equal_to(["a"])
+    assert_that(cache.size).is_equal_to(5)
+
+
+def test_lone_entries_keep_frequency_order_as_they_move_up():
+    # Arrange
+    cache = LFUCache[str, int](3)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.put("b", 2)
+    cache.get("b")
+    cache.put("c", 3)
+
+    # Act
+    cache.get("c")
+    cache.get("c")
+    cache.get("c")
+    cache.put("d", 4)
+
+    # Assert
+    assert_that([cache.frequency(key) for key in "abcd"]).is_equal_to([3, 0, 4, 1])
+    assert_that(list(cache)).is_equal_to(["c", "a", "d"])
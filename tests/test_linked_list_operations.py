@@ -0,0 +1,532 @@
+import random
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.instrumentation import (
+    InstrumentedDoubleLinkedList,
+    InstrumentedLinkedList,
+)
+from data_structures.linked_list import LinkedList
+
+from helpers import make
+
+
+@pytest.mark.parametrize(
+    "make_source",
+    [list, tuple, iter, lambda values: (v for v in values)],
+    ids=["list", "tuple", "iterator", "generator"],
+)
+def test_extend_appends_chain_in_order(list_cls: type, make_source):
+    # Arrange
+    values = make(list_cls, [1, 2, 3])
+
+    # Act
+    values.extend(make_source([4, 5, 6]))
+    values.append(7)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 3, 4, 5, 6, 7])
+    assert_that(len(values)).is_equal_to(7)
+    assert_that(values.pop_back()).is_equal_to(7)
+    assert_that(values.pop_back()).is_equal_to(6)
+
+
+def test_extend_from_same_class_copies_values(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2])
+    source = make(list_cls, [3, 4])
+
+    # Act
+    values.extend(source)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 3, 4])
+    assert_that(list(source)).is_equal_to([3, 4])
+
+
+def test_extend_with_itself_doubles_values(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2])
+
+    # Act
+    values.extend(values)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 1, 2])
+
+
+def test_extend_empty_list_with_empty_source_keeps_it_empty(list_cls: type):
+    # Arrange
+    values = list_cls[int]()
+
+    # Act
+    values.extend([])
+    values.prepend_many(iter([]))
+
+    # Assert
+    assert_that(list(values)).is_empty()
+    assert_that(len(values)).is_equal_to(0)
+
+
+def test_prepend_many_keeps_source_order(list_cls: type):
+    # Arrange
+    values = make(list_cls, [4, 5])
+
+    # Act
+    values.prepend_many([1, 2, 3])
+    values.prepend(0)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([0, 1, 2, 3, 4, 5])
+    assert_that(len(values)).is_equal_to(6)
+
+
+def test_prepend_many_into_empty_sets_tail(list_cls: type):
+    # Arrange
+    values = list_cls[int]()
+
+    # Act
+    values.prepend_many(iter([1, 2, 3]))
+    values.append(4)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 3, 4])
+    assert_that(values.pop_back()).is_equal_to(4)
+    assert_that(values.pop_back()).is_equal_to(3)
+
+
+def test_concat_steals_all_nodes(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2])
+    other = make(list_cls, [3, 4])
+
+    # Act
+    values.concat(other)
+    values.append(5)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 3, 4, 5])
+    assert_that(len(values)).is_equal_to(5)
+    assert_that(list(other)).is_empty()
+    assert_that(len(other)).is_equal_to(0)
+    assert_that(values.pop_back()).is_equal_to(5)
+    assert_that(values.pop_back()).is_equal_to(4)
+
+
+def test_concat_into_empty_list(list_cls: type):
+    # Arrange
+    values = list_cls[int]()
+    other = make(list_cls, [1, 2])
+
+    # Act
+    values.concat(other)
+    values.prepend(0)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([0, 1, 2])
+
+
+def test_concat_with_itself_raises_value_error(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1])
+
+    # Act / Assert
+    assert_that(values.concat).raises(ValueError).when_called_with(values)
+
+
+def test_concat_with_other_list_type_raises_type_error(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1])
+
+    # Act / Assert
+    assert_that(values.concat).raises(TypeError).when_called_with([2, 3])
+
+
+@pytest.mark.parametrize("index", [0, 1, 2, 3, 4])
+def test_split_at_moves_tail_segment(list_cls: type, index: int):
+    # Arrange
+    values = make(list_cls, [0, 1, 2, 3])
+
+    # Act
+    tail = values.split_at(index)
+    values.append(10)
+    tail.append(20)
+
+    # Assert
+    assert_that(type(tail)).is_same_as(list_cls)
+    assert_that(list(values)).is_equal_to(list(range(index)) + [10])
+    assert_that(list(tail)).is_equal_to(list(range(index, 4)) + [20])
+    assert_that(len(values)).is_equal_to(index + 1)
+    assert_that(len(tail)).is_equal_to(5 - index)
+
+
+@pytest.mark.parametrize("index", [-1, 5])
+def test_split_at_out_of_bounds_raises_index_error(list_cls: type, index: int):
+    # Arrange
+    values = make(list_cls, [0, 1, 2, 3])
+
+    # Act / Assert
+    assert_that(values.split_at).raises(IndexError).when_called_with(index)
+
+
+@pytest.mark.parametrize("index", [0, 1, 2, 3])
+def test_splice_inserts_other_before_index(list_cls: type, index: int):
+    # Arrange
+    values = make(list_cls, [0, 1, 2])
+    other = make(list_cls, [7, 8])
+    expected = [0, 1, 2]
+    expected[index:index] = [7, 8]
+
+    # Act
+    values.splice(index, other)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(expected)
+    assert_that(len(values)).is_equal_to(5)
+    assert_that(list(other)).is_empty()
+    assert_that(values.pop_back()).is_equal_to(expected[-1])
+    assert_that(values.pop_front()).is_equal_to(expected[0])
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"node_pool_size": 4}, {"index_values": True}],
+    ids=["plain", "pooled", "indexed"],
+)
+def test_indexed_access_after_mixed_mutations_matches_builtin_list(
+        list_cls: type, options: dict
+):
+    # Arrange
+    rng = random.Random(6)
+    values = list_cls[int](**options)
+    expected: list[int] = []
+
+    # Act / Assert
+    for step in range(2_000):
+        operation = rng.randrange(8)
+        if operation == 0 or not expected:
+            index = rng.randint(0, len(expected))
+            values.insert(index, step % 50)
+            expected.insert(index, step % 50)
+        elif operation == 1:
+            values.prepend(step % 50)
+            expected.insert(0, step % 50)
+        elif operation == 2:
+            assert_that(values.pop_front()).is_equal_to(expected.pop(0))
+        elif operation == 3:
+            assert_that(values.pop_back()).is_equal_to(expected.pop())
+        elif operation == 4:
+            value = rng.randrange(60)
+            assert_that(values.remove(value)).is_equal_to(value in expected)
+            if value in expected:
+                expected.remove(value)
+        elif operation == 5:
+            index = rng.randint(0, len(expected))
+            position = rng.randint(0, index)
+            values.splice(position, values.split_at(index))
+            tail = expected[index:]
+            del expected[index:]
+            expected[position:position] = tail
+        elif operation == 6:
+            value = rng.randrange(60)
+            expected_index = expected.index(value) if value in expected else None
+            assert_that(values.index_of(value)).is_equal_to(expected_index)
+        else:
+            index = rng.randrange(len(expected))
+            assert_that(values.get(index)).is_equal_to(expected[index])
+
+    assert_that(list(values)).is_equal_to(expected)
+    assert_that([values.get(i) for i in range(len(expected))]).is_equal_to(expected)
+
+
+@pytest.mark.parametrize("count", [0, 1, 3, 5, 9])
+def test_pop_front_many_detaches_prefix(list_cls: type, count: int):
+    # Arrange
+    values = make(list_cls, [0, 1, 2, 3, 4])
+
+    # Act
+    popped = values.pop_front_many(count)
+    values.append(5)
+    values.prepend(-1)
+
+    # Assert
+    kept = list(range(min(count, 5), 5))
+    assert_that(popped).is_equal_to(list(range(min(count, 5))))
+    assert_that(list(values)).is_equal_to([-1] + kept + [5])
+    assert_that(len(values)).is_equal_to(len(kept) + 2)
+
+
+@pytest.mark.parametrize("count", [0, 1, 3, 5, 9])
+def test_pop_back_many_returns_values_in_pop_order(list_cls: type, count: int):
+    # Arrange
+    values = make(list_cls, [0, 1, 2, 3, 4])
+
+    # Act
+    popped = values.pop_back_many(count)
+    values.append(5)
+
+    # Assert
+    kept = list(range(5 - min(count, 5)))
+    assert_that(popped).is_equal_to(list(range(4, 4 - min(count, 5), -1)))
+    assert_that(list(values)).is_equal_to(kept + [5])
+    assert_that(values.pop_back()).is_equal_to(5)
+
+
+def test_negative_batch_size_raises_value_error(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1])
+
+    # Act / Assert
+    assert_that(values.pop_front_many).raises(ValueError).when_called_with(-1)
+    assert_that(values.pop_back_many).raises(ValueError).when_called_with(-1)
+
+
+def test_drain_empties_list_before_iteration(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2, 3])
+
+    # Act
+    drained = values.drain()
+    values.append(10)
+
+    # Assert
+    assert_that(list(drained)).is_equal_to([1, 2, 3])
+    assert_that(list(values)).is_equal_to([10])
+
+
+def test_drain_reversed_yields_back_to_front(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2, 3])
+
+    # Act
+    drained = list(values.drain_reversed())
+
+    # Assert
+    assert_that(drained).is_equal_to([3, 2, 1])
+    assert_that(len(values)).is_equal_to(0)
+
+
+def test_batched_pops_keep_value_index_and_pool_in_sync(list_cls: type):
+    # Arrange
+    values = list_cls[int](node_pool_size=8, index_values=True)
+    values.extend(range(10))
+
+    # Act
+    front = values.pop_front_many(3)
+    back = values.pop_back_many(3)
+    drained = list(values.drain())
+    values.extend([1, 2])
+
+    # Assert
+    assert_that(front + back + drained).is_length(10)
+    assert_that(0 in values).is_false()
+    assert_that(1 in values).is_true()
+    assert_that(values.node_pool.hits).is_equal_to(2)
+
+
+SLICES = [
+    slice(None),
+    slice(2, 7),
+    slice(-3, None),
+    slice(None, None, 2),
+    slice(1, 9, 3),
+    slice(None, None, -1),
+    slice(8, 1, -2),
+    slice(5, 2),
+    slice(20, 30),
+]
+
+
+@pytest.mark.parametrize("index", [0, 4, 9, -1, -10])
+def test_getitem_matches_builtin_list(list_cls: type, index: int):
+    # Arrange
+    values = make(list_cls, list(range(10)))
+
+    # Act
+    value = values[index]
+
+    # Assert
+    assert_that(value).is_equal_to(list(range(10))[index])
+
+
+@pytest.mark.parametrize("index", [10, -11])
+def test_out_of_range_index_raises_index_error(list_cls: type, index: int):
+    # Arrange
+    values = make(list_cls, list(range(10)))
+
+    # Act / Assert
+    assert_that(values.__getitem__).raises(IndexError).when_called_with(index)
+    assert_that(values.__setitem__).raises(IndexError).when_called_with(index, 0)
+    assert_that(values.__delitem__).raises(IndexError).when_called_with(index)
+
+
+@pytest.mark.parametrize("key", SLICES, ids=str)
+def test_slice_returns_new_list_of_same_class(list_cls: type, key: slice):
+    # Arrange
+    values = make(list_cls, list(range(10)))
+
+    # Act
+    sliced = values[key]
+    sliced.append(99)
+
+    # Assert
+    assert_that(sliced).is_instance_of(list_cls)
+    assert_that(list(sliced)).is_equal_to(list(range(10))[key] + [99])
+    assert_that(list(values)).is_equal_to(list(range(10)))
+
+
+@pytest.mark.parametrize("key", SLICES, ids=str)
+def test_del_slice_matches_builtin_list(list_cls: type, key: slice):
+    # Arrange
+    values = make(list_cls, list(range(10)))
+    expected = list(range(10))
+
+    # Act
+    del values[key]
+    del expected[key]
+    values.append(99)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(expected + [99])
+    assert_that(len(values)).is_equal_to(len(expected) + 1)
+
+
+@pytest.mark.parametrize("replacement", [[], [-1], [-1, -2, -3, -4, -5, -6]])
+@pytest.mark.parametrize("key", [slice(2, 5), slice(0, 0), slice(7, None), slice(6, 3)], ids=str)
+def test_slice_assignment_resizes_list(list_cls: type, key: slice, replacement: list[int]):
+    # Arrange
+    values = make(list_cls, list(range(10)))
+    expected = list(range(10))
+
+    # Act
+    values[key] = iter(replacement)
+    expected[key] = replacement
+    values.append(99)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(expected + [99])
+    assert_that(values[-1]).is_equal_to(99)
+
+
+@pytest.mark.parametrize("key", [slice(None, None, 2), slice(8, 1, -3)], ids=str)
+def test_extended_slice_assignment_replaces_values(list_cls: type, key: slice):
+    # Arrange
+    values = make(list_cls, list(range(10)))
+    expected = list(range(10))
+    replacement = [-v for v in range(len(expected[key]))]
+
+    # Act
+    values[key] = replacement
+    expected[key] = replacement
+
+    # Assert
+    assert_that(list(values)).is_equal_to(expected)
+
+
+def test_extended_slice_assignment_size_mismatch_raises(list_cls: type):
+    # Arrange
+    values = make(list_cls, list(range(10)))
+
+    # Act / Assert
+    assert_that(values.__setitem__).raises(ValueError).when_called_with(
+        slice(None, None, 2), [1, 2]
+    )
+    assert_that(list(values)).is_equal_to(list(range(10)))
+
+
+def test_slice_assignment_from_itself_copies_values(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2, 3])
+
+    # Act
+    values[1:2] = values
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 1, 2, 3, 3])
+
+
+def test_item_assignment_keeps_value_index_in_sync(list_cls: type):
+    # Arrange
+    values = list_cls[int](node_pool_size=4, index_values=True)
+    values.extend(range(6))
+
+    # Act
+    values[0] = 10
+    values[1:3] = [20]
+    del values[::2]
+
+    # Assert
+    assert_that(list(values)).is_equal_to([20, 4])
+    assert_that(0 in values).is_false()
+    assert_that(10 in values).is_false()
+    assert_that(values.index_of(4)).is_equal_to(1)
+    assert_that(len(values.node_pool)).is_equal_to(4)
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 7, 64, 100])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_matches_sorted(list_cls: type, size: int, reverse: bool):
+    # Arrange
+    rng = random.Random(size)
+    source = [rng.randrange(size + 1) for _ in range(size)]
+    values = make(list_cls, source)
+
+    # Act
+    values.sort(reverse=reverse)
+    values.append(-1)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(sorted(source, reverse=reverse) + [-1])
+    assert_that(len(values)).is_equal_to(size + 1)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_with_key_is_stable(list_cls: type, reverse: bool):
+    # Arrange
+    source = [(i % 3, i) for i in range(30)]
+    values = list_cls()
+    values.extend(source)
+
+    # Act
+    values.sort(key=lambda pair: pair[0], reverse=reverse)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(
+        sorted(source, key=lambda pair: pair[0], reverse=reverse)
+    )
+
+
+def test_sort_relinks_nodes_without_allocating(list_cls: type):
+    # Arrange
+    instrumented = {
+        LinkedList: InstrumentedLinkedList,
+        DoubleLinkedList: InstrumentedDoubleLinkedList,
+    }[list_cls]
+    values = instrumented()
+    values.extend([5, 3, 9, 1, 7])
+
+    # Act
+    values.sort()
+
+    # Assert
+    assert_that(values.operation_counts.last.allocations).is_equal_to(0)
+    assert_that(list(values)).is_equal_to([1, 3, 5, 7, 9])
+
+
+def test_sort_keeps_tail_finger_and_index_consistent(list_cls: type):
+    # Arrange
+    values = list_cls[int](index_values=True)
+    values.extend([4, 2, 3, 1])
+    values.get(2)
+
+    # Act
+    values.sort()
+    values.append(5)
+
+    # Assert
+    assert_that(values.get(2)).is_equal_to(3)
+    assert_that(values.pop_back()).is_equal_to(5)
+    assert_that(values.pop_back()).is_equal_to(4)
+    assert_that(values.index_of(1)).is_equal_to(0)
@@ -1,19 +1,56 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from itertools import islice
 from typing import TypeVar
 
 import pytest
 from assertpy import assert_that
 
+from data_structures.array_double_linked_list import ArrayDoubleLinkedList
+from data_structures.btree_list import BTreeList
+from data_structures.concurrent_double_linked_list import ConcurrentDoubleLinkedList
 from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.indexable_skip_list import IndexableSkipList
 from data_structures.linked_list import LinkedList
 from data_structures.list_protocol import ListProtocol
+from data_structures.mapped_list import MappedList
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+try:
+    from data_structures.numeric_list import NumericList
+except ImportError:  # numpy is optional
+    NumericList = None
 
 T = TypeVar("T")
 
 
-@pytest.fixture(params=[LinkedList, DoubleLinkedList], ids=["linked_list", "double_linked_list"])
-def linked_list(request: pytest.FixtureRequest) -> ListProtocol[int]:
+@pytest.fixture(
+    params=[
+        LinkedList,
+        DoubleLinkedList,
+        UnrolledLinkedList,
+        ArrayDoubleLinkedList,
+        IndexableSkipList,
+        ConcurrentDoubleLinkedList,
+        MappedList,
+        BTreeList,
+        pytest.param(
+            NumericList,
+            marks=pytest.mark.skipif(NumericList is None, reason="numpy is not installed"),
+        ),
+    ],
+    ids=[
+        "linked_list",
+        "double_linked_list",
+        "unrolled_linked_list",
+        "array_double_linked_list",
+        "indexable_skip_list",
+        "concurrent_double_linked_list",
+        "mapped_list",
+        "btree_list",
+        "numeric_list",
+    ],
+)
+def linked_list(request: pytest.FixtureRequest) -> Iterator[ListProtocol[int]]:
     """
     System-under-test factory.
 
@@ -22,7 +59,12 @@ def linked_list(request: pytest.FixtureRequest) -> ListProtocol[int]:
     pass.
     """
     list_cls = request.param
-    return list_cls[int]()
+    values = list_cls[int]()
+    yield values
+    # disk-backed lists hold a file and a memory map
+    close = getattr(values, "close", None)
+    if close is not None:
+        close()
 
 
 def to_py_list(
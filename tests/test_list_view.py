@@ -0,0 +1,130 @@
+import operator
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.btree_list import BTreeList
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.linked_list import LinkedList
+from data_structures.list_view import ListView
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+from helpers import make
+
+
+# views are not tied to linked lists, so this runs over every list type
+@pytest.fixture(
+    params=[LinkedList, DoubleLinkedList, UnrolledLinkedList, BTreeList],
+    ids=["linked_list", "double_linked_list", "unrolled_linked_list", "btree_list"],
+)
+def list_cls(request: pytest.FixtureRequest) -> type:
+    return request.param
+
+
+def test_pipeline_matches_eager_evaluation(list_cls: type):
+    # Arrange
+    values = make(list_cls, range(100))
+
+    # Act
+    result = (
+        values.view()
+        .filter(lambda v: v % 3 == 0)
+        .map(lambda v: v * 10)
+        .skip(2)
+        .take(5)
+        .to_list()
+    )
+
+    # Assert
+    assert_that(result).is_instance_of(list_cls)
+    assert_that(list(result)).is_equal_to([60, 90, 120, 150, 180])
+
+
+def test_take_stops_pulling_from_source(list_cls: type):
+    # Arrange
+    values = make(list_cls, range(1_000))
+    seen = []
+
+    def record(value: int) -> int:
+        seen.append(value)
+        return value
+
+    # Act
+    result = list(values.view().map(record).take(3))
+
+    # Assert
+    assert_that(result).is_equal_to([0, 1, 2])
+    assert_that(seen).is_equal_to([0, 1, 2])
+
+
+def test_stages_are_not_run_until_evaluated(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2, 3])
+    calls = []
+
+    # Act
+    view = values.view().map(calls.append)
+    values.append(4)
+    before = list(calls)
+    count = view.count()
+
+    # Assert
+    assert_that(before).is_empty()
+    assert_that(count).is_equal_to(4)
+    assert_that(calls).is_equal_to([1, 2, 3, 4])
+
+
+def test_views_branch_without_affecting_each_other(list_cls: type):
+    # Arrange
+    base = make(list_cls, range(10)).view().filter(lambda v: v % 2 == 0)
+
+    # Act
+    small = base.take(2)
+    doubled = base.map(lambda v: v * 2)
+
+    # Assert
+    assert_that(list(small)).is_equal_to([0, 2])
+    assert_that(list(doubled)).is_equal_to([0, 4, 8, 12, 16])
+    assert_that(list(base)).is_equal_to([0, 2, 4, 6, 8])
+
+
+def test_to_list_into_another_class(list_cls: type):
+    # Arrange
+    values = make(list_cls, [3, 1, 2])
+
+    # Act
+    result = values.view().map(str).to_list(DoubleLinkedList)
+
+    # Assert
+    assert_that(result).is_instance_of(DoubleLinkedList)
+    assert_that(list(result)).is_equal_to(["3", "1", "2"])
+
+
+def test_count_first_and_reduce(list_cls: type):
+    # Arrange
+    view = make(list_cls, range(1, 6)).view()
+
+    # Act / Assert
+    assert_that(view.count()).is_equal_to(5)
+    assert_that(view.filter(lambda v: v > 2).count()).is_equal_to(3)
+    assert_that(view.filter(lambda v: v > 2).first()).is_equal_to(3)
+    assert_that(view.reduce(operator.mul)).is_equal_to(120)
+    assert_that(view.skip(5).reduce(operator.add, 0)).is_equal_to(0)
+
+
+def test_first_of_empty_view(list_cls: type):
+    # Arrange
+    view = make(list_cls, [1]).view().skip(1)
+
+    # Act / Assert
+    assert_that(view.first(None)).is_none()
+    assert_that(view.first).raises(IndexError).when_called_with()
+
+
+@pytest.mark.parametrize("stage", ["skip", "take"])
+def test_negative_counts_raise_value_error(stage: str):
+    # Arrange
+    view = ListView([1, 2])
+
+    # Act / Assert
+    assert_that(getattr(view, stage)).raises(ValueError).when_called_with(-1)
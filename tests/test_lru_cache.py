@@ -0,0 +1,128 @@
+from assertpy import assert_that
+
+from data_structures.lru_cache import LRUCache
+
+
+def test_get_returns_cached_values_and_default():
+    # Arrange
+    cache = LRUCache[str, int](2)
+    cache.put("a", 1)
+
+    # Act / Assert
+    assert_that(cache.get("a")).is_equal_to(1)
+    assert_that(cache.get("b")).is_none()
+    assert_that(cache.get("b", -1)).is_equal_to(-1)
+
+
+def test_evicts_least_recently_used():
+    # Arrange
+    cache = LRUCache[str, int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.put("c", 3)
+
+    # Assert
+    assert_that(list(cache)).is_equal_to(["c", "a"])
+    assert_that("b" in cache).is_false()
+    assert_that(cache.stats.evictions).is_equal_to(1)
+
+
+def test_put_existing_key_updates_and_refreshes():
+    # Arrange
+    cache = LRUCache[str, int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Act
+    cache.put("a", 10)
+    cache.put("c", 3)
+
+    # Assert
+    assert_that(cache.get("a")).is_equal_to(10)
+    assert_that(list(cache)).is_equal_to(["a", "c"])
+    assert_that(len(cache)).is_equal_to(2)
+
+
+def test_contains_does_not_refresh():
+    # Arrange
+    cache = LRUCache[str, int](2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Act
+    found = "a" in cache
+    cache.put("c", 3)
+
+    # Assert
+    assert_that(found).is_true()
+    assert_that(list(cache)).is_equal_to(["c", "b"])
+
+
+def test_capacity_by_size_function():
+    # Arrange
+    cache = LRUCache[str, str](10, size_of=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "yyyy")
+
+    # Act
+    cache.put("c", "zzz")
+
+    # Assert
+    assert_that(list(cache)).is_equal_to(["c", "b"])
+    assert_that(cache.size).is_equal_to(7)
+
+
+def test_value_larger_than_capacity_is_not_kept():
+    # Arrange
+    cache = LRUCache[str, str](3, size_of=len)
+    cache.put("a", "x")
+
+    # Act
+    cache.put("b", "yyyy")
+
+    # Assert
+    assert_that(list(cache)).is_equal_to(["a"])
+    assert_that(cache.size).is_equal_to(1)
+
+
+def test_stats_count_hits_and_misses():
+    # Arrange
+    cache = LRUCache[int, int](4)
+    cache.put(1, 1)
+
+    # Act
+    for key in [1, 1, 2, 1]:
+        cache.get(key)
+
+    # Assert
+    assert_that(cache.stats.hits).is_equal_to(3)
+    assert_that(cache.stats.misses).is_equal_to(1)
+    assert_that(cache.stats.hit_rate).is_equal_to(0.75)
+
+
+def test_remove_and_clear():
+    # Arrange
+    cache = LRUCache[str, int](3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Act
+    removed = cache.remove("a")
+    missing = cache.remove("a")
+    remaining = list(cache)
+    cache.clear()
+
+    # Assert
+    assert_that(removed).is_true()
+    assert_that(missing).is_false()
+    assert_that(remaining).is_equal_to(["b"])
+    assert_that(len(cache)).is_equal_to(0)
+    assert_that(cache.size).is_equal_to(0)
+
+
+def test_invalid_capacity():
+    # Act / Assert
+    assert_that(LRUCache).raises(ValueError).when_called_with(0)
@@ -0,0 +1,133 @@
+import gc
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.mapped_list import MappedList
+
+
+def test_reopen_restores_values(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "queue.bin"
+    with MappedList(path) as values:
+        values.extend(range(100))
+        values.pop_front()
+        values.append("last")
+
+    # Act
+    with MappedList(path) as reopened:
+        restored = list(reopened)
+        length = len(reopened)
+
+    # Assert
+    assert_that(restored).is_equal_to(list(range(1, 100)) + ["last"])
+    assert_that(length).is_equal_to(100)
+
+
+def test_flush_makes_changes_visible_to_a_second_mapping(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "queue.bin"
+    values = MappedList(path)
+    values.extend(["a", "b"])
+
+    # Act
+    values.flush()
+    with MappedList(path) as other:
+        seen = list(other)
+    values.close()
+
+    # Assert
+    assert_that(seen).is_equal_to(["a", "b"])
+
+
+def test_reopened_list_keeps_reusing_free_blocks(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "queue.bin"
+    with MappedList(path, initial_size=4096) as values:
+        values.extend(range(50))
+        size = values.file_size
+        for _ in range(50):
+            values.pop_front()
+
+    # Act
+    with MappedList(path) as reopened:
+        reopened.extend(range(50))
+        reopened_size = reopened.file_size
+        restored = list(reopened)
+
+    # Assert
+    assert_that(reopened_size).is_equal_to(size)
+    assert_that(restored).is_equal_to(list(range(50)))
+
+
+def test_file_grows_for_large_values():
+    # Arrange
+    with MappedList(initial_size=1024) as values:
+        # Act
+        values.append("x" * 10_000)
+        values.prepend(b"y" * 3_000)
+
+        # Assert
+        assert_that(values.file_size).is_greater_than_or_equal_to(16_384)
+        assert_that(values.pop_back()).is_equal_to("x" * 10_000)
+        assert_that(values.pop_front()).is_equal_to(b"y" * 3_000)
+
+
+def test_values_are_stored_by_value():
+    # Arrange
+    with MappedList() as values:
+        item = [1, 2]
+        values.append(item)
+
+        # Act
+        item.append(3)
+
+        # Assert
+        assert_that(values.get(0)).is_equal_to([1, 2])
+
+
+def test_foreign_file_raises_value_error(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 1024)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        MappedList(path)
+
+
+def test_close_is_idempotent():
+    # Arrange
+    values = MappedList()
+
+    # Act
+    values.close()
+    values.close()
+
+    # Assert
+    assert_that(len(values)).is_equal_to(0)
+
+
+def test_unclosed_list_is_released_when_collected(tmp_path: Path, monkeypatch):
+    # Arrange
+    path = tmp_path / "values.bin"
+    values = MappedList(path, initial_size=4096)
+    values.extend(["x" * 100] * 100)
+    unraisable = []
+    monkeypatch.setattr(sys, "unraisablehook", unraisable.append)
+
+    # Act
+    with warnings.catch_warnings():
+        # an unclosed file warns from its finalizer, which is unraisable
+        warnings.simplefilter("error", ResourceWarning)
+        del values
+        gc.collect()
+    with MappedList(path) as reopened:
+        restored = list(reopened)
+
+    # Assert
+    assert_that(unraisable).is_empty()
+    assert_that(restored).is_length(100)
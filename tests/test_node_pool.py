@@ -0,0 +1,73 @@
+from assertpy import assert_that
+
+from data_structures.node_pool import NodePool
+
+
+def test_pool_is_disabled_by_default(list_cls: type):
+    # Arrange
+
+    # Act
+    values = list_cls[int]()
+
+    # Assert
+    assert_that(values.node_pool).is_none()
+
+
+def test_steady_state_queue_traffic_reuses_nodes(list_cls: type):
+    # Arrange
+    queue = list_cls[int](node_pool_size=4)
+    for i in range(4):
+        queue.append(i)
+    for _ in range(4):
+        queue.pop_front()
+    queue.node_pool.reset_stats()
+
+    # Act
+    for i in range(1_000):
+        queue.append(i)
+        queue.pop_front()
+
+    # Assert
+    assert_that(queue.node_pool.misses).is_equal_to(0)
+    assert_that(queue.node_pool.hits).is_equal_to(1_000)
+    assert_that(list(queue)).is_empty()
+
+
+def test_recycled_nodes_do_not_leak_old_links(list_cls: type):
+    # Arrange
+    values = list_cls[int](node_pool_size=8)
+    for i in range(5):
+        values.append(i)
+    values.pop_back()
+    values.pop_front()
+    values.remove(2)
+
+    # Act
+    values.prepend(10)
+    values.insert(2, 20)
+    values.append(30)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([10, 1, 20, 3, 30])
+    assert_that(len(values.node_pool)).is_equal_to(0)
+
+
+def test_pool_never_grows_beyond_max_size(list_cls: type):
+    # Arrange
+    values = list_cls[int](node_pool_size=2)
+    for i in range(10):
+        values.append(i)
+
+    # Act
+    while len(values):
+        values.pop_back()
+
+    # Assert
+    assert_that(len(values.node_pool)).is_equal_to(2)
+
+
+def test_negative_pool_size_raises_value_error():
+    # Arrange
+
+    # Act / Assert
+    assert_that(NodePool).raises(ValueError).when_called_with(-1)
@@ -0,0 +1,251 @@
+import pytest
+from assertpy import assert_that
+
+np = pytest.importorskip("numpy")
+
+from data_structures.numeric_list import NumericList  # noqa: E402
+
+
+def make(values: list, **options) -> NumericList:
+    result = NumericList(**options)
+    result.extend(values)
+    return result
+
+
+def test_capacity_below_two_raises_value_error():
+    # Act / Assert
+    assert_that(NumericList).raises(ValueError).when_called_with(chunk_capacity=1)
+
+
+def test_non_numeric_dtype_raises_type_error():
+    # Act / Assert
+    assert_that(NumericList).raises(TypeError).when_called_with(dtype=object)
+
+
+def test_non_numeric_value_raises_type_error():
+    # Arrange
+    values = NumericList()
+
+    # Act / Assert
+    assert_that(values.append).raises(TypeError).when_called_with("a")
+    assert_that(values.extend).raises(TypeError).when_called_with(["a", "b"])
+    assert_that(len(values)).is_equal_to(0)
+
+
+def test_values_come_back_as_python_scalars():
+    # Arrange
+    values = make([1, 2, 3])
+
+    # Act
+    items = list(values) + [values.get(1), values.pop_back()]
+
+    # Assert
+    assert_that(items).is_equal_to([1, 2, 3, 2, 3])
+    assert_that({type(item) for item in items}).is_equal_to({int})
+
+
+def test_first_float_promotes_inferred_list():
+    # Arrange
+    values = make([1, 2])
+
+    # Act
+    values.prepend(0.5)
+
+    # Assert
+    assert_that(values.dtype).is_equal_to(np.dtype(np.float64))
+    assert_that(list(values)).is_equal_to([0.5, 1.0, 2.0])
+
+
+def test_explicit_dtype_is_kept():
+    # Arrange
+    values = make([1, 2], dtype=np.int32)
+
+    # Act
+    values.append(3)
+
+    # Assert
+    assert_that(values.dtype).is_equal_to(np.dtype(np.int32))
+    assert_that(list(values)).is_equal_to([1, 2, 3])
+
+
+def test_explicit_int_dtype_rejects_floats():
+    # Arrange
+    values = make([1, 2], dtype=np.int32)
+
+    # Act / Assert
+    assert_that(values.append).raises(TypeError).when_called_with(1.7)
+    assert_that(values.insert).raises(TypeError).when_called_with(1, 1.7)
+    assert_that(values.extend).raises(TypeError).when_called_with([1.7])
+    assert_that(list(values)).is_equal_to([1, 2])
+
+
+@pytest.mark.parametrize(
+    "add",
+    [
+        lambda values, value: values.append(value),
+        lambda values, value: values.prepend(value),
+        lambda values, value: values.insert(2, value),
+    ],
+    ids=["append", "prepend", "insert"],
+)
+def test_value_out_of_range_leaves_list_unchanged(add):
+    # Arrange
+    values = make([1, 2, 3, 4], chunk_capacity=4)
+
+    # Act / Assert
+    assert_that(add).raises(OverflowError).when_called_with(values, 2 ** 63)
+    assert_that(len(values)).is_equal_to(4)
+    assert_that(list(values)).is_equal_to([1, 2, 3, 4])
+    assert_that(values.pop_back()).is_equal_to(4)
+    assert_that(list(values)).is_equal_to([1, 2, 3])
+
+
+@pytest.mark.parametrize(
+    "dtype, source",
+    [
+        (np.int8, [1000, 5]),
+        (np.int8, np.array([5, -1000], dtype=np.int16)),
+        (np.uint8, [-1]),
+        (None, [2 ** 63]),
+        (None, [2 ** 64, 1]),
+    ],
+    ids=["int8", "int8_array", "uint8_negative", "past_int64", "object_array"],
+)
+def test_extend_out_of_range_leaves_list_unchanged(dtype, source):
+    # Arrange
+    options = {} if dtype is None else {"dtype": dtype}
+    values = make([1, 2], **options)
+
+    # Act / Assert
+    assert_that(values.extend).raises(OverflowError).when_called_with(source)
+    assert_that(len(values)).is_equal_to(2)
+    assert_that(list(values)).is_equal_to([1, 2])
+
+def test_both_ends_grow_across_chunks():
+    # Arrange
+    values = NumericList(chunk_capacity=4)
+
+    # Act
+    for i in range(10):
+        values.append(i)
+        values.prepend(-i - 1)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(list(range(-10, 10)))
+    assert_that(values.get(13)).is_equal_to(3)
+
+
+def test_inserts_and_removes_inside_full_chunks():
+    # Arrange
+    values = make(list(range(12)), chunk_capacity=4)
+    expected = list(range(12))
+
+    # Act
+    for index in (3, 4, 9, 1):
+        values.insert(index, 100 + index)
+        expected.insert(index, 100 + index)
+    for value in (0, 5, 103, 11):
+        values.remove(value)
+        expected.remove(value)
+
+    # Assert
+    assert_that(list(values)).is_equal_to(expected)
+    assert_that(values.index_of(7)).is_equal_to(expected.index(7))
+
+
+@pytest.mark.parametrize("value", ["a", None])
+def test_search_for_non_number_finds_nothing(value):
+    # Arrange
+    values = make([1, 2])
+
+    # Act / Assert
+    assert_that(values.index_of(value)).is_none()
+    assert_that(values.remove(value)).is_false()
+
+
+def test_reductions():
+    # Arrange
+    values = make([4, -2, 9, 3], chunk_capacity=2)
+
+    # Act / Assert
+    assert_that(values.sum()).is_equal_to(14)
+    assert_that(values.min()).is_equal_to(-2)
+    assert_that(values.max()).is_equal_to(9)
+
+
+def test_reductions_of_empty_list():
+    # Arrange
+    values = NumericList()
+
+    # Act / Assert
+    assert_that(values.sum()).is_equal_to(0)
+    assert_that(values.min).raises(ValueError).when_called_with()
+    assert_that(values.max).raises(ValueError).when_called_with()
+
+
+def test_map_inplace_keeps_integer_dtype():
+    # Arrange
+    values = make([1, -2, 3], chunk_capacity=2)
+
+    # Act
+    values.map_inplace(np.negative)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([-1, 2, -3])
+    assert_that(values.dtype).is_equal_to(np.dtype(np.int64))
+
+
+def test_map_inplace_promotes_for_float_results():
+    # Arrange
+    values = make([1, 4, 9], chunk_capacity=2)
+
+    # Act
+    values.map_inplace(np.sqrt)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1.0, 2.0, 3.0])
+
+
+def test_to_numpy_returns_view_of_single_chunk():
+    # Arrange
+    values = make([1, 2, 3])
+
+    # Act
+    first = values.to_numpy()
+    second = values.to_numpy()
+
+    # Assert
+    assert_that(first.tolist()).is_equal_to([1, 2, 3])
+    assert_that(np.shares_memory(first, second)).is_true()
+
+
+def test_to_numpy_merges_chunks_once():
+    # Arrange
+    values = make(list(range(10)), chunk_capacity=4)
+
+    # Act
+    first = values.to_numpy()
+    second = values.to_numpy()
+    values.append(10)
+
+    # Assert
+    assert_that(first.tolist()).is_equal_to(list(range(10)))
+    assert_that(np.shares_memory(first, second)).is_true()
+    assert_that(list(values)).is_equal_to(list(range(11)))
+
+
+def test_insert_after_to_numpy_goes_back_to_regular_chunks():
+    # Arrange
+    values = make(list(range(10)), chunk_capacity=4)
+    values.to_numpy()
+
+    # Act
+    values.insert(5, 99)
+    values.insert(1, 98)
+
+    # Assert
+    expected = [0, 98, 1, 2, 3, 4, 99, 5, 6, 7, 8, 9]
+    assert_that(list(values)).is_equal_to(expected)
+    assert_that(values.to_numpy().tolist()).is_equal_to(expected)
+    assert_that(values.pop_front()).is_equal_to(0)
+    assert_that(values.pop_back()).is_equal_to(9)
@@ -0,0 +1,109 @@
+import operator
+from functools import partial
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.parallel import map_segments, reduce_segments
+
+from helpers import make
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_map_keeps_order(list_cls: type, workers: int):
+    # Arrange
+    values = make(list_cls, range(1_001))
+
+    # Act
+    result = values.parallel_map(partial(operator.mul, 3), workers=workers)
+
+    # Assert
+    assert_that(result).is_instance_of(list_cls)
+    assert_that(list(result)).is_equal_to([3 * v for v in range(1_001)])
+    assert_that(list(values)).is_equal_to(list(range(1_001)))
+
+
+def test_parallel_map_of_mixed_values(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2.5, "a", None, (1, 2)])
+
+    # Act
+    result = values.parallel_map(repr, workers=2)
+
+    # Assert
+    assert_that(list(result)).is_equal_to(["1", "2.5", "'a'", "None", "(1, 2)"])
+
+
+def test_parallel_map_keeps_configuration(list_cls: type):
+    # Arrange
+    values = make(list_cls, [3, 1, 2], index_values=True)
+
+    # Act
+    result = values.parallel_map(abs, workers=2)
+
+    # Assert
+    assert_that(result.index_of(2)).is_equal_to(2)
+    assert_that(2 in result).is_true()
+
+
+def test_parallel_map_of_empty_list(list_cls: type):
+    # Arrange
+    values = list_cls()
+
+    # Act
+    result = values.parallel_map(abs)
+
+    # Assert
+    assert_that(len(result)).is_equal_to(0)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_parallel_reduce(list_cls: type, workers: int):
+    # Arrange
+    values = make(list_cls, range(1, 1_001))
+
+    # Act
+    total = values.parallel_reduce(operator.add, 0, workers=workers)
+
+    # Assert
+    assert_that(total).is_equal_to(500_500)
+
+
+def test_parallel_reduce_is_ordered_for_associative_functions(list_cls: type):
+    # Arrange
+    values = make(list_cls, "abcdefghij")
+
+    # Act
+    joined = values.parallel_reduce(operator.add, "", workers=3)
+
+    # Assert
+    assert_that(joined).is_equal_to("abcdefghij")
+
+
+def test_parallel_reduce_of_empty_list(list_cls: type):
+    # Arrange
+    values = list_cls()
+
+    # Act
+    total = values.parallel_reduce(operator.add, 0)
+
+    # Assert
+    assert_that(total).is_equal_to(0)
+
+
+def test_more_workers_than_values():
+    # Arrange
+    values = [1.5, -2.5]
+
+    # Act
+    result = [v for block in map_segments(values, 2, abs, workers=8) for v in block]
+
+    # Assert
+    assert_that(result).is_equal_to([1.5, 2.5])
+
+
+def test_invalid_worker_count():
+    # Act / Assert
+    assert_that(reduce_segments).raises(ValueError).when_called_with(
+        [1], 1, operator.add, 0, 0
+    )
@@ -0,0 +1,133 @@
+import tracemalloc
+
+import pytest
+from assertpy import assert_that
+
+from data_structures.persistent_list import PersistentList
+
+
+def test_constructor_copies_values():
+    # Arrange
+    source = [1, 2, 3]
+
+    # Act
+    values = PersistentList(source)
+    source.append(4)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 3])
+    assert_that(len(values)).is_equal_to(3)
+
+
+def test_append_and_prepend_return_new_versions():
+    # Arrange
+    base = PersistentList([2])
+
+    # Act
+    appended = base.append(3)
+    both = appended.prepend(1)
+
+    # Assert
+    assert_that(list(base)).is_equal_to([2])
+    assert_that(list(appended)).is_equal_to([2, 3])
+    assert_that(list(both)).is_equal_to([1, 2, 3])
+    assert_that(list(reversed(both))).is_equal_to([3, 2, 1])
+
+
+@pytest.mark.parametrize("index", [0, 1, 2, 3, 4, 5])
+def test_insert_at_every_position(index: int):
+    # Arrange
+    base = PersistentList([1, 2]).append(3).append(4).append(5)
+    expected = [1, 2, 3, 4, 5]
+
+    # Act
+    inserted = base.insert(index, 0)
+    expected.insert(index, 0)
+
+    # Assert
+    assert_that(list(inserted)).is_equal_to(expected)
+    assert_that(list(base)).is_equal_to([1, 2, 3, 4, 5])
+    assert_that([inserted.get(i) for i in range(6)]).is_equal_to(expected)
+
+
+def test_insert_out_of_range_raises_index_error():
+    # Act / Assert
+    assert_that(PersistentList([1]).insert).raises(IndexError).when_called_with(2, 0)
+
+
+def test_remove_takes_first_occurrence_from_either_chain():
+    # Arrange
+    base = PersistentList([1, 2]).append(2).append(3).append(3)
+
+    # Act
+    without_two = base.remove(2)
+    without_three = base.remove(3)
+
+    # Assert
+    assert_that(list(without_two)).is_equal_to([1, 2, 3, 3])
+    assert_that(list(without_three)).is_equal_to([1, 2, 2, 3])
+    assert_that(list(base)).is_equal_to([1, 2, 2, 3, 3])
+
+
+def test_remove_missing_value_returns_same_version():
+    # Arrange
+    base = PersistentList([1])
+
+    # Act
+    result = base.remove(5)
+
+    # Assert
+    assert_that(result).is_same_as(base)
+
+
+def test_versions_compare_by_value():
+    # Arrange
+    built = PersistentList().append(1).append(2)
+
+    # Act / Assert
+    assert_that(built).is_equal_to(PersistentList([1, 2]))
+    assert_that(hash(built)).is_equal_to(hash(PersistentList([1, 2])))
+    assert_that(2 in built).is_true()
+    assert_that(built.index_of(2)).is_equal_to(1)
+
+
+def test_get_out_of_range_raises_index_error():
+    # Act / Assert
+    assert_that(PersistentList([1]).get).raises(IndexError).when_called_with(-1)
+
+
+def test_versions_survive_rebalancing():
+    # Arrange
+    versions = [PersistentList[int]()]
+    for i in range(20):
+        versions.append(versions[-1].append(i))
+
+    # Act
+    branch = versions[9].prepend(-1).append(99)
+
+    # Assert
+    assert_that([list(v) for v in versions]).is_equal_to(
+        [list(range(i)) for i in range(21)]
+    )
+    assert_that(list(branch)).is_equal_to([-1] + list(range(9)) + [99])
+    assert_that(branch.get(10)).is_equal_to(99)
+
+
+def test_iteration_of_append_built_list_needs_little_memory():
+    # Arrange
+    values = PersistentList[int]()
+    for i in range(20_000):
+        values = values.append(i)
+
+    # Act
+    tracemalloc.start()
+    try:
+        forward = sum(values)
+        backward = sum(reversed(values))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Assert
+    assert_that(forward).is_equal_to(backward).is_equal_to(sum(range(20_000)))
+    assert_that(peak).is_less_than(20_000)
@@ -0,0 +1,180 @@
+import copy
+import io
+import pickle
+
+import pytest
+from assertpy import assert_that
+
+from data_structures import serialization
+from data_structures.instrumentation import InstrumentedDoubleLinkedList
+
+
+MIXED = [1, 2.5, "x", None, 2 ** 70, True, (1, 2)]
+
+
+def dumped(values) -> io.BytesIO:
+    buffer = io.BytesIO()
+    values.dump(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def test_pickle_long_list_round_trips(list_cls: type):
+    # Arrange
+    values = list_cls()
+    values.extend(range(50_000))
+
+    # Act
+    restored = pickle.loads(pickle.dumps(values))
+
+    # Assert
+    assert_that(restored).is_instance_of(list_cls)
+    assert_that(list(restored)).is_equal_to(list(range(50_000)))
+
+
+def test_pickle_keeps_constructor_options(list_cls: type):
+    # Arrange
+    values = list_cls(node_pool_size=8, index_values=True)
+    values.extend([3, 1, 2])
+
+    # Act
+    restored = pickle.loads(pickle.dumps(values))
+
+    # Assert
+    assert_that(restored.node_pool.max_size).is_equal_to(8)
+    assert_that(2 in restored).is_true()
+    assert_that(restored.remove(1)).is_true()
+    assert_that(list(restored)).is_equal_to([3, 2])
+
+
+def test_deepcopy_copies_values(list_cls: type):
+    # Arrange
+    values = list_cls()
+    values.extend([[1], [2]])
+
+    # Act
+    copied = copy.deepcopy(values)
+    copied.get(0).append(10)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([[1], [2]])
+    assert_that(list(copied)).is_equal_to([[1, 10], [2]])
+
+
+def test_pickle_instrumented_list():
+    # Arrange
+    values = InstrumentedDoubleLinkedList()
+    values.extend([1, 2])
+
+    # Act
+    restored = pickle.loads(pickle.dumps(values))
+    restored.append(3)
+
+    # Assert
+    assert_that(list(restored)).is_equal_to([1, 2, 3])
+    assert_that(restored.operation_counts.per_method).contains_key("append")
+
+
+@pytest.mark.parametrize(
+    "source",
+    [[], list(range(1_000)), [i / 4 for i in range(1_000)], MIXED, [2 ** 63, -(2 ** 63)]],
+    ids=["empty", "ints", "floats", "mixed", "int64_bounds"],
+)
+def test_dump_load_round_trips(list_cls: type, source: list):
+    # Arrange
+    values = list_cls()
+    values.extend(source)
+
+    # Act
+    restored = list_cls.load(dumped(values))
+
+    # Assert
+    assert_that(list(restored)).is_equal_to(source)
+    assert_that([type(v) for v in restored]).is_equal_to([type(v) for v in source])
+
+
+def test_numeric_payload_is_stored_as_raw_array(list_cls: type):
+    # Arrange
+    values = list_cls()
+    values.extend(range(1_000))
+
+    # Act
+    size = len(dumped(values).getvalue())
+
+    # Assert
+    expected = (
+        serialization.HEADER.size + serialization.BLOCK_HEADER.size + 8 * 1_000
+    )
+    assert_that(size).is_equal_to(expected)
+
+
+def test_dump_load_spans_several_blocks(list_cls: type, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(serialization, "BLOCK_SIZE", 3)
+    source = [1, 2, 3, "a", 4.0, 5.0, 6]
+    values = list_cls()
+    values.extend(source)
+
+    # Act
+    restored = list_cls.load(dumped(values), index_values=True)
+
+    # Assert
+    assert_that(list(restored)).is_equal_to(source)
+    assert_that("a" in restored).is_true()
+
+
+def test_load_rejects_foreign_data(list_cls: type):
+    # Arrange
+    buffer = io.BytesIO(b"not a list at all")
+
+    # Act / Assert
+    assert_that(list_cls.load).raises(ValueError).when_called_with(buffer)
+
+
+def test_load_rejects_truncated_file(list_cls: type):
+    # Arrange
+    values = list_cls()
+    values.extend(range(10))
+    buffer = io.BytesIO(dumped(values).getvalue()[:-4])
+
+    # Act / Assert
+    assert_that(list_cls.load).raises(EOFError).when_called_with(buffer)
+
+
+def test_pickled_payload_is_one_pickle_per_block(list_cls: type):
+    # Arrange
+    source = [f"value {i}" for i in range(1_000)]
+    values = list_cls()
+    values.extend(source)
+
+    # Act
+    size = len(dumped(values).getvalue())
+
+    # Assert
+    overhead = (
+        serialization.HEADER.size
+        + serialization.BLOCK_HEADER.size
+        + serialization.PAYLOAD_LENGTH.size
+    )
+    assert_that(size).is_equal_to(
+        overhead + len(pickle.dumps(source, pickle.HIGHEST_PROTOCOL))
+    )
+
+
+def test_load_reads_version_1_files(list_cls: type):
+    # Arrange
+    source = ["a", None, (1, 2)]
+    buffer = io.BytesIO()
+    buffer.write(serialization.HEADER.pack(serialization.MAGIC, 1, len(source)))
+    buffer.write(serialization.BLOCK_HEADER.pack(serialization.PICKLED, len(source)))
+    for value in source:
+        record = pickle.dumps(value)
+        buffer.write(serialization.RECORD_LENGTH.pack(len(record)))
+        buffer.write(record)
+    buffer.seek(0)
+
+    # Act
+    restored = list_cls.load(buffer)
+
+    # Assert
+    assert_that(list(restored)).is_equal_to(source)
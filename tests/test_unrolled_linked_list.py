@@ -0,0 +1,79 @@
+import pytest
+from assertpy import assert_that
+
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+
+@pytest.fixture
+def unrolled() -> UnrolledLinkedList[int]:
+    # a tiny capacity forces chunk splits and merges on every few operations
+    return UnrolledLinkedList[int](chunk_capacity=4)
+
+
+def test_invalid_chunk_capacity_raises_value_error():
+    # Arrange
+
+    # Act / Assert
+    assert_that(UnrolledLinkedList).raises(ValueError).when_called_with(1)
+
+
+def test_append_across_chunks_preserves_order(unrolled: UnrolledLinkedList[int]):
+    # Arrange
+
+    # Act
+    unrolled.extend(iter(range(10)))
+
+    # Assert
+    assert_that(list(unrolled)).is_equal_to(list(range(10)))
+    assert_that(len(unrolled)).is_equal_to(10)
+
+
+def test_get_walks_across_chunks(unrolled: UnrolledLinkedList[int]):
+    # Arrange
+    unrolled.extend(iter(range(10)))
+
+    # Act
+    values = [unrolled.get(i) for i in range(10)]
+
+    # Assert
+    assert_that(values).is_equal_to(list(range(10)))
+
+
+def test_insert_into_full_chunk_splits_it(unrolled: UnrolledLinkedList[int]):
+    # Arrange
+    unrolled.extend(iter(range(8)))
+    expected = list(range(8))
+
+    # Act
+    for index, value in [(2, 100), (0, 101), (5, 102), (11, 103), (6, 104)]:
+        unrolled.insert(index, value)
+        expected.insert(index, value)
+
+    # Assert
+    assert_that(list(unrolled)).is_equal_to(expected)
+    assert_that(unrolled.index_of(104)).is_equal_to(6)
+
+
+def test_mixed_operations_match_builtin_list(unrolled: UnrolledLinkedList[int]):
+    # Arrange
+    expected: list[int] = []
+
+    # Act
+    for i in range(40):
+        unrolled.append(i)
+        expected.append(i)
+        if i % 3 == 0:
+            unrolled.prepend(-i)
+            expected.insert(0, -i)
+        if i % 5 == 0:
+            assert_that(unrolled.pop_front()).is_equal_to(expected.pop(0))
+        if i % 7 == 0:
+            assert_that(unrolled.pop_back()).is_equal_to(expected.pop())
+    for value in range(0, 40, 2):
+        if value in expected:
+            expected.remove(value)
+            assert_that(unrolled.remove(value)).is_true()
+
+    # Assert
+    assert_that(list(unrolled)).is_equal_to(expected)
+    assert_that(len(unrolled)).is_equal_to(len(expected))
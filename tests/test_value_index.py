@@ -0,0 +1,146 @@
+import pytest
+from assertpy import assert_that
+
+from data_structures.double_linked_list import DoubleLinkedList
+
+from helpers import make
+
+
+def test_contains_uses_current_values(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2, 3], index_values=True)
+
+    # Act
+    values.remove(2)
+    values.pop_front()
+
+    # Assert
+    assert_that(2 in values).is_false()
+    assert_that(1 in values).is_false()
+    assert_that(3 in values).is_true()
+
+
+def test_remove_duplicate_takes_first_in_list_order(list_cls: type):
+    # Arrange
+    values = make(list_cls, ["a", "x", "b"], index_values=True)
+    values.prepend("x")
+    values.append("x")
+
+    # Act
+    removed = values.remove("x")
+
+    # Assert
+    assert_that(removed).is_true()
+    assert_that(list(values)).is_equal_to(["a", "x", "b", "x"])
+    assert_that(values.index_of("x")).is_equal_to(1)
+
+
+def test_remove_and_index_of_missing_value(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2], index_values=True)
+
+    # Act
+    removed = values.remove(5)
+    index = values.index_of(5)
+
+    # Assert
+    assert_that(removed).is_false()
+    assert_that(index).is_none()
+    assert_that(list(values)).is_equal_to([1, 2])
+
+
+def test_unhashable_lookup_is_a_miss(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2], index_values=True)
+
+    # Act / Assert
+    assert_that([1] in values).is_false()
+    assert_that(values.remove([1])).is_false()
+
+
+def test_unhashable_value_cannot_be_indexed(list_cls: type):
+    # Arrange
+    values = make(list_cls, [], index_values=True)
+
+    # Act / Assert
+    assert_that(values.append).raises(TypeError).when_called_with([1])
+
+
+def test_relinked_nodes_follow_their_new_list(list_cls: type):
+    # Arrange
+    values = make(list_cls, [1, 2, 3, 4], index_values=True)
+    other = make(list_cls, [5, 6], index_values=True)
+
+    # Act
+    values.concat(other)
+    tail = values.split_at(3)
+
+    # Assert
+    assert_that(list(values)).is_equal_to([1, 2, 3])
+    assert_that(list(tail)).is_equal_to([4, 5, 6])
+    assert_that(5 in values).is_false()
+    assert_that(5 in tail).is_true()
+    assert_that(5 in other).is_false()
+    assert_that(tail.index_of(6)).is_equal_to(2)
+    assert_that(tail.remove(4)).is_true()
+    assert_that(values.remove(4)).is_false()
+
+
+def failing_source():
+    yield 1
+    yield 2
+    raise RuntimeError("source failed")
+
+
+@pytest.mark.parametrize(
+    "source",
+    [failing_source, lambda: [1, 2, [3]]],
+    ids=["raising_iterator", "unhashable_value"],
+)
+def test_failed_extend_leaves_index_untouched(list_cls: type, source):
+    # Arrange
+    values = make(list_cls, [5, 6], index_values=True)
+
+    # Act
+    assert_that(values.extend).raises(Exception).when_called_with(source())
+
+    # Assert
+    assert_that(list(values)).is_equal_to([5, 6])
+    assert_that(1 in values).is_false()
+    assert_that(values.index_of(1)).is_none()
+    assert_that(values.remove(1)).is_false()
+    assert_that(list(values)).is_equal_to([5, 6])
+
+
+@pytest.mark.parametrize(
+    "source",
+    [failing_source, lambda: [1, 2, [3]]],
+    ids=["raising_iterator", "unhashable_value"],
+)
+def test_failed_slice_assignment_leaves_index_untouched(list_cls: type, source):
+    # Arrange
+    values = make(list_cls, [5, 6, 7], index_values=True)
+
+    # Act
+    assert_that(values.__setitem__).raises(Exception).when_called_with(
+        slice(0, 2), source()
+    )
+
+    # Assert
+    assert_that(list(values)).is_equal_to([5, 6, 7])
+    assert_that(2 in values).is_false()
+    assert_that(values.index_of(5)).is_equal_to(0)
+
+
+def test_removing_many_values_from_large_double_linked_list():
+    # Arrange
+    values = make(DoubleLinkedList, range(20_000), index_values=True)
+
+    # Act
+    for value in range(0, 20_000, 2):
+        values.remove(value)
+
+    # Assert
+    assert_that(len(values)).is_equal_to(10_000)
+    assert_that(values.index_of(1)).is_equal_to(0)
+    assert_that(19_999 in values).is_true()